@@ -8,7 +8,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from src.db.base import Base
-from src.models import Room, Player, GameRound  # noqa: F401 - Import models to register them
+from src.models import Room, Player, GameRound, RoomEvent  # noqa: F401 - Import models to register them
 
 config = context.config
 
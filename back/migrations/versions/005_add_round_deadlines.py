@@ -0,0 +1,102 @@
+"""Add ends_at / next_round_at deadline columns to game_rounds
+
+Revision ID: 005_add_round_deadlines
+Revises: 004_add_game_type
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.games.registry import GameRegistry
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_add_round_deadlines"
+down_revision: Union[str, None] = "004_add_game_type"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Fallbacks of get_round_duration / get_between_rounds_delay (src/games/timing.py)
+DEFAULT_ROUND_DURATION_SECONDS = 30
+DEFAULT_BETWEEN_ROUNDS_DELAY_SECONDS = 5
+
+
+def upgrade() -> None:
+    op.add_column(
+        "game_rounds",
+        sa.Column("ends_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "game_rounds",
+        sa.Column("next_round_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Backfill in-flight rounds with each game's timings from games.yaml (the
+    # same settings and defaults the app uses at runtime)
+    registry = GameRegistry()
+    registry.load_config()
+    for game_type in registry.enabled_games:
+        game_settings = registry.get_settings(game_type)
+        _backfill_deadlines(
+            game_type,
+            float(game_settings.get("round_duration_seconds", DEFAULT_ROUND_DURATION_SECONDS)),
+            float(game_settings.get("between_rounds_delay_seconds", DEFAULT_BETWEEN_ROUNDS_DELAY_SECONDS)),
+        )
+    # Rooms of other game types (disabled or removed) get the defaults
+    _backfill_deadlines(None, DEFAULT_ROUND_DURATION_SECONDS, DEFAULT_BETWEEN_ROUNDS_DELAY_SECONDS)
+
+    op.create_index(
+        "ix_game_rounds_active_ends_at",
+        "game_rounds",
+        ["ends_at"],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+    op.create_index(
+        "ix_game_rounds_next_round_at",
+        "game_rounds",
+        ["next_round_at"],
+        postgresql_where=sa.text("next_round_at IS NOT NULL"),
+    )
+
+
+def _backfill_deadlines(
+    game_type: str | None, round_duration: float, between_rounds_delay: float
+) -> None:
+    """Set missing deadlines of in-flight rounds (all remaining rooms if game_type is None)."""
+    room_filter = "rooms.game_type = :game_type" if game_type is not None else "TRUE"
+    room_params = {"game_type": game_type} if game_type is not None else {}
+    op.execute(
+        sa.text(
+            "UPDATE game_rounds "
+            "SET ends_at = game_rounds.started_at + make_interval(secs => :round_duration) "
+            "FROM rooms "
+            "WHERE rooms.id = game_rounds.room_id "
+            f"AND {room_filter} "
+            "AND game_rounds.status = 'ACTIVE' "
+            "AND game_rounds.ends_at IS NULL"
+        ).bindparams(round_duration=round_duration, **room_params)
+    )
+    op.execute(
+        sa.text(
+            "UPDATE game_rounds "
+            "SET next_round_at = game_rounds.finished_at + make_interval(secs => :between_rounds_delay) "
+            "FROM rooms "
+            "WHERE rooms.id = game_rounds.room_id "
+            f"AND {room_filter} "
+            "AND rooms.status = 'PLAYING' "
+            "AND game_rounds.status = 'FINISHED' "
+            "AND game_rounds.round_number = rooms.current_round_number "
+            "AND game_rounds.next_round_at IS NULL"
+        ).bindparams(between_rounds_delay=between_rounds_delay, **room_params)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_game_rounds_next_round_at", table_name="game_rounds")
+    op.drop_index("ix_game_rounds_active_ends_at", table_name="game_rounds")
+    op.drop_column("game_rounds", "next_round_at")
+    op.drop_column("game_rounds", "ends_at")
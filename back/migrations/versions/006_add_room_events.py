@@ -0,0 +1,44 @@
+"""Add room_events outbox table
+
+Revision ID: 006_add_room_events
+Revises: 005_add_round_deadlines
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_room_events"
+down_revision: Union[str, None] = "005_add_round_deadlines"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "room_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("room_code", sa.String(length=6), nullable=False),
+        sa.Column("event", sa.String(length=50), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("exclude_player_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_room_events_created_at", "room_events", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_room_events_created_at", table_name="room_events")
+    op.drop_table("room_events")
@@ -0,0 +1,24 @@
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Send a response model as JSON without FastAPI validating it again.
+
+    Returning a model makes FastAPI validate it against the route's
+    response_model before serializing it, rebuilding every nested player and
+    round. Room responses are built from trusted ORM rows with
+    model_construct, so they are serialized as is. Keep response_model on
+    the route: it still documents the schema.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+        headers=headers,
+    )
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.responses import model_response
 from src.db import get_session
+from src.games.registry import game_registry
+from src.games.timing import get_next_round_at, get_round_ends_at, utc_now
 from src.models import RoomStatus, RoundStatus
 from src.schemas import (
     CreateRoomRequest,
@@ -14,29 +17,50 @@ from src.schemas import (
     GameRoundResponse,
 )
 from src.schemas.websocket import WSEventType
-from src.services import RoomService, connection_manager
+from src.services import RoomService, games_storage
+from src.services.games_storage import cache_room_on_commit, etag_matches, room_state_etag
+from src.services.room_events import add_room_event
 
 router = APIRouter()
 
 
+def _build_player_response(player) -> PlayerResponse:
+    """PlayerResponse from a loaded Player row, without validation."""
+    return PlayerResponse.model_construct(
+        id=player.id,
+        name=player.name,
+        score=player.score,
+        current_guess=player.current_guess,
+        is_host=player.is_host,
+        connected_at=player.connected_at,
+    )
+
+
 def _build_room_response(room, hide_target: bool = True) -> RoomResponse:
-    """Build a RoomResponse from a Room model."""
+    """
+    Build a RoomResponse from a Room model.
+
+    Built with model_construct: the values come from loaded rows, so
+    validating them again would only cost time. Send it with model_response.
+    """
     current_round = None
     for r in room.rounds:
         if r.round_number == room.current_round_number:
             # Hide target number during active round
             target = None if (hide_target and r.status == RoundStatus.ACTIVE) else r.target_number
-            current_round = GameRoundResponse(
+            current_round = GameRoundResponse.model_construct(
                 id=r.id,
                 round_number=r.round_number,
                 target_number=target,
                 status=r.status,
                 started_at=r.started_at,
                 finished_at=r.finished_at,
+                ends_at=get_round_ends_at(room, r),
+                next_round_at=get_next_round_at(room, r),
             )
             break
 
-    return RoomResponse(
+    return RoomResponse.model_construct(
         id=room.id,
         code=room.code,
         status=room.status,
@@ -44,18 +68,23 @@ def _build_room_response(room, hide_target: bool = True) -> RoomResponse:
         current_round_number=room.current_round_number,
         created_at=room.created_at,
         updated_at=room.updated_at,
-        players=[
-            PlayerResponse(
-                id=p.id,
-                name=p.name,
-                score=p.score,
-                current_guess=p.current_guess,
-                is_host=p.is_host,
-                connected_at=p.connected_at,
-            )
-            for p in room.players
-        ],
+        players=[_build_player_response(p) for p in room.players],
         current_round=current_round,
+        server_time=utc_now(),
+    )
+
+
+def _notify_action_committed(room) -> None:
+    """Run the game's post-commit hook (e.g. to schedule round timers)."""
+    game = game_registry.get_game(room.game_type)
+    if game is not None:
+        game.on_action_committed(room)
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
     )
 
 
@@ -74,12 +103,12 @@ async def create_room(
     room, player = await service.create_room(request.player_name)
     await session.commit()
 
-    # Reload room with relationships
-    room = await service.get_room_by_code(room.code)
-
-    return CreateRoomResponse(
-        room=_build_room_response(room),
-        player_id=player.id,
+    return model_response(
+        CreateRoomResponse.model_construct(
+            room=_build_room_response(room),
+            player_id=player.id,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -100,40 +129,46 @@ async def join_room(
         )
 
     room, player = result
-    await session.commit()
 
-    # Reload room with relationships
-    room = await service.get_room_by_code(room.code)
-
-    # Notify other players
-    await connection_manager.broadcast_to_room(
+    # Notify other players (outbox, sent once committed)
+    add_room_event(
+        session,
         room.code,
         WSEventType.PLAYER_JOINED,
-        {"player": PlayerResponse.model_validate(player).model_dump(mode="json")},
+        {"player": _build_player_response(player).model_dump(mode="json")},
     )
+    cache_room_on_commit(session, room)
+    await session.commit()
 
-    return JoinRoomResponse(
-        room=_build_room_response(room),
-        player_id=player.id,
+    return model_response(
+        JoinRoomResponse.model_construct(
+            room=_build_room_response(room),
+            player_id=player.id,
+        )
     )
 
 
 @router.get("/{code}", response_model=RoomResponse)
 async def get_room(
     code: str,
-    session: AsyncSession = Depends(get_session_dep),
+    request: Request,
 ):
-    """Get room state by code."""
-    service = RoomService(session)
-    room = await service.get_room_by_code(code)
+    """Get room state by code (304 if If-None-Match matches its ETag)."""
+    state = await games_storage.load_game(code.upper())
 
-    if room is None:
+    if state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found",
         )
 
-    return _build_room_response(room)
+    etag = room_state_etag(state)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return _not_modified(etag)
+    return model_response(
+        RoomResponse.model_validate({**state, "server_time": utc_now()}),
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.post("/{code}/start", response_model=RoomResponse)
@@ -160,20 +195,21 @@ async def start_game(
             detail="Cannot start game. Check if you are host, game is in waiting state, and there are at least 2 players.",
         )
 
-    await session.commit()
-
-    # Reload room with relationships
-    room = await service.get_room_by_code(code)
+    await session.flush()
     room_response = _build_room_response(room)
 
-    # Notify all players
-    await connection_manager.broadcast_to_room(
+    # Notify all players (outbox, sent once committed)
+    add_room_event(
+        session,
         room.code,
         WSEventType.GAME_STARTED,
         {"room": room_response.model_dump(mode="json")},
     )
+    cache_room_on_commit(session, room)
+    await session.commit()
+    _notify_action_committed(room)
 
-    return room_response
+    return model_response(room_response)
 
 
 @router.post("/{code}/guess", response_model=RoomResponse)
@@ -200,18 +236,17 @@ async def submit_guess(
             detail="Cannot submit guess. Check if game is active and you are a player.",
         )
 
-    await session.commit()
-
-    # Reload room
-    room = await service.get_room_by_code(code)
-
     # Notify other players that someone guessed (without revealing the guess)
-    await connection_manager.broadcast_to_room(
+    add_room_event(
+        session,
         room.code,
         WSEventType.GUESS_SUBMITTED,
         {"player_id": request.player_id},
         exclude_player_id=request.player_id,
     )
+    cache_room_on_commit(session, room)
+    await session.commit()
+    _notify_action_committed(room)
 
-    return _build_room_response(room)
+    return model_response(_build_room_response(room))
 
@@ -2,9 +2,9 @@ import json
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from src.db import get_session
 from src.schemas.websocket import WSEventType
-from src.services import RoomService, connection_manager, games_storage
+from src.services import connection_manager, games_storage
+from src.services.games_storage import build_room_state_payload
 
 router = APIRouter()
 
@@ -19,19 +19,15 @@ async def websocket_endpoint(
     room_code = code.upper()
     
     # Verify room and player exist before accepting connection
-    async for session in get_session():
-        service = RoomService(session)
-        room = await service.get_room_by_code(room_code)
-        
-        if room is None:
-            await websocket.close(code=4004, reason="Room not found")
-            return
-        
-        player = next((p for p in room.players if p.id == player_id), None)
-        if player is None:
-            await websocket.close(code=4004, reason="Player not found in room")
-            return
-        break
+    state = await games_storage.load_game(room_code)
+
+    if state is None:
+        await websocket.close(code=4004, reason="Room not found")
+        return
+
+    if not any(p["id"] == player_id for p in state["players"]):
+        await websocket.close(code=4004, reason="Player not found in room")
+        return
 
     await connection_manager.connect(websocket, room_code, player_id)
 
@@ -74,26 +70,15 @@ async def handle_client_message(room_code: str, player_id: int, message: dict):
         )
     
     elif event == "get_state":
-        # Return current room state from cache or fetch from DB
-        state = games_storage.get_game(room_code)
-        
-        if state is None:
-            # Fetch from DB if not in cache
-            async for session in get_session():
-                service = RoomService(session)
-                room = await service.get_room_by_code(room_code)
-                if room:
-                    from src.services.games_storage import _build_room_dict
-                    state = _build_room_dict(room)
-                    games_storage.set_game(room_code, state)
-                break
+        # Return current room state from the snapshot cache (or DB on a miss)
+        state = await games_storage.load_game(room_code)
         
         if state:
             await connection_manager.send_to_player(
                 room_code,
                 player_id,
                 "room_state",
-                {"room": state},
+                build_room_state_payload(state),
             )
         else:
             await connection_manager.send_to_player(
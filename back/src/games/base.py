@@ -1,6 +1,7 @@
 """Base classes for game implementations."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from enum import Enum
 from typing import Any, TYPE_CHECKING
 
@@ -44,8 +45,17 @@ class BaseGame(ABC):
     2. Provide display_name for UI
     3. Implement game-specific action handling
     4. Implement round creation and finishing logic
+
+    Games with timed rounds set `has_deadlines` and implement get_deadline()
+    and on_deadline(); the shared GameTimerJob (src/games/timer.py) then
+    calls on_deadline() when a room's deadline comes up.
     """
 
+    # Whether rooms of this game have deadlines for the shared timer job.
+    # Rounds must keep game_rounds.ends_at / next_round_at up to date, the
+    # job resyncs its queue from those columns.
+    has_deadlines: bool = False
+
     @property
     @abstractmethod
     def game_type(self) -> str:
@@ -156,6 +166,58 @@ class BaseGame(ABC):
         """
         pass
 
+    def get_deadline(
+        self,
+        room: "Room",
+        now: datetime | None = None,
+    ) -> datetime | None:
+        """
+        When the timer job next needs to act on the room, or None.
+
+        Called with the room's players and only its current round loaded.
+        A deadline at or before `now` means the room is due.
+        """
+        return None
+
+    async def on_deadline(
+        self,
+        room: "Room",
+        session: AsyncSession,
+    ) -> None:
+        """
+        Called by the timer job when the room's deadline has passed.
+
+        Runs in the room's own transaction with the room row locked (players
+        and current round loaded). Advance the game here, e.g. finish the
+        round or start the next one, and queue events with add_room_event.
+        """
+        pass
+
+    def on_action_committed(self, room: "Room") -> None:
+        """
+        Called after an action's changes have been committed.
+
+        By default queues the room's new deadline with the timer job, so
+        early transitions (e.g. everyone has answered) happen right away.
+        """
+        if not self.has_deadlines:
+            return
+        from src.games.timer import room_deadlines
+
+        deadline = self.get_deadline(room)
+        if deadline is not None:
+            room_deadlines.schedule(room.code, deadline)
+
+    def get_batched_guess(self, action: GameAction) -> int | None:
+        """
+        The guess carried by `action` if it may be written by the guess
+        batcher (settings.guess_batching_enabled), else None.
+
+        Batched guesses are only stored in players.current_guess; the round
+        then advances through get_deadline() / on_deadline().
+        """
+        return None
+
     def can_start_game(self, room: "Room") -> tuple[bool, str | None]:
         """
         Check if the game can be started.
@@ -0,0 +1,215 @@
+"""Group commit for guesses - writes the guesses of many rooms in one transaction."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.config import settings
+from src.db import async_session_maker
+from src.games.registry import game_registry
+from src.games.timing import utc_now
+from src.models import Player, Room, RoomStatus, RoundStatus
+from src.schemas.websocket import WSEventType
+from src.services.games_storage import _build_room_dict, cache_room_on_commit
+from src.services.room_events import add_room_event
+from src.services.room_service import lock_rooms_with_current_round
+
+logger = logging.getLogger(__name__)
+
+# Tells the batcher loop to write what is queued and exit
+_STOP = object()
+
+
+@dataclass
+class BatchedGuessResult:
+    """
+    Outcome of a batched guess.
+
+    `room` is the room as committed by the batch (None if it doesn't exist).
+    A guess that was not accepted has a `message` for the client, or none if
+    the room, game type or player didn't match (the caller reports those).
+    """
+
+    room: Room | None
+    accepted: bool = False
+    message: str | None = None
+    round_finished: bool = False
+
+
+@dataclass
+class _PendingGuess:
+    room_code: str
+    game_type: str
+    player_id: int
+    guess: int
+    future: asyncio.Future = field(repr=False)
+
+
+class GuessBatcher:
+    """
+    Collects guesses from all rooms for `guess_batch_window_ms` and writes
+    them in one transaction (group commit):
+
+    - locks and loads every room of the batch once, in id order, so batches
+      can't deadlock with each other, the timer or single actions
+    - checks each guess against its room (playing, active round, player)
+    - sets the accepted guesses with one multi-row UPDATE
+    - queues a guess_submitted event per guess and, for rooms where the
+      guesses made the game's deadline due (everyone has answered), fires
+      the deadline in the same transaction, as the timer would
+    - commits once, then answers every waiting request
+
+    If the batch fails to commit, every guess in it fails. A later guess of
+    the same player in a batch replaces the earlier one.
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def submit(
+        self, room_code: str, game_type: str, player_id: int, guess: int
+    ) -> BatchedGuessResult:
+        """Queue a guess and wait until its batch is committed."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingGuess(room_code, game_type, player_id, guess, future))
+        return await future
+
+    async def stop(self):
+        """Write the queued guesses, then stop."""
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        window = settings.guess_batch_window_ms / 1000
+        max_batch = settings.guess_batch_max_size
+        while True:
+            pending = await self._queue.get()
+            if pending is _STOP:
+                return
+
+            if self._queue.qsize() < max_batch - 1:
+                # Give guesses from other requests a moment to join the batch
+                await asyncio.sleep(window)
+
+            batch = [pending]
+            stop = False
+            while len(batch) < max_batch and not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is _STOP:
+                    stop = True
+                    break
+                batch.append(pending)
+
+            await self._flush([p for p in batch if not p.future.cancelled()])
+            if stop:
+                return
+
+    async def _flush(self, batch: list[_PendingGuess]):
+        """Write a batch in one transaction, then answer its requests."""
+        if not batch:
+            return
+        async with async_session_maker() as session:
+            try:
+                results = await self._write(session, batch)
+                await session.commit()
+            except Exception as e:
+                logger.exception(f"Failed to write a batch of {len(batch)} guesses: {e}")
+                await session.rollback()
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                return
+
+        for room in {id(r.room): r.room for r in results if r.accepted}.values():
+            game_registry.get_game(room.game_type).on_action_committed(room)
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+    async def _write(
+        self, session: AsyncSession, batch: list[_PendingGuess]
+    ) -> list[BatchedGuessResult]:
+        locked = await lock_rooms_with_current_round(
+            session, Room.code.in_({p.room_code for p in batch})
+        )
+        rooms = {room.code: room for room in locked}
+
+        results = [self._check(rooms.get(p.room_code), p) for p in batch]
+        accepted: dict[int, tuple[Player, int]] = {}
+        for pending, guess_result in zip(batch, results):
+            if guess_result.accepted:
+                player = next(p for p in guess_result.room.players if p.id == pending.player_id)
+                accepted[pending.player_id] = (player, pending.guess)
+        if not accepted:
+            return results
+
+        guesses = values(
+            column("player_id", Integer), column("guess", Integer), name="guesses"
+        ).data([(player_id, guess) for player_id, (_, guess) in accepted.items()])
+        await session.execute(
+            update(Player)
+            .where(Player.id == guesses.c.player_id)
+            .values(current_guess=guesses.c.guess),
+            execution_options={"synchronize_session": False},
+        )
+        for player, guess in accepted.values():
+            set_committed_value(player, "current_guess", guess)
+
+        now = utc_now()
+        for room in {id(r.room): r.room for r in results if r.accepted}.values():
+            room_state = _build_room_dict(room)
+            for pending, guess_result in zip(batch, results):
+                if guess_result.accepted and guess_result.room is room:
+                    add_room_event(
+                        session,
+                        room.code,
+                        WSEventType.GUESS_SUBMITTED,
+                        {"player_id": pending.player_id, "room": room_state},
+                        exclude_player_id=pending.player_id,
+                    )
+
+            game = game_registry.get_game(room.game_type)
+            deadline = game.get_deadline(room, now) if game.has_deadlines else None
+            if deadline is not None and deadline <= now:
+                await game.on_deadline(room, session)
+                for guess_result in results:
+                    if guess_result.accepted and guess_result.room is room:
+                        guess_result.round_finished = True
+            cache_room_on_commit(session, room)
+
+        return results
+
+    @staticmethod
+    def _check(room: Room | None, pending: _PendingGuess) -> BatchedGuessResult:
+        """Whether a guess can be applied to its (locked) room."""
+        if (
+            room is None
+            or room.game_type != pending.game_type
+            or not any(p.id == pending.player_id for p in room.players)
+        ):
+            return BatchedGuessResult(room=room)
+
+        if room.status != RoomStatus.PLAYING:
+            return BatchedGuessResult(room=room, message="Game is not in progress")
+
+        current_round = next(
+            (r for r in room.rounds if r.round_number == room.current_round_number), None
+        )
+        if current_round is None or current_round.status != RoundStatus.ACTIVE:
+            return BatchedGuessResult(room=room, message="No active round")
+
+        return BatchedGuessResult(room=room, accepted=True, message="Guess submitted")
+
+
+# Global instance
+guess_batcher = GuessBatcher()
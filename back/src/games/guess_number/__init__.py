@@ -1,6 +1,4 @@
 from src.games.guess_number.game import GuessNumberGame
 from src.games.guess_number.schemas import GuessNumberAction, ActionType
-from src.games.guess_number.jobs import GuessNumberTimerJob
-
-__all__ = ["GuessNumberGame", "GuessNumberAction", "ActionType", "GuessNumberTimerJob"]
 
+__all__ = ["GuessNumberGame", "GuessNumberAction", "ActionType"]
@@ -1,14 +1,42 @@
 """Guess the Number game implementation."""
 
+import logging
 import random
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.games.base import BaseGame, GameAction, ActionResult, RoundResult
 from src.games.guess_number.schemas import GuessNumberAction, ActionType
+from src.games.registry import game_registry
+from src.games.timing import (
+    get_next_round_at,
+    get_round_duration,
+    get_round_ends_at,
+    utc_now,
+)
 from src.models import Room, GameRound, RoomStatus, RoundStatus
+from src.schemas.websocket import WSEventType
+from src.services.room_events import add_room_event
+from src.services.room_service import RoomService
+
+logger = logging.getLogger(__name__)
+
+
+def all_players_voted(room: Room) -> bool:
+    """Check if all players in the room have submitted their guess."""
+    if not room.players:
+        return False
+    return all(player.current_guess is not None for player in room.players)
+
+
+def get_current_round(room: Room) -> GameRound | None:
+    """Get the round matching the room's current_round_number."""
+    for r in room.rounds:
+        if r.round_number == room.current_round_number:
+            return r
+    return None
 
 
 class GuessNumberGame(BaseGame):
@@ -18,8 +46,14 @@ class GuessNumberGame(BaseGame):
     Players guess a randomly generated number (1-100).
     The player with the closest guess wins the round.
     Points are awarded based on ranking.
+
+    Rounds are timed: the shared timer job finishes a round when its time
+    is up (or everyone has guessed), then starts the next round after the
+    between-rounds delay, and finishes the game after `total_rounds`.
     """
 
+    has_deadlines = True
+
     @property
     def game_type(self) -> str:
         return "guess_number"
@@ -67,11 +101,14 @@ class GuessNumberGame(BaseGame):
         max_target = settings.get("max_target", 100)
 
         target = random.randint(min_target, max_target)
+        started_at = utc_now()
 
         game_round = GameRound(
             round_number=room.current_round_number,
             target_number=target,
             status=RoundStatus.ACTIVE,
+            started_at=started_at,
+            ends_at=started_at + get_round_duration(room),
         )
         room.rounds.append(game_round)
         await session.flush()
@@ -162,6 +199,25 @@ class GuessNumberGame(BaseGame):
         # Submit the guess
         player.current_guess = guess
 
+        # Last guess in: finish the round now instead of waiting for the timer.
+        # finish_round only finishes a still-active round, so racing the timer
+        # job cannot score it twice.
+        if all(p.current_guess is not None for p in room.players):
+            round_result = await self.finish_round(room, session)
+            if current_round.status == RoundStatus.FINISHED:
+                next_round_at = get_next_round_at(room, current_round)
+                return ActionResult(
+                    success=True,
+                    message="Guess submitted",
+                    data={"guess": guess, "round_finished": True},
+                    broadcast_event="round_finished",
+                    broadcast_data={
+                        **round_result.model_dump(),
+                        "next_round_at": next_round_at.isoformat() if next_round_at else None,
+                        "server_time": utc_now().isoformat(),
+                    },
+                )
+
         return ActionResult(
             success=True,
             message="Guess submitted",
@@ -170,6 +226,108 @@ class GuessNumberGame(BaseGame):
             broadcast_data={"player_id": player_id},
         )
 
+    def get_batched_guess(self, action: GameAction) -> int | None:
+        """submit_guess only sets the player's guess, so it can be batched."""
+        if isinstance(action, GuessNumberAction) and action.action == ActionType.SUBMIT_GUESS:
+            return action.guess
+        return None
+
+    def get_deadline(self, room: Room, now: datetime | None = None) -> datetime | None:
+        """
+        When the timer next needs to act on a room.
+
+        - Active round: its end time, or now if every player has already guessed
+        - Finished round: when the next round starts (or the game ends)
+        - Otherwise None (room not playing, nothing to do)
+        """
+        if room.status != RoomStatus.PLAYING:
+            return None
+
+        current_round = get_current_round(room)
+        if current_round is None:
+            return None
+        if current_round.status == RoundStatus.ACTIVE:
+            if all_players_voted(room):
+                return now or utc_now()
+            return get_round_ends_at(room, current_round)
+        return get_next_round_at(room, current_round)
+
+    async def on_deadline(self, room: Room, session: AsyncSession) -> None:
+        """Finish the active round, or start the next round / finish the game."""
+        if get_current_round(room).status == RoundStatus.ACTIVE:
+            await self._finish_round_on_deadline(room, session)
+        else:
+            await self._start_next_round_or_finish(room, session)
+
+    async def _finish_round_on_deadline(self, room: Room, session: AsyncSession):
+        """Finish the current round and queue its results (don't start next round yet)."""
+        game_round = get_current_round(room)
+        time_expired = utc_now() >= get_round_ends_at(room, game_round)
+        reason = "time expired" if time_expired else "all players voted"
+        logger.info(
+            f"Finishing round {game_round.round_number} in room {room.code} ({reason})"
+        )
+
+        results = await RoomService(session).finish_round(room)
+        if results is None:
+            # Finished concurrently (e.g. by the last guess)
+            return
+
+        next_round_at = get_next_round_at(room, game_round)
+        add_room_event(
+            session,
+            room.code,
+            WSEventType.ROUND_FINISHED,
+            {
+                "round_number": game_round.round_number,
+                "target_number": game_round.target_number,
+                "results": results,
+                "next_round_at": next_round_at.isoformat() if next_round_at else None,
+                "server_time": utc_now().isoformat(),
+            },
+        )
+
+    async def _start_next_round_or_finish(self, room: Room, session: AsyncSession):
+        """Start the next round, or finish the game if all rounds are complete."""
+        service = RoomService(session)
+        game_settings = game_registry.get_settings(room.game_type)
+        total_rounds = game_settings.get("total_rounds", 3)
+
+        if room.current_round_number >= total_rounds:
+            await service.finish_game(room)
+
+            # Build final standings
+            standings = sorted(
+                [
+                    {"player_id": p.id, "name": p.name, "score": p.score}
+                    for p in room.players
+                ],
+                key=lambda x: x["score"],
+                reverse=True,
+            )
+            add_room_event(
+                session,
+                room.code,
+                WSEventType.GAME_FINISHED,
+                {"standings": standings},
+            )
+            logger.info(f"Game finished in room {room.code}")
+            return
+
+        next_round = await service.start_next_round(room)
+        add_room_event(
+            session,
+            room.code,
+            WSEventType.ROUND_STARTED,
+            {
+                "round_number": next_round.round_number,
+                "started_at": next_round.started_at.isoformat(),
+                "ends_at": get_round_ends_at(room, next_round).isoformat(),
+                "server_time": utc_now().isoformat(),
+            },
+        )
+        logger.info(f"Started round {next_round.round_number} in room {room.code}")
+
     def _get_current_round(self, room: Room) -> GameRound | None:
         """Get the current active round for the room."""
         for r in room.rounds:
@@ -187,44 +345,11 @@ class GuessNumberGame(BaseGame):
         if current_round is None:
             return RoundResult(round_number=0, results=[])
 
-        current_round.status = RoundStatus.FINISHED
-        current_round.finished_at = datetime.now(timezone.utc)
-
-        target = current_round.target_number
-        results = []
-
-        # Calculate distances and sort by closest
-        player_distances = []
-        for player in room.players:
-            if player.current_guess is not None:
-                distance = abs(player.current_guess - target)
-                player_distances.append((player, distance))
-            else:
-                player_distances.append((player, None))
-
-        # Sort by distance (None = didn't guess = worst)
-        player_distances.sort(key=lambda x: (x[1] is None, x[1] if x[1] is not None else 0))
-
-        # Award points: 1st place = 10, 2nd = 5, 3rd = 3, rest = 1 (if guessed)
-        points_table = [10, 5, 3]
-        for i, (player, distance) in enumerate(player_distances):
-            if distance is not None:
-                points = points_table[i] if i < len(points_table) else 1
-                player.score += points
-            else:
-                points = 0
-
-            results.append({
-                "player_id": player.id,
-                "player_name": player.name,
-                "guess": player.current_guess,
-                "distance": distance,
-                "points_earned": points,
-            })
+        results = await RoomService(session).finish_round(room) or []
 
         return RoundResult(
             round_number=current_round.round_number,
-            target_number=target,
+            target_number=current_round.target_number,
             results=results,
         )
 
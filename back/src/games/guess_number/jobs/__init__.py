@@ -1,4 +0,0 @@
-from src.games.guess_number.jobs.timer import GuessNumberTimerJob
-
-__all__ = ["GuessNumberTimerJob"]
-
@@ -1,5 +1,7 @@
 """Game registry for managing available games."""
 
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -66,6 +68,8 @@ class GameRegistry:
         self._config: GamesConfig | None = None
         self._config_path: Path | None = None
         self._initialized: bool = False
+        # extra fields -> (encoded games info, ETag), see get_info_response
+        self._info_responses: dict[tuple, tuple[bytes, str]] = {}
 
     @property
     def is_initialized(self) -> bool:
@@ -96,6 +100,7 @@ class GameRegistry:
             raw_config = yaml.safe_load(f)
 
         self._config = GamesConfig.model_validate(raw_config)
+        self._info_responses.clear()
         logger.info(
             f"Loaded games config: {len(self.enabled_games)} enabled, "
             f"default: {self.default_game_type}"
@@ -115,6 +120,7 @@ class GameRegistry:
             raise ValueError(f"Game '{game.game_type}' is already registered")
 
         self._games[game.game_type] = game
+        self._info_responses.clear()
         logger.info(f"Registered game: {game.game_type} ({game.display_name})")
 
     def get_game(self, game_type: str) -> BaseGame | None:
@@ -177,6 +183,8 @@ class GameRegistry:
                     f"Game '{game_type}' is enabled in config but has no implementation"
                 )
         self._initialized = True
+        # Build the games info now rather than on the first request
+        self.get_info_response()
 
     def get_all_games_info(self) -> list[dict[str, Any]]:
         """Get info about all enabled games for API responses."""
@@ -194,6 +202,29 @@ class GameRegistry:
                 })
         return result
 
+    def get_info_response(self, **extra: Any) -> tuple[bytes, str]:
+        """
+        Encoded JSON body and ETag of the games info responses: `extra`
+        fields, then enabled games and default game.
+
+        Built once per set of extra fields and reused until the configuration
+        is reloaded or a game is registered.
+        """
+        key = tuple(extra.items())
+        cached = self._info_responses.get(key)
+        if cached is None:
+            body = json.dumps(
+                {
+                    **extra,
+                    "games": self.get_all_games_info(),
+                    "default_game": self.default_game_type or "",
+                },
+                separators=(",", ":"),
+            ).encode()
+            cached = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+            self._info_responses[key] = cached
+        return cached
+
 
 # Global registry instance
 game_registry = GameRegistry()
@@ -2,20 +2,52 @@
 
 import json
 import logging
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.responses import model_response
+from src.config import settings
 from src.db import get_session
-from src.games.base import GameAction
+from src.games.base import BaseGame, GameAction
+from src.games.guess_batcher import guess_batcher
 from src.games.registry import game_registry
-from src.models import Room, RoomStatus, RoundStatus
+from src.games.timing import get_next_round_at, get_round_ends_at, utc_now
+from src.models import Player, Room, RoomStatus, RoundStatus
 from src.schemas import PlayerResponse, GameRoundResponse
 from src.schemas.websocket import WSEventType
 from src.services import connection_manager, games_storage
-from src.services.games_storage import _build_room_dict
+from src.services.games_storage import (
+    build_room_state_payload,
+    cache_room_on_commit,
+    etag_matches,
+    room_state_etag,
+)
+from src.services.idempotency import (
+    IdempotencyKeyReused,
+    IdempotentRequest,
+    idempotency_store,
+)
+from src.services.room_actors import room_actors
+from src.services.room_events import add_room_event
+from src.services.room_service import (
+    lock_rooms_with_current_round,
+    select_room_with_current_round,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +74,7 @@ class GameRoomResponse(BaseModel):
     updated_at: Any
     players: list[PlayerResponse] = []
     current_round: GameRoundResponse | None = None
+    server_time: datetime | None = None  # Server clock, for client-side countdowns
 
     model_config = {"from_attributes": True}
 
@@ -70,6 +103,31 @@ class ActionResponse(BaseModel):
     room: GameRoomResponse | None = None
 
 
+class BatchActionItem(BaseModel):
+    """One action of a batch; `action` is validated by the game's action_schema."""
+
+    player_id: int
+    action: dict[str, Any]
+
+
+class BatchActionsRequest(BaseModel):
+    actions: list[BatchActionItem] = Field(
+        ..., min_length=1, max_length=settings.action_batch_max_size
+    )
+
+
+class BatchActionResult(BaseModel):
+    player_id: int
+    success: bool
+    message: str | None = None
+    data: dict[str, Any] | None = None
+
+
+class BatchActionsResponse(BaseModel):
+    results: list[BatchActionResult]
+    room: GameRoomResponse
+
+
 class GameInfoResponse(BaseModel):
     """Information about available games."""
 
@@ -77,23 +135,42 @@ class GameInfoResponse(BaseModel):
     default_game: str
 
 
+def _build_player_response(player: Player) -> PlayerResponse:
+    """PlayerResponse from a loaded Player row, without validation."""
+    return PlayerResponse.model_construct(
+        id=player.id,
+        name=player.name,
+        score=player.score,
+        current_guess=player.current_guess,
+        is_host=player.is_host,
+        connected_at=player.connected_at,
+    )
+
+
 def _build_game_room_response(room: Room, hide_target: bool = True) -> GameRoomResponse:
-    """Build a GameRoomResponse from a Room model."""
+    """
+    Build a GameRoomResponse from a Room model.
+
+    Built with model_construct: the values come from loaded rows, so
+    validating them again would only cost time. Send it with model_response.
+    """
     current_round = None
     for r in room.rounds:
         if r.round_number == room.current_round_number:
             target = None if (hide_target and r.status == RoundStatus.ACTIVE) else r.target_number
-            current_round = GameRoundResponse(
+            current_round = GameRoundResponse.model_construct(
                 id=r.id,
                 round_number=r.round_number,
                 target_number=target,
                 status=r.status,
                 started_at=r.started_at,
                 finished_at=r.finished_at,
+                ends_at=get_round_ends_at(room, r),
+                next_round_at=get_next_round_at(room, r),
             )
             break
 
-    return GameRoomResponse(
+    return GameRoomResponse.model_construct(
         id=room.id,
         code=room.code,
         game_type=room.game_type,
@@ -102,18 +179,263 @@ def _build_game_room_response(room: Room, hide_target: bool = True) -> GameRoomR
         current_round_number=room.current_round_number,
         created_at=room.created_at,
         updated_at=room.updated_at,
-        players=[
-            PlayerResponse(
-                id=p.id,
-                name=p.name,
-                score=p.score,
-                current_guess=p.current_guess,
-                is_host=p.is_host,
-                connected_at=p.connected_at,
-            )
-            for p in room.players
-        ],
+        players=[_build_player_response(p) for p in room.players],
         current_round=current_round,
+        server_time=utc_now(),
+    )
+
+
+def _room_access_error(
+    room: Room | None, game_type: str, player_id: int | None = None
+) -> HTTPException | None:
+    """Why a request can't use this room (404/400/403), or None if it can."""
+    if room is None:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Room not found",
+        )
+
+    if room.game_type != game_type:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Room is for game '{room.game_type}', not '{game_type}'",
+        )
+
+    # Verify player is in room
+    if player_id is not None and not any(p.id == player_id for p in room.players):
+        return HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Player not found in room",
+        )
+    return None
+
+
+async def _join_room_in_actor(
+    game: BaseGame, game_type: str, room: Room | None, player_name: str, session: AsyncSession
+) -> JoinRoomResponse | HTTPException:
+    """Add a player inside the room's actor (settings.room_actors_enabled)."""
+    error = _room_access_error(room, game_type)
+    if error is not None:
+        return error
+    if room.status != RoomStatus.WAITING:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Game has already started",
+        )
+
+    player = Player(name=player_name, is_host=False)
+    room.players.append(player)
+    await session.flush()  # Assigns the player id
+
+    # Notify other players once the actor commits
+    add_room_event(
+        session,
+        room.code,
+        WSEventType.PLAYER_JOINED,
+        {"player": _build_player_response(player).model_dump(mode="json")},
+    )
+    await game.on_player_join(room, player.id, session)
+    cache_room_on_commit(session, room)
+
+    return JoinRoomResponse.model_construct(
+        room=_build_game_room_response(room),
+        player_id=player.id,
+    )
+
+
+async def _execute_action_in_actor(
+    game: BaseGame,
+    game_type: str,
+    room: Room | None,
+    player_id: int,
+    action: GameAction,
+    idempotent: IdempotentRequest | None,
+    session: AsyncSession,
+) -> ActionResponse | JSONResponse | HTTPException:
+    """
+    Apply an action inside the room's actor (settings.room_actors_enabled).
+
+    Works on the room the actor loaded for its batch; the actor commits the
+    changes and the queued event together with the rest of the batch.
+    Expected errors are returned, not raised, so they are sent to the client
+    as is and don't fail the handler.
+    """
+    error = _room_access_error(room, game_type, player_id)
+    if error is not None:
+        return error
+    if idempotent is not None:
+        replay = await _claim_idempotency_key(session, idempotent)
+        if replay is not None:
+            return replay
+
+    action_result = await game.execute_action(room, player_id, action, session)
+    room_response = _build_game_room_response(room)
+
+    if action_result.broadcast_event:
+        broadcast_data = action_result.broadcast_data or {}
+        broadcast_data["room"] = room_response.model_dump(mode="json")
+        add_room_event(
+            session,
+            room.code,
+            action_result.broadcast_event,
+            broadcast_data,
+            exclude_player_id=player_id if action_result.broadcast_event == "guess_submitted" else None,
+        )
+
+    response = ActionResponse.model_construct(
+        success=action_result.success,
+        message=action_result.message,
+        data=action_result.data,
+        room=room_response,
+    )
+    if idempotent is not None:
+        await idempotency_store.record(session, idempotent, response.model_dump(mode="json"))
+
+    cache_room_on_commit(session, room)
+    # Deadlines fire through this same actor, so they can't overtake the commit
+    game.on_action_committed(room)
+
+    return response
+
+
+def _batch_access_error(
+    room: Room | None, game_type: str, player_ids: list[int]
+) -> HTTPException | None:
+    """Why a batch can't use this room, or None if every player is in it."""
+    for player_id in [None, *dict.fromkeys(player_ids)]:
+        error = _room_access_error(room, game_type, player_id)
+        if error is not None:
+            return error
+    return None
+
+
+async def _execute_actions(
+    game: BaseGame,
+    room: Room,
+    actions: list[tuple[int, GameAction]],
+    session: AsyncSession,
+) -> BatchActionsResponse:
+    """
+    Apply actions to a locked room in order, in the caller's transaction.
+
+    An action that fails (success=False) doesn't stop the ones after it.
+    Only one event is queued: that of the last action with a broadcast,
+    carrying the room as the whole batch left it.
+    """
+    results = []
+    broadcast = None
+    for player_id, action in actions:
+        action_result = await game.execute_action(room, player_id, action, session)
+        results.append(
+            BatchActionResult.model_construct(
+                player_id=player_id,
+                success=action_result.success,
+                message=action_result.message,
+                data=action_result.data,
+            )
+        )
+        if action_result.broadcast_event:
+            broadcast = action_result
+
+    await session.flush()
+    room_response = _build_game_room_response(room)
+
+    if broadcast is not None:
+        broadcast_data = broadcast.broadcast_data or {}
+        broadcast_data["room"] = room_response.model_dump(mode="json")
+        add_room_event(session, room.code, broadcast.broadcast_event, broadcast_data)
+
+    cache_room_on_commit(session, room)
+    return BatchActionsResponse.model_construct(results=results, room=room_response)
+
+
+async def _execute_actions_in_actor(
+    game: BaseGame,
+    game_type: str,
+    room: Room | None,
+    actions: list[tuple[int, GameAction]],
+    session: AsyncSession,
+) -> BatchActionsResponse | HTTPException:
+    """Apply a batch of actions inside the room's actor (settings.room_actors_enabled)."""
+    error = _batch_access_error(room, game_type, [player_id for player_id, _ in actions])
+    if error is not None:
+        return error
+
+    response = await _execute_actions(game, room, actions, session)
+    game.on_action_committed(room)
+    return response
+
+
+async def _submit_guess_batched(
+    game_type: str, room_code: str, player_id: int, guess: int
+) -> ActionResponse:
+    """Submit a guess through the guess batcher (settings.guess_batching_enabled)."""
+    result = await guess_batcher.submit(room_code, game_type, player_id, guess)
+
+    error = _room_access_error(result.room, game_type, player_id)
+    if error is not None:
+        raise error
+
+    data = None
+    if result.accepted:
+        data = {"guess": guess}
+        if result.round_finished:
+            data["round_finished"] = True
+    return ActionResponse.model_construct(
+        success=result.accepted,
+        message=result.message,
+        data=data,
+        room=_build_game_room_response(result.room),
+    )
+
+
+def _replay(response: dict[str, Any]) -> JSONResponse:
+    """The stored response of an action, sent again for a retried request."""
+    return JSONResponse(content=response, headers={"Idempotent-Replayed": "true"})
+
+
+def _idempotency_key_reused() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Idempotency-Key was already used for a different request",
+    )
+
+
+async def _claim_idempotency_key(
+    session: AsyncSession, idempotent: IdempotentRequest
+) -> JSONResponse | HTTPException | None:
+    """
+    Reserve the request's Idempotency-Key in the session's transaction.
+
+    Returns the response to replay if the key was already used, an error if
+    it was used for a different request, or None to go ahead with the action.
+    """
+    try:
+        stored = await idempotency_store.claim(session, idempotent)
+    except IdempotencyKeyReused:
+        return _idempotency_key_reused()
+    return _replay(stored) if stored is not None else None
+
+
+def games_info_response(request: Request, **extra: Any) -> Response:
+    """
+    The precomputed games info (GameRegistry.get_info_response) as is, or
+    304 if the client's If-None-Match matches it.
+    """
+    body, etag = game_registry.get_info_response(**extra)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.games_info_max_age}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
     )
 
 
@@ -132,17 +454,15 @@ def create_games_router() -> APIRouter:
     - POST /api/games/{game}/rooms/{code}/join - Join room
     - GET /api/games/{game}/rooms/{code} - Get room state
     - POST /api/games/{game}/rooms/{code}/actions - Execute action
+    - POST /api/games/{game}/rooms/{code}/actions/batch - Execute several actions
     - WS /api/games/{game}/rooms/{code}/ws - WebSocket
     """
     router = APIRouter()
 
     @router.get("", response_model=GameInfoResponse)
-    async def list_games():
-        """List all available games and their info."""
-        return GameInfoResponse(
-            games=game_registry.get_all_games_info(),
-            default_game=game_registry.default_game_type or "",
-        )
+    async def list_games(request: Request):
+        """List all available games and their info (built once, cacheable)."""
+        return games_info_response(request)
 
     @router.post(
         "/{game_type}/rooms",
@@ -163,40 +483,27 @@ def create_games_router() -> APIRouter:
                 detail=f"Game '{game_type}' not found or not enabled",
             )
 
-        # Import here to avoid circular imports
-        from src.models import Player
-
-        # Create room with game type
-        room = Room(game_type=game_type)
-        session.add(room)
-        await session.flush()
-
-        # Create host player
+        # Create room with game type and its host player. The collections are
+        # set up front, so the response is built without loading them.
         player = Player(
-            room_id=room.id,
             name=request.player_name,
             is_host=True,
         )
-        session.add(player)
+        room = Room(game_type=game_type, players=[player], rounds=[])
+        session.add(room)
         await session.flush()
 
         room.host_id = player.id
+        # Server defaults (created_at, updated_at, connected_at) come back
+        # with RETURNING, so the committed objects are complete
         await session.commit()
 
-        # Reload room with relationships
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-
-        result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.id == room.id)
-        )
-        room = result.scalar_one()
-
-        return CreateRoomResponse(
-            room=_build_game_room_response(room),
-            player_id=player.id,
+        return model_response(
+            CreateRoomResponse.model_construct(
+                room=_build_game_room_response(room),
+                player_id=player.id,
+            ),
+            status_code=status.HTTP_201_CREATED,
         )
 
     @router.post("/{game_type}/rooms/{code}/join", response_model=JoinRoomResponse)
@@ -215,29 +522,27 @@ def create_games_router() -> APIRouter:
                 detail=f"Game '{game_type}' not found or not enabled",
             )
 
-        from src.models import Player
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
+        if settings.room_actors_enabled:
+            # Keep the actor's player list current by joining through it
+            response = await room_actors.submit(
+                code.upper(),
+                lambda room, actor_session: _join_room_in_actor(
+                    game, game_type, room, request.player_name, actor_session
+                ),
+            )
+            if isinstance(response, HTTPException):
+                raise response
+            return model_response(response)
 
         # Find room
         result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.code == code.upper())
+            select_room_with_current_round().where(Room.code == code.upper())
         )
-        room = result.scalar_one_or_none()
+        room = result.unique().scalar_one_or_none()
 
-        if room is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found",
-            )
-
-        if room.game_type != game_type:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Room is for game '{room.game_type}', not '{game_type}'",
-            )
+        error = _room_access_error(room, game_type)
+        if error is not None:
+            raise error
 
         if room.status != RoomStatus.WAITING:
             raise HTTPException(
@@ -252,38 +557,40 @@ def create_games_router() -> APIRouter:
         )
         room.players.append(player)
         await session.flush()
-        await session.commit()
 
-        # Reload room
-        result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.id == room.id)
-        )
-        room = result.scalar_one()
-
-        # Notify other players
-        await connection_manager.broadcast_to_room(
+        # Notify other players (outbox, sent once committed)
+        add_room_event(
+            session,
             room.code,
             WSEventType.PLAYER_JOINED,
-            {"player": PlayerResponse.model_validate(player).model_dump(mode="json")},
+            {"player": _build_player_response(player).model_dump(mode="json")},
         )
 
         # Call game's on_player_join hook
         await game.on_player_join(room, player.id, session)
+        cache_room_on_commit(session, room)
+        await session.commit()
 
-        return JoinRoomResponse(
-            room=_build_game_room_response(room),
-            player_id=player.id,
+        return model_response(
+            JoinRoomResponse.model_construct(
+                room=_build_game_room_response(room),
+                player_id=player.id,
+            )
         )
 
     @router.get("/{game_type}/rooms/{code}", response_model=GameRoomResponse)
     async def get_room_state(
         game_type: str,
         code: str,
-        session: AsyncSession = Depends(get_session_dep),
+        request: Request,
     ):
-        """Get the current state of a game room."""
+        """
+        Get the current state of a game room.
+
+        Served from the room snapshot cache (games_storage). Responses carry
+        an ETag of the room state; a request whose If-None-Match still
+        matches gets 304.
+        """
         # Validate game type
         if not game_registry.is_game_enabled(game_type):
             raise HTTPException(
@@ -291,29 +598,25 @@ def create_games_router() -> APIRouter:
                 detail=f"Game '{game_type}' not found or not enabled",
             )
 
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-
-        result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.code == code.upper())
-        )
-        room = result.scalar_one_or_none()
-
-        if room is None:
+        state = await games_storage.load_game(code.upper())
+        if state is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Room not found",
             )
-
-        if room.game_type != game_type:
+        if state["game_type"] != game_type:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Room is for game '{room.game_type}', not '{game_type}'",
+                detail=f"Room is for game '{state['game_type']}', not '{game_type}'",
             )
 
-        return _build_game_room_response(room)
+        etag = room_state_etag(state)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return _not_modified(etag)
+        return model_response(
+            GameRoomResponse.model_validate({**state, "server_time": utc_now()}),
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
 
     @router.post("/{game_type}/rooms/{code}/actions", response_model=ActionResponse)
     async def execute_action(
@@ -321,6 +624,7 @@ def create_games_router() -> APIRouter:
         code: str,
         request: dict[str, Any],  # Accept raw dict, validate with game's schema
         player_id: int,
+        idempotency_key: str | None = Header(default=None, max_length=255),
         session: AsyncSession = Depends(get_session_dep),
     ):
         """
@@ -328,6 +632,10 @@ def create_games_router() -> APIRouter:
         
         The action payload depends on the game type. Each game defines its own
         action schema with available actions and their parameters.
+
+        With an Idempotency-Key header, a retry of the same request (same
+        player, room, key and body) gets the original response back, marked
+        with an Idempotent-Replayed header, without the action running again.
         """
         # Validate game type
         game = game_registry.get_game(game_type)
@@ -346,67 +654,160 @@ def create_games_router() -> APIRouter:
                 detail=e.errors(),
             )
 
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-
-        # Find room
-        result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.code == code.upper())
-        )
-        room = result.scalar_one_or_none()
-
-        if room is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Room not found",
+        idempotent = None
+        if idempotency_key is not None:
+            idempotent = IdempotentRequest.from_request(
+                code.upper(), player_id, idempotency_key, request
             )
-
-        if room.game_type != game_type:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Room is for game '{room.game_type}', not '{game_type}'",
+            try:
+                stored = idempotency_store.get(idempotent)
+            except IdempotencyKeyReused:
+                raise _idempotency_key_reused()
+            if stored is not None:
+                return _replay(stored)
+
+        if settings.room_actors_enabled:
+            response = await room_actors.submit(
+                code.upper(),
+                lambda room, actor_session: _execute_action_in_actor(
+                    game, game_type, room, player_id, action, idempotent, actor_session
+                ),
             )
+            if isinstance(response, HTTPException):
+                raise response
+            if isinstance(response, Response):
+                return response  # Replayed
+            return model_response(response)
+
+        if idempotent is not None:
+            # Before the room is locked: a retry racing the original waits here
+            replay = await _claim_idempotency_key(session, idempotent)
+            if isinstance(replay, HTTPException):
+                raise replay
+            if replay is not None:
+                return replay
+
+        if settings.guess_batching_enabled:
+            guess = game.get_batched_guess(action)
+            if guess is not None:
+                response = await _submit_guess_batched(game_type, code.upper(), player_id, guess)
+                if idempotent is not None:
+                    await idempotency_store.record(
+                        session, idempotent, response.model_dump(mode="json")
+                    )
+                    await session.commit()
+                return model_response(response)
 
-        # Verify player is in room
-        player = next((p for p in room.players if p.id == player_id), None)
-        if player is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Player not found in room",
-            )
+        # Find and lock the room. The timer locks it the same way before it
+        # touches rounds and players, so a last guess arriving at the round's
+        # deadline waits for the timer (or vice versa) instead of deadlocking.
+        rooms = await lock_rooms_with_current_round(session, Room.code == code.upper())
+        room = rooms[0] if rooms else None
+
+        error = _room_access_error(room, game_type, player_id)
+        if error is not None:
+            raise error
 
         # Execute the action
         action_result = await game.execute_action(room, player_id, action, session)
-        await session.commit()
-
-        # Reload room for response
-        result = await session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.id == room.id)
-        )
-        room = result.scalar_one()
+        # The game keeps the loaded room in sync with its writes, and the
+        # flush fetches server-side values (updated_at) with RETURNING, so
+        # the event and the response are built from the room as it is
+        await session.flush()
+        room_response = _build_game_room_response(room)
 
-        # Broadcast if needed
+        # Broadcast if needed (outbox, sent once committed)
         if action_result.broadcast_event:
             broadcast_data = action_result.broadcast_data or {}
             # Add room state to broadcast
-            broadcast_data["room"] = _build_game_room_response(room).model_dump(mode="json")
-            await connection_manager.broadcast_to_room(
+            broadcast_data["room"] = room_response.model_dump(mode="json")
+            add_room_event(
+                session,
                 room.code,
                 action_result.broadcast_event,
                 broadcast_data,
                 exclude_player_id=player_id if action_result.broadcast_event == "guess_submitted" else None,
             )
 
-        return ActionResponse(
+        response = ActionResponse.model_construct(
             success=action_result.success,
             message=action_result.message,
             data=action_result.data,
-            room=_build_game_room_response(room),
+            room=room_response,
         )
+        if idempotent is not None:
+            await idempotency_store.record(session, idempotent, response.model_dump(mode="json"))
+
+        cache_room_on_commit(session, room)
+        await session.commit()
+        game.on_action_committed(room)
+
+        return model_response(response)
+
+    @router.post(
+        "/{game_type}/rooms/{code}/actions/batch", response_model=BatchActionsResponse
+    )
+    async def execute_actions(
+        game_type: str,
+        code: str,
+        request: BatchActionsRequest,
+        session: AsyncSession = Depends(get_session_dep),
+    ):
+        """
+        Execute an ordered list of actions, possibly from different players.
+
+        For bots and admin tooling: the room is locked and loaded once, every
+        action is applied in order and committed in one transaction, and
+        clients get one event for the whole batch. Each action is validated
+        with the game's action schema before any is applied; results are
+        returned per action, in order.
+        """
+        game = game_registry.get_game(game_type)
+        if game is None or not game_registry.is_game_enabled(game_type):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Game '{game_type}' not found or not enabled",
+            )
+
+        actions: list[tuple[int, GameAction]] = []
+        errors = []
+        for index, item in enumerate(request.actions):
+            try:
+                actions.append((item.player_id, game.action_schema.model_validate(item.action)))
+            except ValidationError as e:
+                errors.extend(
+                    {**error, "loc": ("body", "actions", index, "action", *error["loc"])}
+                    for error in e.errors()
+                )
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=errors,
+            )
+
+        if settings.room_actors_enabled:
+            response = await room_actors.submit(
+                code.upper(),
+                lambda room, actor_session: _execute_actions_in_actor(
+                    game, game_type, room, actions, actor_session
+                ),
+            )
+            if isinstance(response, HTTPException):
+                raise response
+            return model_response(response)
+
+        rooms = await lock_rooms_with_current_round(session, Room.code == code.upper())
+        room = rooms[0] if rooms else None
+
+        error = _batch_access_error(room, game_type, [player_id for player_id, _ in actions])
+        if error is not None:
+            raise error
+
+        response = await _execute_actions(game, room, actions, session)
+        await session.commit()
+        game.on_action_committed(room)
+
+        return model_response(response)
 
     @router.websocket("/{game_type}/rooms/{code}/ws")
     async def websocket_endpoint(
@@ -425,30 +826,18 @@ def create_games_router() -> APIRouter:
         room_code = code.upper()
 
         # Verify room and player exist before accepting connection
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-
-        async for session in get_session():
-            result = await session.execute(
-                select(Room)
-                .options(selectinload(Room.players), selectinload(Room.rounds))
-                .where(Room.code == room_code)
-            )
-            room = result.scalar_one_or_none()
-
-            if room is None:
-                await websocket.close(code=4004, reason="Room not found")
-                return
+        state = await games_storage.load_game(room_code)
+        if state is None:
+            await websocket.close(code=4004, reason="Room not found")
+            return
 
-            if room.game_type != game_type:
-                await websocket.close(code=4004, reason="Wrong game type for room")
-                return
+        if state["game_type"] != game_type:
+            await websocket.close(code=4004, reason="Wrong game type for room")
+            return
 
-            player = next((p for p in room.players if p.id == player_id), None)
-            if player is None:
-                await websocket.close(code=4004, reason="Player not found in room")
-                return
-            break
+        if not any(p["id"] == player_id for p in state["players"]):
+            await websocket.close(code=4004, reason="Player not found in room")
+            return
 
         await connection_manager.connect(websocket, room_code, player_id)
 
@@ -485,30 +874,14 @@ async def _handle_ws_message(game_type: str, room_code: str, player_id: int, mes
         await connection_manager.send_to_player(room_code, player_id, "pong", {})
 
     elif event == "get_state":
-        state = games_storage.get_game(room_code)
-
-        if state is None:
-            from sqlalchemy import select
-            from sqlalchemy.orm import selectinload
-
-            async for session in get_session():
-                result = await session.execute(
-                    select(Room)
-                    .options(selectinload(Room.players), selectinload(Room.rounds))
-                    .where(Room.code == room_code)
-                )
-                room = result.scalar_one_or_none()
-                if room:
-                    state = _build_room_dict(room)
-                    games_storage.set_game(room_code, state)
-                break
+        state = await games_storage.load_game(room_code)
 
         if state:
             await connection_manager.send_to_player(
                 room_code,
                 player_id,
                 "room_state",
-                {"room": state},
+                build_room_state_payload(state),
             )
         else:
             await connection_manager.send_to_player(
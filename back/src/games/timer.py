@@ -0,0 +1,310 @@
+"""Shared timer job - fires round deadlines of every game with timed rounds."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, exists, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db import async_session_maker
+from src.games.registry import game_registry
+from src.games.timing import utc_now
+from src.jobs.base import BaseJob
+from src.jobs.deadlines import DeadlineQueue
+from src.models import Room, RoomStatus, GameRound, Player, RoundStatus
+from src.services.games_storage import cache_room_on_commit
+from src.services.room_actors import room_actors
+from src.services.room_service import current_round_join, lock_rooms_with_current_round
+
+logger = logging.getLogger(__name__)
+
+# Next transition per room of any game with deadlines (room code -> due time)
+room_deadlines = DeadlineQueue()
+
+
+def get_timed_game_types() -> list[str]:
+    """Registered games that declare deadlines (BaseGame.has_deadlines)."""
+    return [
+        game_type
+        for game_type in game_registry.enabled_games
+        if (game := game_registry.get_game(game_type)) is not None and game.has_deadlines
+    ]
+
+
+class GameTimerJob(BaseJob):
+    """
+    Background job that drives timed rounds for all games.
+
+    Games opt in with `BaseGame.has_deadlines`, tell the job when a room next
+    needs attention (`get_deadline`) and act on it (`on_deadline`). The job
+    itself knows nothing about game rules; adding a game adds no polling.
+
+    Deadlines are kept in an in-memory queue, so the job wakes exactly when
+    the next room is due and only loads that room. On every scheduled tick
+    (every `interval_seconds`, and right after becoming leader) the queue is
+    topped up from the indexed ends_at / next_round_at columns with deadlines
+    due before the next resync, which covers rounds started on other
+    instances.
+
+    Due rooms are processed concurrently (up to `game_timer_room_concurrency`
+    at a time), each in its own short transaction that locks the room row.
+    A room that fails is rolled back on its own and retried shortly; the
+    other rooms of the tick are unaffected. (This replaced writing all due
+    rooms with shared bulk statements in one transaction.)
+
+    With `game_timer_work_sharing` every instance runs the job: the queue
+    only decides when to look, each instance picks up a batch of due rooms
+    and claims them one by one with FOR UPDATE SKIP LOCKED, so replicas
+    split the transitions between them instead of waiting on one leader.
+    """
+
+    lock_id = 1001  # Unique ID for game timer lock
+    interval_seconds = settings.game_timer_job_interval
+    job_name = "GameTimerJob"
+    timeout_seconds = settings.game_timer_job_timeout
+    work_sharing = settings.game_timer_work_sharing
+    claim_batch_size = settings.game_timer_claim_batch_size
+    room_concurrency = settings.game_timer_room_concurrency
+    room_retry_seconds = settings.game_timer_room_retry_seconds
+
+    def __init__(self, deadlines: DeadlineQueue | None = None):
+        super().__init__()
+        self.deadlines = deadlines if deadlines is not None else room_deadlines
+        self._synced = False
+
+    async def on_leadership_acquired(self):
+        """Drop deadlines from a previous term; the next run reloads them."""
+        self.deadlines.clear()
+        self._synced = False
+
+    async def wait_for_next_run(self, timeout: float):
+        """Sleep until the next deadline, a new earlier deadline, or the next tick."""
+        if not self.is_leader:
+            # Actions queue deadlines on every instance, but only the leader
+            # pops them. Past-due ones would wake a follower in a busy loop;
+            # the leader picks them up from the database instead.
+            self.deadlines.pop_due(utc_now())
+            await super().wait_for_next_run(timeout)
+            return
+        await self.deadlines.wait(timeout)
+
+    async def execute(self, session: AsyncSession):
+        """Resync upcoming deadlines from the database on ticks, then process due rooms."""
+        game_types = get_timed_game_types()
+        if not game_types:
+            return
+        now = utc_now()
+
+        if self.scheduled_run or not self._synced:
+            self._synced = True
+            # Two intervals, so a tick that fires a little late misses nothing
+            until = now + timedelta(seconds=2 * self.interval_seconds)
+            for room_code, due_at in await self._load_deadlines(session, game_types, until):
+                self.deadlines.schedule(room_code, due_at)
+
+        room_codes = self.deadlines.pop_due(now)
+        if not room_codes:
+            return
+
+        if not self.work_sharing:
+            await self._process_due_rooms(room_codes)
+            return
+
+        due_codes = await self._find_due_room_codes(session, game_types, room_codes, now)
+        await self._process_due_rooms(due_codes)
+        if len(due_codes) >= self.claim_batch_size:
+            # Batch was full - come back right away for the rest. Codes another
+            # instance holds are dropped; a failed claimer is covered by resync.
+            found = set(due_codes)
+            for room_code in room_codes:
+                if room_code not in found:
+                    self.deadlines.schedule(room_code, now)
+
+    async def _load_deadlines(
+        self, session: AsyncSession, game_types: list[str], until: datetime
+    ) -> list[tuple[str, datetime]]:
+        """
+        Fetch (room code, deadline) pairs of timed rooms due before `until`.
+
+        The first two parts are range scans on partial indexes of game_rounds:
+        active rounds by ends_at and rooms waiting between rounds by
+        next_round_at. Deadlines further away are picked up by a later resync.
+
+        Active rounds where every player has answered are due right away
+        (reported with their start time). The last answer usually finishes the
+        round itself, but not when it came through the legacy API, and a local
+        early deadline only lives on the instance that served it.
+        """
+        round_ends = (
+            select(Room.code, GameRound.ends_at)
+            .select_from(GameRound)
+            .join(GameRound.room)
+            .where(
+                GameRound.status == RoundStatus.ACTIVE,
+                GameRound.ends_at <= until,
+                Room.status == RoomStatus.PLAYING,
+                Room.game_type.in_(game_types),
+            )
+        )
+        next_rounds = (
+            select(Room.code, GameRound.next_round_at)
+            .select_from(GameRound)
+            .join(GameRound.room)
+            .where(
+                GameRound.next_round_at.is_not(None),
+                GameRound.next_round_at <= until,
+                Room.status == RoomStatus.PLAYING,
+                Room.game_type.in_(game_types),
+            )
+        )
+        all_answered = (
+            select(Room.code, GameRound.started_at)
+            .select_from(GameRound)
+            .join(GameRound.room)
+            .where(
+                GameRound.status == RoundStatus.ACTIVE,
+                Room.status == RoomStatus.PLAYING,
+                Room.game_type.in_(game_types),
+                ~exists().where(Player.room_id == Room.id, Player.current_guess.is_(None)),
+            )
+        )
+        result = await session.execute(union_all(round_ends, next_rounds, all_answered))
+        return [(room_code, due_at) for room_code, due_at in result.all()]
+
+    async def _find_due_room_codes(
+        self,
+        session: AsyncSession,
+        game_types: list[str],
+        room_codes: list[str],
+        now: datetime,
+    ) -> list[str]:
+        """
+        Find up to `claim_batch_size` due rooms for work sharing.
+
+        A room is due if it was popped from the local queue or its current
+        round is past ends_at / next_round_at in the database. Rooms another
+        instance is processing right now are skipped; each room is then
+        claimed in its own transaction (see _claim_room).
+        """
+        query = (
+            select(Room.code)
+            .outerjoin(GameRound, current_round_join())
+            .where(
+                Room.status == RoomStatus.PLAYING,
+                Room.game_type.in_(game_types),
+                or_(
+                    Room.code.in_(room_codes),
+                    and_(
+                        GameRound.status == RoundStatus.ACTIVE,
+                        GameRound.ends_at <= now,
+                    ),
+                    GameRound.next_round_at <= now,
+                ),
+            )
+            .order_by(Room.id)
+            .limit(self.claim_batch_size)
+            .with_for_update(of=Room, skip_locked=True)
+        )
+        result = await session.execute(query)
+        # Release the row locks right away; the per-room transactions take them
+        await session.rollback()
+        return list(result.scalars().all())
+
+    async def _claim_room(self, session: AsyncSession, room_code: str) -> Room | None:
+        """
+        Lock a playing room for the rest of the transaction.
+
+        The room comes with its players and only its current round (Room.rounds
+        holds just that round), so the load does not grow with game length.
+        Game actions lock the room row the same way before changing anything
+        (see execute_action), so in leader mode this waits for e.g. the last
+        guess of the round to commit; with work sharing a room locked by
+        another instance or request is skipped and None returned.
+        """
+        rooms = await lock_rooms_with_current_round(
+            session,
+            Room.code == room_code,
+            Room.status == RoomStatus.PLAYING,
+            skip_locked=self.work_sharing,
+        )
+        return rooms[0] if rooms else None
+
+    async def _process_due_rooms(self, room_codes: list[str]):
+        """Process rooms concurrently, at most `room_concurrency` at a time."""
+        semaphore = asyncio.Semaphore(self.room_concurrency)
+        await asyncio.gather(
+            *(self._process_room(semaphore, room_code) for room_code in room_codes)
+        )
+
+    async def _process_room(self, semaphore: asyncio.Semaphore, room_code: str):
+        """Process one room in its own transaction; failures only affect this room."""
+        async with semaphore:
+            if room_actors.get(room_code) is not None:
+                await self._process_room_in_actor(room_code)
+                return
+
+            async with async_session_maker() as session:
+                try:
+                    room = await self._claim_room(session, room_code)
+                    if room is not None:
+                        await self.process_room(session, room)
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    logger.exception(f"Error processing room {room_code}: {e}")
+                    self.deadlines.schedule(
+                        room_code,
+                        utc_now() + timedelta(seconds=self.room_retry_seconds),
+                    )
+
+    async def _process_room_in_actor(self, room_code: str):
+        """
+        Fire the deadline through the room's actor on this instance, so it is
+        queued behind the actions it is already applying.
+
+        Rooms without a local actor take the regular path; actors lock the
+        room row per batch, so both are serialized by the database.
+        """
+
+        async def handle_deadline(room: Room | None, session: AsyncSession):
+            if room is not None and room.status == RoomStatus.PLAYING:
+                await self.process_room(session, room)
+
+        try:
+            await room_actors.submit(room_code, handle_deadline)
+        except Exception as e:
+            logger.exception(f"Error processing room {room_code}: {e}")
+            self.deadlines.schedule(
+                room_code,
+                utc_now() + timedelta(seconds=self.room_retry_seconds),
+            )
+
+    async def process_room(self, session: AsyncSession, room: Room):
+        """
+        Hand a due room to its game, then queue the room's next deadline.
+
+        Queued deadlines are only a hint, so the game's deadline is re-checked
+        against the freshly loaded room first.
+        """
+        game = game_registry.get_game(room.game_type)
+        if game is None or not game.has_deadlines:
+            return
+
+        now = utc_now()
+        deadline = game.get_deadline(room, now)
+        if deadline is None:
+            return
+        if deadline > now:
+            self.deadlines.schedule(room.code, deadline)
+            return
+
+        await game.on_deadline(room, session)
+        cache_room_on_commit(session, room)
+
+        next_deadline = game.get_deadline(room)
+        if next_deadline is None:
+            self.deadlines.cancel(room.code)
+        else:
+            self.deadlines.schedule(room.code, next_deadline)
@@ -0,0 +1,54 @@
+"""Round timing helpers shared by API responses, WebSocket events and timer jobs."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.games.registry import game_registry
+from src.models import Room, RoomStatus, GameRound, RoundStatus
+
+
+def utc_now() -> datetime:
+    """Current server time (UTC)."""
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def get_round_duration(room: Room) -> timedelta:
+    """Round time limit from the game's round_duration_seconds setting."""
+    game_settings = game_registry.get_settings(room.game_type)
+    return timedelta(seconds=game_settings.get("round_duration_seconds", 30))
+
+
+def get_between_rounds_delay(room: Room) -> timedelta:
+    """Pause after a round from the game's between_rounds_delay_seconds setting."""
+    game_settings = game_registry.get_settings(room.game_type)
+    return timedelta(seconds=game_settings.get("between_rounds_delay_seconds", 5))
+
+
+def get_round_ends_at(room: Room, game_round: GameRound) -> datetime | None:
+    """When the round's time limit expires (stored ends_at, or derived from started_at)."""
+    if game_round.ends_at is not None:
+        return _as_utc(game_round.ends_at)
+    if game_round.started_at is None:
+        return None
+    return _as_utc(game_round.started_at) + get_round_duration(room)
+
+
+def get_next_round_at(room: Room, game_round: GameRound) -> datetime | None:
+    """
+    When the next transition after a finished round is due.
+
+    That is the start of the next round, or the end of the game if this was
+    the last round. None while the round is still running or the game is over.
+    """
+    if game_round.status != RoundStatus.FINISHED or game_round.finished_at is None:
+        return None
+    if room.status != RoomStatus.PLAYING:
+        return None
+    if game_round.next_round_at is not None:
+        return _as_utc(game_round.next_round_at)
+    return _as_utc(game_round.finished_at) + get_between_rounds_delay(room)
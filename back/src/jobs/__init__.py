@@ -1,5 +1,18 @@
 from src.jobs.base import BaseJob
+from src.jobs.deadlines import DeadlineQueue
+from src.jobs.idempotency_key_prune import IdempotencyKeyPruneJob
+from src.jobs.leader import LeaderElection
 from src.jobs.room_cleanup import RoomCleanupJob
+from src.jobs.room_event_prune import RoomEventPruneJob
+from src.jobs.scheduler import JobScheduler, job_scheduler
 
-__all__ = ["BaseJob", "RoomCleanupJob"]
-
+__all__ = [
+    "BaseJob",
+    "DeadlineQueue",
+    "IdempotencyKeyPruneJob",
+    "JobScheduler",
+    "LeaderElection",
+    "RoomCleanupJob",
+    "RoomEventPruneJob",
+    "job_scheduler",
+]
@@ -5,7 +5,9 @@ from abc import ABC, abstractmethod
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db import async_session_maker
+from src.jobs.leader import LeaderElection
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,16 @@ class BaseJob(ABC):
     
     Advisory locks ensure that only one instance of the job runs at a time,
     even across multiple application instances.
+
+    Jobs with `work_sharing` enabled skip the advisory lock and run on every
+    instance at once. They must claim the rows they work on themselves
+    (e.g. SELECT ... FOR UPDATE SKIP LOCKED), so throughput grows with the
+    number of replicas.
+
+    With `leader_election` enabled, leadership is a session-level advisory
+    lock held on a dedicated connection (see LeaderElection) instead of a
+    transaction-level lock taken on every tick; followers skip their ticks
+    without opening a session.
     """
 
     # Unique lock ID for this job type (override in subclass)
@@ -27,39 +39,127 @@ class BaseJob(ABC):
     # Job name for logging (override in subclass)
     job_name: str = "BaseJob"
 
+    # Run on every instance without the advisory lock (override in subclass)
+    work_sharing: bool = False
+
+    # Hold leadership on a dedicated connection instead of per tick
+    leader_election: bool = settings.job_leader_election
+
+    # Whether this instance acquired the lock on its last attempt
+    # (always True for work-sharing jobs once they are running)
+    is_leader: bool = False
+
+    # Set while the job runs with leader_election enabled
+    election: LeaderElection | None = None
+
+    # Whether the current run is a regular tick of the fixed-rate schedule
+    # (False for early wake-ups, see wait_for_next_run)
+    scheduled_run: bool = True
+
+    # Max seconds per run; a run that takes longer is cancelled (None = no limit)
+    timeout_seconds: float | None = None
+
+    # Retry delay after failed runs: doubles per failure up to the max, jittered
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 60.0
+
     async def run(self):
-        """Main job loop. Acquires advisory lock and executes the job periodically."""
-        logger.info(f"Starting {self.job_name} with interval {self.interval_seconds}s")
-        
-        while True:
+        """Run this job on its own scheduler. Prefer adding it to job_scheduler."""
+        from src.jobs.scheduler import JobScheduler
+
+        scheduler = JobScheduler()
+        scheduler.add(self)
+        await scheduler.run_job(self)
+
+    async def start(self):
+        """Called by the scheduler before the first run."""
+        if self.leader_election and not self.work_sharing:
+            self.election = LeaderElection(self.lock_id, self.job_name)
+            await self.election.start()
+
+    async def stop(self):
+        """Called by the scheduler when the job loop ends."""
+        if self.election is not None:
+            await self.election.stop()
+            self.election = None
+
+    async def run_once(self):
+        """
+        Execute the job once if this instance may run it.
+
+        Errors from execute() are raised after the rollback so the scheduler
+        can back off.
+        """
+        if self.election is not None and not self.election.is_leader:
+            # Followers don't touch the database between heartbeats
+            self.is_leader = False
+            return
+
+        async with async_session_maker() as session:
+            if self.work_sharing or self.election is not None:
+                lock_acquired = True
+            else:
+                # Try to acquire advisory lock (non-blocking)
+                result = await session.execute(
+                    text(f"SELECT pg_try_advisory_xact_lock({self.lock_id})")
+                )
+                lock_acquired = result.scalar()
+
+            if not lock_acquired:
+                self.is_leader = False
+                return
+
+            if not self.is_leader:
+                logger.info(f"{self.job_name} became leader")
+                self.is_leader = True
+                await self.on_leadership_acquired()
+
             try:
-                async with async_session_maker() as session:
-                    # Try to acquire advisory lock (non-blocking)
-                    result = await session.execute(
-                        text(f"SELECT pg_try_advisory_xact_lock({self.lock_id})")
-                    )
-                    lock_acquired = result.scalar()
-
-                    if lock_acquired:
-                        try:
-                            await self.execute(session)
-                            await session.commit()
-                        except Exception as e:
-                            logger.exception(f"Error in {self.job_name}: {e}")
-                            await session.rollback()
-                    # Lock is automatically released when transaction ends
-                    
-            except Exception as e:
-                logger.exception(f"Error in {self.job_name} loop: {e}")
-
-            await asyncio.sleep(self.interval_seconds)
+                await self.execute(session)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            # Transaction-level lock is released when the transaction ends
+
+    async def get_status(self) -> dict:
+        """Leadership status of this job on this instance."""
+        if self.work_sharing:
+            mode = "work_sharing"
+        elif self.election is not None:
+            mode = "leader_election"
+        else:
+            mode = "per_tick_lock"
+
+        status = {"job": self.job_name, "mode": mode, "is_leader": self.is_leader}
+        if self.election is not None:
+            status.update(await self.election.get_status())
+        return status
+
+    async def wait_for_next_run(self, timeout: float):
+        """
+        Wait until the next scheduled tick, `timeout` seconds from now.
+
+        Override for event-driven jobs: returning earlier triggers an extra
+        run without moving the fixed-rate schedule.
+        """
+        await asyncio.sleep(timeout)
+
+    async def on_leadership_acquired(self):
+        """
+        Called when this instance acquires the lock after not holding it.
+        
+        Override to rebuild in-memory state that only the leader maintains.
+        """
+        pass
 
     @abstractmethod
     async def execute(self, session: AsyncSession):
         """
         Execute the job logic. Override in subclass.
         
-        The session is already inside a transaction with an advisory lock held.
+        The session is already inside a transaction with an advisory lock held
+        (or leadership held by the election; none for work-sharing jobs).
         """
         pass
 
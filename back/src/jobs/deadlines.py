@@ -0,0 +1,92 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timezone
+
+
+class DeadlineQueue:
+    """
+    In-memory min-heap of per-key deadlines (e.g. room code -> next transition).
+
+    Each key has at most one live deadline: scheduling a key again replaces
+    its previous deadline. Replaced entries stay in the heap and are skipped
+    lazily when they reach the top.
+
+    The queue is only a wake-up hint. Jobs must re-check the real state in the
+    database before acting, so a stale or missing entry never causes a wrong
+    transition - at worst a delayed one, fixed by the next full resync.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._deadlines: dict[str, datetime] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._deadlines
+
+    def get(self, key: str) -> datetime | None:
+        """Get the current deadline for a key."""
+        return self._deadlines.get(key)
+
+    def schedule(self, key: str, due_at: datetime):
+        """Schedule (or reschedule) a key. Wakes up waiters if it is the earliest."""
+        earliest = self.next_due()
+        self._deadlines[key] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._counter), key))
+        if earliest is None or due_at < earliest:
+            self._wakeup.set()
+
+    def cancel(self, key: str):
+        """Remove a key from the queue."""
+        self._deadlines.pop(key, None)
+
+    def clear(self):
+        """Remove all deadlines."""
+        self._heap.clear()
+        self._deadlines.clear()
+
+    def next_due(self) -> datetime | None:
+        """Earliest live deadline, or None if the queue is empty."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[str]:
+        """Remove and return all keys whose deadline is at or before now."""
+        due = []
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            due.append(key)
+            self._drop_stale()
+        return due
+
+    async def wait(self, max_wait: float):
+        """
+        Sleep until the earliest deadline, an earlier deadline is scheduled,
+        or max_wait seconds pass - whichever comes first.
+        """
+        timeout = max_wait
+        next_due = self.next_due()
+        if next_due is not None:
+            until_due = (next_due - datetime.now(timezone.utc)).total_seconds()
+            timeout = max(0.0, min(timeout, until_due))
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _drop_stale(self):
+        """Pop heap entries that were replaced or cancelled."""
+        while self._heap:
+            due_at, _, key = self._heap[0]
+            if self._deadlines.get(key) == due_at:
+                return
+            heapq.heappop(self._heap)
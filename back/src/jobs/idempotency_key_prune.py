@@ -0,0 +1,55 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.jobs.base import BaseJob
+from src.models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyPruneJob(BaseJob):
+    """
+    Background job that deletes stored Idempotency-Key responses.
+
+    Clients only retry for a short while, so keys older than
+    `idempotency_key_retention_minutes` are never replayed again.
+    """
+
+    lock_id = 1004  # Unique ID for idempotency key prune lock
+    interval_seconds = settings.idempotency_key_prune_job_interval
+    job_name = "IdempotencyKeyPruneJob"
+    chunk_size = settings.idempotency_key_prune_chunk_size
+
+    async def execute(self, session: AsyncSession):
+        """Delete expired keys in chunks of `idempotency_key_prune_chunk_size`, committing each."""
+        threshold = datetime.now(timezone.utc) - timedelta(
+            minutes=settings.idempotency_key_retention_minutes
+        )
+        key_columns = tuple_(
+            IdempotencyKey.room_code, IdempotencyKey.player_id, IdempotencyKey.key
+        )
+
+        total = 0
+        while True:
+            expired = (
+                select(IdempotencyKey.room_code, IdempotencyKey.player_id, IdempotencyKey.key)
+                .where(IdempotencyKey.created_at < threshold)
+                .limit(self.chunk_size)
+            )
+            result = await session.execute(
+                delete(IdempotencyKey)
+                .where(key_columns.in_(expired))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            total += result.rowcount
+
+            if result.rowcount < self.chunk_size:
+                break
+
+        if total:
+            logger.info(f"Pruned {total} idempotency keys older than {threshold}")
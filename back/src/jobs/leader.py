@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """
+    Long-lived job leadership held as a session-level advisory lock.
+
+    The lock is taken once on a dedicated connection and kept for as long as
+    that connection lives. A heartbeat re-confirms it every `check_interval`
+    seconds with one cheap query; followers retry the lock at the same pace
+    on their own connection. No per-tick sessions or transactions.
+
+    Handover is bounded by `lease_timeout`:
+    - the leader stops reporting itself as leader if it could not confirm
+      the lock within that time (query errors or timeouts drop it at once)
+    - the server closes a leader connection that stays idle that long
+      (idle_session_timeout), releasing the lock for a follower
+
+    The connection is not pooled, so closing it always releases the lock.
+    """
+
+    def __init__(
+        self,
+        lock_id: int,
+        name: str,
+        check_interval: float | None = None,
+        lease_timeout: float | None = None,
+        engine: AsyncEngine | None = None,
+    ):
+        self.lock_id = lock_id
+        self.name = name
+        self.check_interval = (
+            check_interval if check_interval is not None
+            else settings.job_leader_check_interval
+        )
+        self.lease_timeout = (
+            lease_timeout if lease_timeout is not None
+            else settings.job_leader_lease_timeout
+        )
+        # Shown as application_name in pg_stat_activity
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._engine = engine
+        self._owns_engine = engine is None
+        self._conn: AsyncConnection | None = None
+        self._conn_lock = asyncio.Lock()
+        self._heartbeat_task: asyncio.Task | None = None
+        self._leader_since: datetime | None = None
+        self._confirmed_at: float | None = None  # time.monotonic()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this instance holds the lock, confirmed within the lease."""
+        if self._leader_since is None or self._confirmed_at is None:
+            return False
+        return time.monotonic() - self._confirmed_at < self.lease_timeout
+
+    @property
+    def leader_since(self) -> datetime | None:
+        """When this instance acquired the lock (None if not leader)."""
+        return self._leader_since if self.is_leader else None
+
+    @property
+    def held_for(self) -> float | None:
+        """Seconds this instance has held the lock (None if not leader)."""
+        if not self.is_leader:
+            return None
+        return (datetime.now(timezone.utc) - self._leader_since).total_seconds()
+
+    async def start(self):
+        """Try to acquire leadership now and keep checking in the background."""
+        await self.check()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def stop(self):
+        """Stop the heartbeat and release the lock by closing the connection."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        async with self._conn_lock:
+            await self._close_connection()
+        self._set_leader(False)
+        if self._owns_engine and self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    async def check(self) -> bool:
+        """
+        Confirm the lock if leader, otherwise try to take it.
+
+        Any error or timeout drops the connection (and so the lock) and
+        reports this instance as a follower.
+        """
+        async with self._conn_lock:
+            try:
+                held = await asyncio.wait_for(self._check_lock(), self.check_interval)
+            except Exception as e:
+                if self._leader_since is not None:
+                    logger.warning(f"{self.name} lost leadership: {e!r}")
+                await self._close_connection()
+                held = False
+
+        self._set_leader(held)
+        return held
+
+    async def get_leader(self) -> dict | None:
+        """Describe the instance currently holding the lock, if any."""
+        async with self._conn_lock:
+            try:
+                conn = await self._get_connection()
+                result = await asyncio.wait_for(
+                    conn.execute(
+                        text(
+                            "SELECT a.pid, a.application_name, a.backend_start "
+                            "FROM pg_locks l "
+                            "JOIN pg_stat_activity a ON a.pid = l.pid "
+                            "WHERE l.locktype = 'advisory' AND l.granted "
+                            "AND l.classid = :classid AND l.objid = :objid "
+                            "AND l.objsubid = 1"
+                        ),
+                        self._lock_key(),
+                    ),
+                    self.check_interval,
+                )
+                row = result.first()
+                await conn.commit()
+            except Exception as e:
+                logger.warning(f"{self.name} could not look up leader: {e!r}")
+                await self._close_connection()
+                return None
+
+        if row is None:
+            return None
+        return {
+            "pid": row.pid,
+            "instance": row.application_name,
+            "connected_at": row.backend_start.isoformat(),
+        }
+
+    async def get_status(self) -> dict:
+        """Leadership details for health/status endpoints."""
+        leader_since = self.leader_since
+        return {
+            "instance": self.instance_id,
+            "is_leader": self.is_leader,
+            "leader_since": leader_since.isoformat() if leader_since else None,
+            "held_for_seconds": self.held_for,
+            "leader": await self.get_leader(),
+        }
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def _check_lock(self) -> bool:
+        conn = await self._get_connection()
+        if self._leader_since is not None:
+            result = await conn.execute(
+                text(
+                    "SELECT EXISTS ("
+                    "SELECT 1 FROM pg_locks "
+                    "WHERE locktype = 'advisory' AND granted "
+                    "AND pid = pg_backend_pid() "
+                    "AND classid = :classid AND objid = :objid AND objsubid = 1"
+                    ")"
+                ),
+                self._lock_key(),
+            )
+        else:
+            result = await conn.execute(
+                text("SELECT pg_try_advisory_lock(:lock_id)"),
+                {"lock_id": self.lock_id},
+            )
+        held = bool(result.scalar())
+        # Session-level lock survives the commit; don't sit idle in a transaction
+        await conn.commit()
+        return held
+
+    async def _get_connection(self) -> AsyncConnection:
+        if self._conn is None:
+            if self._engine is None:
+                self._engine = create_async_engine(
+                    settings.database_url, poolclass=NullPool
+                )
+            conn = await self._engine.connect()
+            try:
+                await conn.execute(
+                    text(
+                        "SELECT set_config('application_name', :app_name, false), "
+                        "set_config('idle_session_timeout', :timeout_ms, false)"
+                    ),
+                    {
+                        "app_name": f"{self.instance_id}:{self.name}",
+                        "timeout_ms": str(int(self.lease_timeout * 1000)),
+                    },
+                )
+                await conn.commit()
+            except Exception:
+                await conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    async def _close_connection(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        try:
+            await conn.close()
+        except Exception:
+            # The server side may already be gone; the lock goes with it
+            await conn.invalidate()
+
+    def _set_leader(self, held: bool):
+        if held:
+            if self._leader_since is None:
+                self._leader_since = datetime.now(timezone.utc)
+                logger.info(f"{self.name} acquired leadership ({self.instance_id})")
+            self._confirmed_at = time.monotonic()
+        elif self._leader_since is not None:
+            logger.info(f"{self.name} gave up leadership ({self.instance_id})")
+            self._leader_since = None
+            self._confirmed_at = None
+
+    def _lock_key(self) -> dict:
+        # pg_locks splits a bigint advisory key into classid (high) / objid (low)
+        return {
+            "classid": (self.lock_id >> 32) & 0xFFFFFFFF,
+            "objid": self.lock_id & 0xFFFFFFFF,
+        }
@@ -1,14 +1,14 @@
 import logging
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.jobs.base import BaseJob
 from src.models import Room, RoomStatus
 from src.schemas.websocket import WSEventType
-from src.services import connection_manager
+from src.services.room_events import add_room_event
 
 logger = logging.getLogger(__name__)
 
@@ -24,38 +24,69 @@ class RoomCleanupJob(BaseJob):
     lock_id = 1002  # Unique ID for room cleanup lock
     interval_seconds = settings.room_cleanup_job_interval
     job_name = "RoomCleanupJob"
+    timeout_seconds = settings.room_cleanup_job_timeout
+    chunk_size = settings.room_cleanup_chunk_size
 
     async def execute(self, session: AsyncSession):
-        """Find and close inactive rooms."""
+        """
+        Close inactive rooms in chunks of `room_cleanup_chunk_size`.
+
+        Each chunk is one UPDATE ... RETURNING, committed together with its
+        ROOM_CLOSED outbox events, so a backlog after an outage never turns
+        into one huge transaction. Committing releases the per-tick advisory
+        lock, so chunks are claimed with FOR UPDATE SKIP LOCKED and a
+        concurrent run can never close the same room twice.
+        """
         threshold = datetime.now(timezone.utc) - timedelta(
             hours=settings.room_inactivity_threshold_hours
         )
 
-        # Find all active rooms (WAITING or PLAYING) with old updated_at
-        result = await session.execute(
-            select(Room).where(
-                Room.status.in_([RoomStatus.WAITING, RoomStatus.PLAYING]),
-                Room.updated_at < threshold,
-            )
-        )
-        inactive_rooms = result.scalars().all()
+        while True:
+            closed_rooms = await self._close_rooms_chunk(session, threshold)
 
-        for room in inactive_rooms:
-            await self._close_room(session, room)
+            for room_code, previous_status, updated_at in closed_rooms:
+                logger.info(
+                    f"Closing inactive room {room_code} "
+                    f"(last updated: {updated_at}, status: {previous_status.value})"
+                )
+                # Notify any connected clients that the room was closed
+                add_room_event(
+                    session,
+                    room_code,
+                    WSEventType.ROOM_CLOSED,
+                    {"reason": "inactivity"},
+                )
 
-    async def _close_room(self, session: AsyncSession, room: Room):
-        """Close an inactive room with ABANDONED status."""
-        logger.info(
-            f"Closing inactive room {room.code} "
-            f"(last updated: {room.updated_at}, status: {room.status.value})"
-        )
+            await session.commit()
 
-        room.status = RoomStatus.ABANDONED
+            if len(closed_rooms) < self.chunk_size:
+                break
 
-        # Notify any connected clients that the room was closed
-        await connection_manager.broadcast_to_room(
-            room.code,
-            WSEventType.ROOM_CLOSED,
-            {"reason": "inactivity"},
-        )
+    async def _close_rooms_chunk(
+        self, session: AsyncSession, threshold: datetime
+    ) -> list[tuple[str, RoomStatus, datetime]]:
+        """
+        Mark up to `chunk_size` inactive rooms ABANDONED with a single UPDATE.
 
+        Returns (code, previous status, last update) of each closed room.
+        """
+        # Find active rooms (WAITING or PLAYING) with old updated_at
+        inactive = (
+            select(Room.id, Room.status, Room.updated_at)
+            .where(
+                Room.status.in_([RoomStatus.WAITING, RoomStatus.PLAYING]),
+                Room.updated_at < threshold,
+            )
+            .order_by(Room.id)
+            .limit(self.chunk_size)
+            .with_for_update(skip_locked=True)
+            .subquery("inactive")
+        )
+        result = await session.execute(
+            update(Room)
+            .where(Room.id == inactive.c.id)
+            .values(status=RoomStatus.ABANDONED)
+            .returning(Room.code, inactive.c.status, inactive.c.updated_at)
+            .execution_options(synchronize_session="fetch")
+        )
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.jobs.base import BaseJob
+from src.models import RoomEvent
+
+logger = logging.getLogger(__name__)
+
+
+class RoomEventPruneJob(BaseJob):
+    """
+    Background job that deletes delivered events from the room_events outbox.
+
+    Dispatchers only read events committed since they started, so rows older
+    than `room_event_retention_minutes` are never needed again.
+    """
+
+    lock_id = 1003  # Unique ID for room event prune lock
+    interval_seconds = settings.room_event_prune_job_interval
+    job_name = "RoomEventPruneJob"
+    chunk_size = settings.room_event_prune_chunk_size
+
+    async def execute(self, session: AsyncSession):
+        """Delete expired events in chunks of `room_event_prune_chunk_size`, committing each."""
+        threshold = datetime.now(timezone.utc) - timedelta(
+            minutes=settings.room_event_retention_minutes
+        )
+
+        total = 0
+        while True:
+            expired = (
+                select(RoomEvent.id)
+                .where(RoomEvent.created_at < threshold)
+                .order_by(RoomEvent.id)
+                .limit(self.chunk_size)
+            )
+            result = await session.execute(
+                delete(RoomEvent)
+                .where(RoomEvent.id.in_(expired.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            total += result.rowcount
+
+            if result.rowcount < self.chunk_size:
+                break
+
+        if total:
+            logger.info(f"Pruned {total} room events older than {threshold}")
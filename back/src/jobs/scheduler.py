@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import random
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from src.jobs.base import BaseJob
+
+logger = logging.getLogger(__name__)
+
+# Wake-ups this close to a tick count as the tick (timer resolution)
+TICK_TOLERANCE_SECONDS = 0.01
+
+# Upper bounds (seconds) of histogram buckets
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of seconds with cumulative (Prometheus-style) buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Record one value."""
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        """Count, sum and cumulative count per bucket upper bound."""
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self._counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class JobStats:
+    """Run metrics of one scheduled job."""
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.consecutive_failures = 0
+        self.skipped_ticks = 0
+        self.last_run_at: datetime | None = None
+        self.last_error: str | None = None
+        # How long each run took
+        self.duration = Histogram()
+        # How far runs that took longer than the interval went over it
+        self.overrun = Histogram()
+
+    def snapshot(self) -> dict:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "consecutive_failures": self.consecutive_failures,
+            "skipped_ticks": self.skipped_ticks,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_error": self.last_error,
+            "duration_seconds": self.duration.snapshot(),
+            "overrun_seconds": self.overrun.snapshot(),
+        }
+
+
+class JobScheduler:
+    """
+    Runs background jobs on a fixed-rate clock.
+
+    - Ticks are anchored to the job's start time (start + n * interval), so
+      the period does not drift by the run time. A run that overruns one or
+      more ticks skips them instead of firing a burst to catch up.
+    - Jobs may wake up early between ticks (see BaseJob.wait_for_next_run);
+      that does not move the clock.
+    - A failed or timed out run (BaseJob.timeout_seconds) is retried after a
+      jittered exponential backoff instead of at full rate.
+    - Durations and overruns are recorded per job in JobStats.
+
+    `clock` (monotonic seconds) and `sleep` (used for backoff) can be
+    replaced in tests.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self.jobs: list[BaseJob] = []
+        self.stats: dict[str, JobStats] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add(self, job: BaseJob):
+        """Register a job. Must be called before start()."""
+        self.jobs.append(job)
+        self.stats[job.job_name] = JobStats()
+
+    def start(self):
+        """Start a task per registered job."""
+        self._tasks = [asyncio.create_task(self.run_job(job)) for job in self.jobs]
+
+    async def stop(self):
+        """Cancel all job tasks and wait for them to wind down."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def get_status(self) -> list[dict]:
+        """Leadership status and run metrics of every job."""
+        return [
+            {**await job.get_status(), "stats": self.stats[job.job_name].snapshot()}
+            for job in self.jobs
+        ]
+
+    async def run_job(self, job: BaseJob):
+        """Job loop: run, record, then wait for the next tick or backoff."""
+        stats = self.stats.setdefault(job.job_name, JobStats())
+        logger.info(f"Starting {job.job_name} with interval {job.interval_seconds}s")
+
+        await job.start()
+        try:
+            next_tick = self._clock()
+            while True:
+                started = self._clock()
+                job.scheduled_run = started >= next_tick - TICK_TOLERANCE_SECONDS
+                error = await self._run_once(job, stats)
+                finished = self._clock()
+
+                duration = finished - started
+                stats.runs += 1
+                stats.last_run_at = datetime.now(timezone.utc)
+                stats.duration.observe(duration)
+                if duration > job.interval_seconds:
+                    stats.overrun.observe(duration - job.interval_seconds)
+
+                if error:
+                    stats.failures += 1
+                    stats.consecutive_failures += 1
+                    stats.last_error = error
+                    await self._sleep(
+                        self.get_backoff(job, stats.consecutive_failures)
+                    )
+                    continue
+                stats.consecutive_failures = 0
+
+                if finished >= next_tick - TICK_TOLERANCE_SECONDS:
+                    # Next tick on the fixed grid; skip the ones already missed
+                    missed = max(0, int((finished - next_tick) // job.interval_seconds))
+                    stats.skipped_ticks += missed
+                    next_tick += (missed + 1) * job.interval_seconds
+
+                await job.wait_for_next_run(max(0.0, next_tick - self._clock()))
+        finally:
+            await job.stop()
+
+    @staticmethod
+    def get_backoff(job: BaseJob, failures: int) -> float:
+        """Exponential backoff with equal jitter: half fixed, half random."""
+        delay = min(
+            job.backoff_max_seconds,
+            job.backoff_base_seconds * 2 ** min(failures - 1, 32),
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _run_once(self, job: BaseJob, stats: JobStats) -> str | None:
+        """Run the job once; return an error description if it failed."""
+        try:
+            await asyncio.wait_for(job.run_once(), job.timeout_seconds)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.error(f"{job.job_name} timed out after {job.timeout_seconds}s")
+            return f"timed out after {job.timeout_seconds}s"
+        except Exception as e:
+            logger.exception(f"Error in {job.job_name}: {e}")
+            return repr(e)
+        return None
+
+
+# Global scheduler instance
+job_scheduler = JobScheduler()
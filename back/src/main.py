@@ -2,14 +2,16 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.rooms import router as rooms_router
 from src.api.websocket import router as ws_router
-from src.games.guess_number import GuessNumberTimerJob
+from src.jobs.idempotency_key_prune import IdempotencyKeyPruneJob
 from src.jobs.room_cleanup import RoomCleanupJob
-from src.services import connection_manager, games_storage
+from src.jobs.room_event_prune import RoomEventPruneJob
+from src.jobs.scheduler import job_scheduler
+from src.services import connection_manager, games_storage, room_actors, room_event_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -62,29 +64,37 @@ def init_game_registry() -> None:
 init_game_registry()
 
 # Now import and create the games router (after registry is initialized)
-from src.games.registry import game_registry
-from src.games.router import create_games_router
+from src.games.router import create_games_router, games_info_response
+from src.games.guess_batcher import guess_batcher
+from src.games.timer import GameTimerJob
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Connect games_storage to connection_manager
     games_storage.set_connection_manager(connection_manager)
-    
-    # Start background tasks
-    guess_number_timer_job = GuessNumberTimerJob()
-    room_cleanup_job = RoomCleanupJob()
-    
+    room_event_dispatcher.set_connection_manager(connection_manager)
+
+    # Start background jobs
+    job_scheduler.add(GameTimerJob())
+    job_scheduler.add(RoomCleanupJob())
+    job_scheduler.add(RoomEventPruneJob())
+    job_scheduler.add(IdempotencyKeyPruneJob())
+    job_scheduler.start()
+
     tasks = [
-        asyncio.create_task(guess_number_timer_job.run()),
-        asyncio.create_task(room_cleanup_job.run()),
         asyncio.create_task(games_storage.start()),
+        asyncio.create_task(room_event_dispatcher.start()),
     ]
     
     yield
     
     # Cleanup
     games_storage.stop()
+    await job_scheduler.stop()
+    await room_actors.stop()  # Commits actions still queued in room actors
+    await guess_batcher.stop()
+    room_event_dispatcher.stop()
     for task in tasks:
         task.cancel()
         try:
@@ -122,11 +132,19 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/jobs")
+async def jobs_health_check():
+    """Leadership and run metrics of background jobs on this instance."""
+    return {"jobs": await job_scheduler.get_status()}
+
+
+@app.get("/health/cache")
+async def cache_health_check():
+    """Hit ratio and staleness of the room snapshot cache on this instance."""
+    return {"room_snapshots": games_storage.get_stats()}
+
+
 @app.get("/api/info")
-async def api_info():
-    """Get API information including available games."""
-    return {
-        "version": "0.1.0",
-        "games": game_registry.get_all_games_info(),
-        "default_game": game_registry.default_game_type,
-    }
+async def api_info(request: Request):
+    """Get API information including available games (built once, cacheable)."""
+    return games_info_response(request, version=app.version)
@@ -1,6 +1,7 @@
 from src.models.room import Room, RoomStatus
 from src.models.player import Player
 from src.models.game_round import GameRound, RoundStatus
+from src.models.room_event import RoomEvent
+from src.models.idempotency_key import IdempotencyKey
 
-__all__ = ["Room", "RoomStatus", "Player", "GameRound", "RoundStatus"]
-
+__all__ = ["Room", "RoomStatus", "Player", "GameRound", "RoundStatus", "RoomEvent", "IdempotencyKey"]
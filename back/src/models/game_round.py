@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -18,6 +18,19 @@ class RoundStatus(enum.Enum):
 
 class GameRound(Base):
     __tablename__ = "game_rounds"
+    __table_args__ = (
+        # Timer lookups: range scans over pending deadlines only
+        Index(
+            "ix_game_rounds_active_ends_at",
+            "ends_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        Index(
+            "ix_game_rounds_next_round_at",
+            "next_round_at",
+            postgresql_where=text("next_round_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     room_id: Mapped[int] = mapped_column(Integer, ForeignKey("rooms.id", ondelete="CASCADE"), index=True)
@@ -26,6 +39,10 @@ class GameRound(Base):
     status: Mapped[RoundStatus] = mapped_column(Enum(RoundStatus), default=RoundStatus.ACTIVE)
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Deadline of the round's time limit, set when the round is created
+    ends_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # When the next round starts (or the game ends); set while the room waits between rounds
+    next_round_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     room: Mapped["Room"] = relationship("Room", back_populates="rounds")
 
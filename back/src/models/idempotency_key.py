@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Response of an action sent with an Idempotency-Key header.
+
+    The row is inserted in the action's own transaction, before the room is
+    touched, so a retry either replays the committed response or waits for
+    the original request to finish.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    room_code: Mapped[str] = mapped_column(String(6), primary_key=True)
+    player_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64))
+    response: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
@@ -42,5 +42,11 @@ class Room(Base):
         onupdate=func.now()
     )
 
-    players: Mapped[list["Player"]] = relationship("Player", back_populates="room", cascade="all, delete-orphan")
+    # Fetch server-generated values (updated_at) with RETURNING on flush, so
+    # in-memory rooms stay readable without a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    players: Mapped[list["Player"]] = relationship(
+        "Player", back_populates="room", cascade="all, delete-orphan", order_by="Player.id"
+    )
     rounds: Mapped[list["GameRound"]] = relationship("GameRound", back_populates="room", cascade="all, delete-orphan")
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class RoomEvent(Base):
+    """
+    Outbox of WebSocket room events.
+
+    Rows are written in the same transaction as the change they announce
+    and pushed to clients by RoomEventDispatcher on every instance.
+    """
+
+    __tablename__ = "room_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    room_code: Mapped[str] = mapped_column(String(6))
+    event: Mapped[str] = mapped_column(String(50))
+    data: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    exclude_player_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
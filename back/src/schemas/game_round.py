@@ -11,6 +11,8 @@ class GameRoundResponse(BaseModel):
     status: RoundStatus
     started_at: datetime
     finished_at: datetime | None
+    ends_at: datetime | None = None  # Deadline of the round's time limit
+    next_round_at: datetime | None = None  # When the next round starts (finished rounds)
 
     model_config = {"from_attributes": True}
 
@@ -24,6 +24,7 @@ class RoomResponse(BaseModel):
     updated_at: datetime
     players: list[PlayerResponse] = []
     current_round: GameRoundResponse | None = None
+    server_time: datetime | None = None  # Server clock, for client-side countdowns
 
     model_config = {"from_attributes": True}
 
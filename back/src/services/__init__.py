@@ -1,5 +1,32 @@
 from src.services.room_service import RoomService
 from src.services.connection_manager import ConnectionManager, connection_manager
 from src.services.games_storage import GamesStorage, games_storage
+from src.services.room_events import RoomEventDispatcher, add_room_event, room_event_dispatcher
+from src.services.room_actors import RoomActor, RoomActorRegistry, room_actors
+from src.services.room_loader import RoomLoader, room_loader
+from src.services.idempotency import (
+    IdempotencyKeyReused,
+    IdempotencyStore,
+    IdempotentRequest,
+    idempotency_store,
+)
 
-__all__ = ["RoomService", "ConnectionManager", "connection_manager", "GamesStorage", "games_storage"]
+__all__ = [
+    "RoomService",
+    "ConnectionManager",
+    "connection_manager",
+    "GamesStorage",
+    "games_storage",
+    "RoomEventDispatcher",
+    "add_room_event",
+    "room_event_dispatcher",
+    "RoomActor",
+    "RoomActorRegistry",
+    "room_actors",
+    "RoomLoader",
+    "room_loader",
+    "IdempotencyKeyReused",
+    "IdempotencyStore",
+    "IdempotentRequest",
+    "idempotency_store",
+]
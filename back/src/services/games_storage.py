@@ -1,19 +1,56 @@
 import asyncio
+import hashlib
+import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import event, inspect, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db import async_session_maker
+from src.games.timing import get_next_round_at, get_round_ends_at, utc_now
 from src.models import Room, RoomStatus
 from src.schemas import RoomResponse, PlayerResponse, GameRoundResponse
 from src.models.game_round import RoundStatus
+from src.services.room_service import select_room_with_current_round
 
 logger = logging.getLogger(__name__)
 
 
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def build_room_state_payload(state: dict[str, Any]) -> dict[str, Any]:
+    """
+    Wrap a cached room dict into a room_state event payload.
+
+    The server clock is added per message (not cached) so clients can
+    correct for clock skew when rendering countdowns.
+    """
+    return {"room": state, "server_time": utc_now().isoformat()}
+
+
+def room_state_etag(state: dict[str, Any]) -> str:
+    """
+    ETag of a room state dict: a hash of its content, so it changes whenever
+    anything in the state does (players' guesses don't touch rooms.updated_at).
+    """
+    content = json.dumps(state, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha1(content.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
 def _build_room_dict(room: Room, hide_target: bool = True) -> dict[str, Any]:
     """Build a room dict from a Room model."""
     current_round = None
@@ -27,6 +64,8 @@ def _build_room_dict(room: Room, hide_target: bool = True) -> dict[str, Any]:
                 "status": r.status.value,
                 "started_at": r.started_at.isoformat() if r.started_at else None,
                 "finished_at": r.finished_at.isoformat() if r.finished_at else None,
+                "ends_at": _isoformat(get_round_ends_at(room, r)),
+                "next_round_at": _isoformat(get_next_round_at(room, r)),
             }
             break
 
@@ -56,16 +95,47 @@ def _build_room_dict(room: Room, hide_target: bool = True) -> dict[str, Any]:
 
 class GamesStorage:
     """
-    In-memory storage for active game states.
-    Periodically syncs with database and broadcasts changes via WebSocket.
+    Versioned cache of room state snapshots, shared by every read path (REST
+    GETs, WebSocket handshakes and get_state).
+
+    A snapshot's version is the id of the newest room event (outbox row) it
+    reflects. Writers put their room's state right after committing
+    (cache_room_on_commit), versioned with the events they queued. The event
+    dispatcher reports every event it reads, from all instances, and
+    snapshots older than the event are dropped, so a room changed on another
+    instance is reloaded once its event reaches this one. Writers lock the
+    room row before queuing events, so a room's event ids grow in commit
+    order.
+
+    Misses load through room_loader; a loaded snapshot is only kept if no
+    event for the room was seen while it loaded. The periodic sync refreshes
+    snapshots of active rooms and broadcasts changes to connected players;
+    snapshots it finds outdated are counted as stale.
     """
 
     def __init__(self):
-        # room_code -> room state dict
-        self._games: dict[str, dict[str, Any]] = {}
+        # room_code -> room state dict, least recently used first
+        self._games: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # room_code -> version (room event id) of the cached snapshot
+        self._versions: dict[str, int] = {}
+        # room_code -> newest event id seen, for rooms cached or being loaded
+        self._seen: dict[str, int] = {}
+        # room_code -> number of loads in progress
+        self._loading: dict[str, int] = {}
+        self._max_size = settings.room_snapshot_cache_size
         self._running = False
         self._interval = 0.5  # seconds
         self._connection_manager = None
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._hits = 0
+        self._misses = 0
+        self._write_throughs = 0
+        self._invalidations = 0
+        self._stale_repairs = 0
+        self._staleness_total = 0.0
+        self._staleness_max = 0.0
 
     def set_connection_manager(self, manager):
         """Set the connection manager for broadcasting."""
@@ -81,13 +151,100 @@ class GamesStorage:
         """Get cached game state."""
         return self._games.get(room_code)
 
-    def set_game(self, room_code: str, state: dict[str, Any]):
-        """Update cached game state."""
-        self._games[room_code] = state
+    async def load_game(self, room_code: str) -> dict[str, Any] | None:
+        """Room state from the cache, loaded from the database on a miss."""
+        from src.services.room_loader import room_loader
+
+        state = self._games.get(room_code)
+        if state is not None:
+            self._hits += 1
+            self._games.move_to_end(room_code)
+            return state
+
+        self._misses += 1
+        version = self._seen.get(room_code, 0)
+        self._loading[room_code] = self._loading.get(room_code, 0) + 1
+        try:
+            state = await room_loader.load(room_code)
+        finally:
+            self._loading[room_code] -= 1
+            if not self._loading[room_code]:
+                del self._loading[room_code]
+
+        if state is not None and self._seen.get(room_code, 0) == version:
+            self._store(room_code, state, version)
+        else:
+            self._forget_seen(room_code)
+        return state
+
+    def put(self, room_code: str, state: dict[str, Any], version: int):
+        """Write-through: cache a committed state, unless a newer one is cached."""
+        if version < self._versions.get(room_code, -1):
+            return
+        self._write_throughs += 1
+        self._store(room_code, state, version)
+
+    def invalidate(self, room_code: str, event_id: int, created_at: datetime | None = None):
+        """A room event was committed: drop the room's snapshot if it is older."""
+        if room_code in self._games or room_code in self._loading:
+            self._seen[room_code] = max(self._seen.get(room_code, 0), event_id)
+
+        version = self._versions.get(room_code)
+        if version is None or event_id <= version:
+            return
+        self.remove_game(room_code)
+        self._invalidations += 1
+        if created_at is not None:
+            staleness = max((utc_now() - created_at).total_seconds(), 0.0)
+            self._staleness_total += staleness
+            self._staleness_max = max(self._staleness_max, staleness)
 
     def remove_game(self, room_code: str):
         """Remove game from cache."""
         self._games.pop(room_code, None)
+        self._versions.pop(room_code, None)
+        self._forget_seen(room_code)
+
+    def clear(self):
+        """Drop every snapshot and reset the metrics."""
+        self._games.clear()
+        self._versions.clear()
+        self._seen.clear()
+        self._reset_stats()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Cache metrics: hit ratio of reads, and staleness, i.e. how long
+        snapshots were served after their room changed (from commit of the
+        newer event to its invalidation here).
+        """
+        reads = self._hits + self._misses
+        return {
+            "entries": len(self._games),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / reads if reads else None,
+            "write_throughs": self._write_throughs,
+            "invalidations": self._invalidations,
+            "stale_repairs": self._stale_repairs,
+            "avg_staleness_seconds": (
+                self._staleness_total / self._invalidations if self._invalidations else None
+            ),
+            "max_staleness_seconds": self._staleness_max,
+        }
+
+    def _store(self, room_code: str, state: dict[str, Any], version: int):
+        self._games[room_code] = state
+        self._games.move_to_end(room_code)
+        self._versions[room_code] = version
+        self._seen[room_code] = max(self._seen.get(room_code, 0), version)
+        while len(self._games) > self._max_size:
+            oldest = next(iter(self._games))
+            self.remove_game(oldest)
+
+    def _forget_seen(self, room_code: str):
+        if room_code not in self._games and room_code not in self._loading:
+            self._seen.pop(room_code, None)
 
     async def start(self):
         """Start the periodic sync loop."""
@@ -111,11 +268,11 @@ class GamesStorage:
         connected_room_codes = self.get_room_codes_with_connections()
         
         if not connected_room_codes:
-            # No active connections, clear cache
-            self._games.clear()
+            # Nobody to broadcast to; dispatched events keep the cache current
             return
 
         one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        seen_before = dict(self._seen)
 
         async with async_session_maker() as session:
             # Fetch rooms that:
@@ -123,8 +280,7 @@ class GamesStorage:
             # 2. Were updated within the last hour
             # 3. Have active WebSocket connections
             result = await session.execute(
-                select(Room)
-                .options(selectinload(Room.players), selectinload(Room.rounds))
+                select_room_with_current_round()
                 .where(
                     or_(
                         Room.status.in_([RoomStatus.WAITING, RoomStatus.PLAYING]),
@@ -133,18 +289,24 @@ class GamesStorage:
                     )
                 )
             )
-            rooms = result.scalars().all()
+            rooms = result.unique().scalars().all()
 
         # Process each room
         rooms_to_broadcast: list[tuple[str, dict[str, Any]]] = []
         
         for room in rooms:
+            if self._seen.get(room.code, 0) != seen_before.get(room.code, 0):
+                # Changed while we were reading; the newer state wins
+                continue
+
             new_state = _build_room_dict(room)
             old_state = self._games.get(room.code)
             
             # Check if state changed
             if old_state != new_state:
-                self._games[room.code] = new_state
+                if old_state is not None:
+                    self._stale_repairs += 1
+                self._store(room.code, new_state, self._seen.get(room.code, 0))
                 
                 # Only broadcast if there are active connections for this room
                 if room.code in connected_room_codes:
@@ -154,7 +316,7 @@ class GamesStorage:
         current_room_codes = {r.code for r in rooms}
         for code in list(self._games.keys()):
             if code not in current_room_codes and code not in connected_room_codes:
-                del self._games[code]
+                self.remove_game(code)
 
         # Broadcast changes
         for room_code, state in rooms_to_broadcast:
@@ -168,10 +330,31 @@ class GamesStorage:
         await self._connection_manager.broadcast_to_room(
             room_code,
             "room_state",
-            {"room": state},
+            build_room_state_payload(state),
         )
 
 
+def cache_room_on_commit(session: AsyncSession, room: Room):
+    """
+    Write the room's state through to games_storage once the session commits.
+
+    Call after queuing the transaction's events for the room: the snapshot is
+    versioned with the newest of them. Nothing is cached without an event,
+    since other instances would not know to drop their copy.
+    """
+    room_events = [e for e in session.info.get("room_events", []) if e.room_code == room.code]
+    if not room_events:
+        return
+
+    def put(sync_session):
+        # Events of a rolled back attempt in the same session are not persistent
+        committed = [e.id for e in room_events if inspect(e).persistent]
+        if committed:
+            games_storage.put(room.code, _build_room_dict(room), max(committed))
+
+    event.listen(session.sync_session, "after_commit", put, once=True)
+
+
 # Global instance
 games_storage = GamesStorage()
 
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models import IdempotencyKey
+
+
+class IdempotencyKeyReused(Exception):
+    """The Idempotency-Key was already used for a different request."""
+
+
+@dataclass(frozen=True)
+class IdempotentRequest:
+    """An action request sent with an Idempotency-Key header."""
+
+    room_code: str
+    player_id: int
+    key: str
+    request_hash: str
+
+    @classmethod
+    def from_request(
+        cls, room_code: str, player_id: int, key: str, request: dict[str, Any]
+    ) -> "IdempotentRequest":
+        body = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return cls(room_code, player_id, key, hashlib.sha256(body.encode()).hexdigest())
+
+    @property
+    def scope(self) -> tuple[str, int, str]:
+        # Keys are per player and room, so a key can't replay another player's response
+        return self.room_code, self.player_id, self.key
+
+
+class IdempotencyStore:
+    """
+    Responses of actions sent with an Idempotency-Key, so a retried request
+    gets the original response without touching the room again.
+
+    The idempotency_keys table is the source of truth: claim() inserts the
+    key in the action's transaction before the room is locked, and record()
+    stores the response in that same transaction. A retry racing the
+    original waits on the key's row until the original commits, then
+    replays its response; if the original rolled back, the retry runs the
+    action itself. Failed requests (errors raised before commit) leave no
+    key behind, so they can be retried with the same key.
+
+    Committed responses are also kept in a bounded in-memory table (LRU, up
+    to `idempotency_cache_size` entries) that answers retries reaching this
+    instance without a query. Entries expire with the table rows, after
+    `idempotency_key_retention_minutes`.
+    """
+
+    def __init__(self):
+        # (room_code, player_id, key) -> (request_hash, response, stored at)
+        self._responses: OrderedDict[tuple[str, int, str], tuple[str, dict[str, Any], float]] = (
+            OrderedDict()
+        )
+        self._max_size = settings.idempotency_cache_size
+        self._ttl = settings.idempotency_key_retention_minutes * 60
+
+    def get(self, request: IdempotentRequest) -> dict[str, Any] | None:
+        """
+        The response stored in memory for the request's key, if any.
+
+        Raises IdempotencyKeyReused if the key was used for another request.
+        """
+        entry = self._responses.get(request.scope)
+        if entry is None:
+            return None
+        request_hash, response, stored_at = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._responses[request.scope]
+            return None
+        if request_hash != request.request_hash:
+            raise IdempotencyKeyReused(request.key)
+        self._responses.move_to_end(request.scope)
+        return response
+
+    async def claim(self, session: AsyncSession, request: IdempotentRequest) -> dict[str, Any] | None:
+        """
+        Reserve the request's key in the session's transaction.
+
+        Returns the stored response if the key was already used (waiting for
+        a request still in flight with it), or None if the caller should run
+        the action and record() its response before committing. Raises
+        IdempotencyKeyReused if the key was used for another request.
+        """
+        result = await session.execute(
+            insert(IdempotencyKey)
+            .values(
+                room_code=request.room_code,
+                player_id=request.player_id,
+                key=request.key,
+                request_hash=request.request_hash,
+            )
+            .on_conflict_do_nothing()
+            .returning(IdempotencyKey.key)
+        )
+        if result.first() is not None:
+            return None
+
+        stored = (
+            await session.execute(
+                select(IdempotencyKey.request_hash, IdempotencyKey.response).where(
+                    IdempotencyKey.room_code == request.room_code,
+                    IdempotencyKey.player_id == request.player_id,
+                    IdempotencyKey.key == request.key,
+                )
+            )
+        ).one()
+        if stored.request_hash != request.request_hash:
+            raise IdempotencyKeyReused(request.key)
+        if stored.response is not None:
+            self._remember(request, stored.response)
+        return stored.response
+
+    async def record(
+        self, session: AsyncSession, request: IdempotentRequest, response: dict[str, Any]
+    ):
+        """Store the response for a claimed key; kept in memory once the session commits."""
+        await session.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.room_code == request.room_code,
+                IdempotencyKey.player_id == request.player_id,
+                IdempotencyKey.key == request.key,
+            )
+            .values(response=response)
+        )
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _: self._remember(request, response),
+            once=True,
+        )
+
+    def clear(self):
+        """Drop the in-memory responses."""
+        self._responses.clear()
+
+    def _remember(self, request: IdempotentRequest, response: dict[str, Any]):
+        self._responses[request.scope] = (request.request_hash, response, time.monotonic())
+        self._responses.move_to_end(request.scope)
+        while len(self._responses) > self._max_size:
+            self._responses.popitem(last=False)
+
+
+# Global instance
+idempotency_store = IdempotencyStore()
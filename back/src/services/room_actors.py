@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db import async_session_maker
+from src.models import Room, RoomStatus
+from src.services.room_service import lock_rooms_with_current_round
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Handler run by a room actor: gets the in-memory room (None if it does not
+# exist) and the actor's session
+RoomHandler = Callable[[Room | None, AsyncSession], Awaitable[T]]
+
+# Tells the actor loop to finish what is queued and exit
+_STOP = object()
+
+
+class RoomActorClosed(Exception):
+    """The actor has stopped accepting messages (idle, room over or shutdown)."""
+
+
+class RoomActor:
+    """
+    Owns one room: an asyncio task that applies handlers from its mailbox one
+    at a time, in arrival order, so actions on a room never race each other.
+
+    Queued messages are handled in batches of up to `room_actor_max_batch`.
+    Each batch locks and loads the room (players and current round) once, runs every
+    handler on that copy in its own savepoint and commits once (group commit).
+    Callers get their result only after the commit; if the commit fails, the
+    whole batch fails.
+
+    A handler that raises only rolls back its own savepoint; the room is
+    reloaded for the next handler. Row lock plus reload per batch keeps the
+    copy in line with other writers (cleanup job, legacy endpoints, a timer
+    or actor on another instance).
+
+    The actor exits when it has been idle for `room_actor_idle_timeout`
+    seconds or once the room is no longer WAITING/PLAYING.
+    """
+
+    def __init__(self, room_code: str, registry: "RoomActorRegistry"):
+        self.room_code = room_code
+        self.closed = False
+        self._registry = registry
+        self._mailbox: asyncio.Queue = asyncio.Queue(maxsize=settings.room_actor_mailbox_size)
+        self._idle_timeout = settings.room_actor_idle_timeout
+        self._max_batch = settings.room_actor_max_batch
+        self._room: Room | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """Start the actor task."""
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(self, handler: RoomHandler[T]) -> T:
+        """Queue a handler and wait for its result (available once committed)."""
+        if self.closed:
+            raise RoomActorClosed(self.room_code)
+        future = asyncio.get_running_loop().create_future()
+        await self._mailbox.put((handler, future))
+        return await future
+
+    async def stop(self):
+        """Stop taking messages, process and commit the queued ones, then exit."""
+        if self._task is None:
+            return
+        if not self.closed:
+            self.closed = True
+            await self._mailbox.put(_STOP)
+        await self._task
+
+    async def _run(self):
+        try:
+            async with async_session_maker() as session:
+                while not (self.closed and self._mailbox.empty()):
+                    if self._mailbox.empty():
+                        try:
+                            message = await asyncio.wait_for(
+                                self._mailbox.get(), self._idle_timeout
+                            )
+                        except asyncio.TimeoutError:
+                            # Messages that raced the timeout are still handled
+                            self.closed = True
+                            continue
+                    else:
+                        message = self._mailbox.get_nowait()
+                    if message is _STOP:
+                        break
+
+                    batch = [message]
+                    while len(batch) < self._max_batch and not self._mailbox.empty():
+                        message = self._mailbox.get_nowait()
+                        if message is _STOP:
+                            # FIFO: nothing was queued after it
+                            self._mailbox.put_nowait(_STOP)
+                            break
+                        batch.append(message)
+
+                    await self._process_batch(session, batch)
+
+                    if self._room is None or self._room.status not in (
+                        RoomStatus.WAITING,
+                        RoomStatus.PLAYING,
+                    ):
+                        # Room is over: answer what is already queued, then exit
+                        self.closed = True
+        finally:
+            self.closed = True
+            self._registry._remove(self)
+            # Callers that got in after the stop are retried on a new actor
+            while not self._mailbox.empty():
+                message = self._mailbox.get_nowait()
+                if message is not _STOP and not message[1].done():
+                    message[1].set_exception(RoomActorClosed(self.room_code))
+
+    async def _process_batch(self, session: AsyncSession, batch: list[tuple]):
+        """Run each handler in its own savepoint, commit, then answer the callers."""
+        results: list[tuple[asyncio.Future, object]] = []
+        try:
+            await self._load(session)
+            for handler, future in batch:
+                if future.cancelled():
+                    continue
+                try:
+                    async with session.begin_nested():
+                        result = await handler(self._room, session)
+                except Exception as e:
+                    future.set_exception(e)
+                    # The savepoint rollback expired what the handler touched
+                    await self._load(session)
+                    continue
+                results.append((future, result))
+            await session.commit()
+        except Exception as e:
+            logger.exception(f"Room actor {self.room_code} failed to persist a batch: {e}")
+            await session.rollback()
+            self._room = None
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in results:
+            if not future.done():
+                future.set_result(result)
+
+    async def _load(self, session: AsyncSession):
+        """Lock the room row for the batch and refresh the in-memory copy."""
+        rooms = await lock_rooms_with_current_round(session, Room.code == self.room_code)
+        self._room = rooms[0] if rooms else None
+
+
+class RoomActorRegistry:
+    """Running room actors on this instance, started on demand."""
+
+    def __init__(self):
+        self._actors: dict[str, RoomActor] = {}
+
+    def get(self, room_code: str) -> RoomActor | None:
+        """The running actor for a room, if any."""
+        actor = self._actors.get(room_code)
+        if actor is None or actor.closed:
+            return None
+        return actor
+
+    async def submit(self, room_code: str, handler: RoomHandler[T]) -> T:
+        """Run a handler on the room's actor, starting the actor if needed."""
+        while True:
+            actor = self.get(room_code)
+            if actor is None:
+                actor = RoomActor(room_code, self)
+                self._actors[room_code] = actor
+                actor.start()
+            try:
+                return await actor.submit(handler)
+            except RoomActorClosed:
+                # Closed between lookup and submit; start a fresh one
+                continue
+
+    async def stop(self):
+        """Stop every actor, committing what they have queued."""
+        await asyncio.gather(*(actor.stop() for actor in list(self._actors.values())))
+
+    def _remove(self, actor: RoomActor):
+        if self._actors.get(actor.room_code) is actor:
+            del self._actors[actor.room_code]
+
+
+# Global instance
+room_actors = RoomActorRegistry()
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.db import async_session_maker
+from src.models import RoomEvent
+from src.services.games_storage import games_storage
+
+logger = logging.getLogger(__name__)
+
+# Id jumps larger than this (e.g. sequence cache lost on a crash) are not
+# tracked as gaps
+MAX_TRACKED_GAP = 1000
+
+
+def add_room_event(
+    session: AsyncSession,
+    room_code: str,
+    event_type: str,
+    data: dict[str, Any],
+    exclude_player_id: int | None = None,
+) -> RoomEvent:
+    """
+    Queue a WebSocket event for a room in the current transaction.
+
+    The event is only delivered if the transaction commits. On commit the
+    local dispatcher is woken up, so clients on this instance get the event
+    right away; other instances pick it up on their next poll.
+    """
+    room_event = RoomEvent(
+        room_code=room_code,
+        event=event_type,
+        data=data,
+        exclude_player_id=exclude_player_id,
+    )
+    session.add(room_event)
+
+    # Events of the transaction, also used to version cached room snapshots
+    if "room_events" not in session.info:
+        session.info["room_events"] = []
+
+        def wake_dispatcher(sync_session):
+            sync_session.info.pop("room_events", None)
+            room_event_dispatcher.notify()
+
+        event.listen(session.sync_session, "after_commit", wake_dispatcher, once=True)
+    session.info["room_events"].append(room_event)
+
+    return room_event
+
+
+class RoomEventDispatcher:
+    """
+    Tails the room_events outbox and pushes events to local WebSocket clients.
+
+    Runs on every instance (each one serves its own sockets), starting after
+    the last event id handed out at startup. Events are read in id order in
+    batches; each room's events are sent one after another in that order,
+    while different rooms are sent concurrently.
+
+    Ids are taken when rows are inserted, not when they commit, so a slower
+    transaction can make an id show up after larger ones. A skipped id may
+    belong to any room, so events after it are held back until it shows up
+    and everything goes out in id order. Skipped ids are given up after
+    `gap_timeout` seconds (rolled back transactions leave gaps that never
+    fill), which releases the events held behind them.
+
+    `server_time` in a payload (top level or in its room) is stamped when the
+    event is sent, since clients use it to sync their clocks.
+    """
+
+    def __init__(self):
+        self._running = False
+        self._interval = settings.room_event_dispatch_interval
+        self._batch_size = settings.room_event_batch_size
+        self._gap_timeout = settings.room_event_gap_timeout
+        self._last_id: int | None = None
+        # Missing id -> time.monotonic() when we stop waiting for it
+        self._gaps: dict[int, float] = {}
+        # Events read but waiting for a smaller missing id, in id order
+        self._held: list[RoomEvent] = []
+        self._wakeup = asyncio.Event()
+        self._connection_manager = None
+
+    def set_connection_manager(self, manager):
+        """Set the connection manager for broadcasting."""
+        self._connection_manager = manager
+
+    def notify(self):
+        """Wake the dispatch loop (new events were committed)."""
+        self._wakeup.set()
+
+    async def start(self):
+        """Start the dispatch loop."""
+        self._running = True
+        logger.info(f"Starting RoomEventDispatcher (poll interval: {self._interval}s)")
+
+        while self._running:
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception as e:
+                logger.exception(f"Error in RoomEventDispatcher: {e}")
+                dispatched = 0
+
+            if dispatched < self._batch_size:
+                # Caught up: wait for a commit on this instance or the next poll
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    def stop(self):
+        """Stop the dispatch loop."""
+        self._running = False
+
+    async def dispatch_batch(self) -> int:
+        """Read the next batch of events and send them. Returns how many were read."""
+        async with async_session_maker() as session:
+            if self._last_id is None:
+                # Start from now; clients get the current state when they connect.
+                # Taken from the sequence, so ids burnt by rollbacks aren't gaps.
+                result = await session.execute(
+                    select(func.nextval(func.pg_get_serial_sequence("room_events", "id")))
+                )
+                self._last_id = result.scalar()
+                return 0
+
+            condition = RoomEvent.id > self._last_id
+            if self._gaps:
+                condition = or_(condition, RoomEvent.id.in_(list(self._gaps)))
+            result = await session.execute(
+                select(RoomEvent)
+                .where(condition)
+                .order_by(RoomEvent.id)
+                .limit(self._batch_size)
+            )
+            room_events = list(result.scalars().all())
+
+        for room_event in room_events:
+            games_storage.invalidate(room_event.room_code, room_event.id, room_event.created_at)
+        self._advance(room_events)
+        await self._send(self._release(room_events))
+        return len(room_events)
+
+    def _advance(self, room_events: list[RoomEvent]):
+        """Move the cursor past the batch and update the set of gaps."""
+        now = time.monotonic()
+        for room_event in room_events:
+            if room_event.id <= self._last_id:
+                self._gaps.pop(room_event.id, None)
+                continue
+
+            gap = room_event.id - self._last_id - 1
+            if gap > MAX_TRACKED_GAP:
+                logger.warning(f"Not waiting for {gap} missing room event ids")
+            else:
+                for missing_id in range(self._last_id + 1, room_event.id):
+                    self._gaps[missing_id] = now + self._gap_timeout
+            self._last_id = room_event.id
+
+        for missing_id, give_up_at in list(self._gaps.items()):
+            if give_up_at <= now:
+                del self._gaps[missing_id]
+
+    def _release(self, room_events: list[RoomEvent]) -> list[RoomEvent]:
+        """Events that can go out now: all those before the first missing id."""
+        pending = sorted(self._held + room_events, key=lambda room_event: room_event.id)
+        if not self._gaps:
+            self._held = []
+            return pending
+        first_gap = min(self._gaps)
+        self._held = [room_event for room_event in pending if room_event.id > first_gap]
+        return [room_event for room_event in pending if room_event.id < first_gap]
+
+    async def _send(self, room_events: list[RoomEvent]):
+        """Send events in order per room, rooms concurrently."""
+        if self._connection_manager is None:
+            return
+
+        by_room: dict[str, list[RoomEvent]] = {}
+        for room_event in room_events:
+            if room_event.room_code in self._connection_manager.connections:
+                by_room.setdefault(room_event.room_code, []).append(room_event)
+
+        await asyncio.gather(
+            *(self._send_room(room_code, events) for room_code, events in by_room.items())
+        )
+
+    async def _send_room(self, room_code: str, room_events: list[RoomEvent]):
+        for room_event in room_events:
+            await self._connection_manager.broadcast_to_room(
+                room_code,
+                room_event.event,
+                _stamp_server_time(room_event.data),
+                exclude_player_id=room_event.exclude_player_id,
+            )
+
+
+def _stamp_server_time(data: dict[str, Any]) -> dict[str, Any]:
+    """Copy of an event payload with server_time set to the send time."""
+    has_room_time = isinstance(data.get("room"), dict) and "server_time" in data["room"]
+    if "server_time" not in data and not has_room_time:
+        return data
+
+    server_time = datetime.now(timezone.utc).isoformat()
+    data = dict(data)
+    if "server_time" in data:
+        data["server_time"] = server_time
+    if has_room_time:
+        data["room"] = {**data["room"], "server_time": server_time}
+    return data
+
+
+# Global instance
+room_event_dispatcher = RoomEventDispatcher()
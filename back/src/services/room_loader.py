@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any
+
+from src.db.database import get_session_context
+from src.models import Room
+from src.services.games_storage import _build_room_dict
+from src.services.room_service import select_room_with_current_round
+
+
+class RoomLoader:
+    """
+    Loads room state dicts from the database for read paths (REST GETs,
+    WebSocket handshakes and get_state), sharing one query among all
+    concurrent callers for the same room (single flight). When a round ends
+    and every client asks for the room at once, that is one query per room
+    instead of one per client.
+
+    A caller that joins a fetch already in flight gets that fetch's result,
+    which may predate a write committed just before the call.
+    """
+
+    def __init__(self):
+        # room_code -> in-flight fetch
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+    async def load(self, room_code: str) -> dict[str, Any] | None:
+        """The room's state dict (see _build_room_dict), or None if it doesn't exist."""
+        future = self._inflight.get(room_code)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(room_code))
+            self._inflight[room_code] = future
+            future.add_done_callback(lambda done: self._forget(room_code, done))
+        # A caller going away must not cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, room_code: str, future: asyncio.Future):
+        if self._inflight.get(room_code) is future:
+            del self._inflight[room_code]
+
+    async def _fetch(self, room_code: str) -> dict[str, Any] | None:
+        async with get_session_context() as session:
+            result = await session.execute(
+                select_room_with_current_round().where(Room.code == room_code)
+            )
+            room = result.unique().scalar_one_or_none()
+        return _build_room_dict(room) if room is not None else None
+
+
+# Global instance
+room_loader = RoomLoader()
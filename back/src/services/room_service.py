@@ -1,30 +1,87 @@
 import random
-from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import Select, and_, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.games.registry import game_registry
+from src.games.timing import get_between_rounds_delay, get_round_duration, utc_now
 from src.models import Room, RoomStatus, Player, GameRound, RoundStatus
 
 
+# Points by rank among players who guessed: 1st = 10, 2nd = 5, 3rd = 3, rest = 1
+POINTS_TABLE = [10, 5, 3]
+DEFAULT_POINTS = 1
+
+
+def current_round_join():
+    """Join condition for a room's current round."""
+    return and_(
+        GameRound.room_id == Room.id,
+        GameRound.round_number == Room.current_round_number,
+    )
+
+
+def select_room_with_current_round() -> Select:
+    """
+    SELECT rooms with their players and only their current round, in one
+    query (Room.rounds then holds just that round, or nothing before the game
+    starts), so loading a room does not grow with game length.
+
+    Rows repeat per player: read results with `.unique()`.
+    """
+    return (
+        select(Room)
+        .outerjoin(GameRound, current_round_join())
+        .options(joinedload(Room.players), contains_eager(Room.rounds))
+    )
+
+
+async def lock_rooms_with_current_round(
+    session: AsyncSession, *criteria, skip_locked: bool = False
+) -> list[Room]:
+    """
+    Lock the rooms matching `criteria` (in id order) for the rest of the
+    transaction, then load them with players and current round.
+
+    Takes two statements on purpose: a locking SELECT that had to wait for
+    another transaction re-reads the locked room row, but not rows joined to
+    it, so it could return the round and players as they were before that
+    transaction committed.
+    """
+    locked = await session.execute(
+        select(Room.id)
+        .where(*criteria)
+        .order_by(Room.id)
+        .with_for_update(skip_locked=skip_locked)
+    )
+    room_ids = list(locked.scalars().all())
+    if not room_ids:
+        return []
+
+    result = await session.execute(
+        select_room_with_current_round()
+        .where(Room.id.in_(room_ids))
+        .order_by(Room.id)
+        .execution_options(populate_existing=True)
+    )
+    return list(result.unique().scalars().all())
+
+
 class RoomService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def create_room(self, player_name: str) -> tuple[Room, Player]:
         """Create a new room and add the creator as host."""
-        room = Room()
-        self.session.add(room)
-        await self.session.flush()
-
         player = Player(
-            room_id=room.id,
             name=player_name,
             is_host=True,
         )
-        self.session.add(player)
+        # Collections set up front, so callers can use them without a reload
+        room = Room(players=[player], rounds=[])
+        self.session.add(room)
         await self.session.flush()
 
         room.host_id = player.id
@@ -35,11 +92,9 @@ class RoomService:
     async def get_room_by_code(self, code: str) -> Room | None:
         """Get room by code with players and current round loaded."""
         result = await self.session.execute(
-            select(Room)
-            .options(selectinload(Room.players), selectinload(Room.rounds))
-            .where(Room.code == code.upper())
+            select_room_with_current_round().where(Room.code == code.upper())
         )
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def join_room(self, code: str, player_name: str) -> tuple[Room, Player] | None:
         """Join an existing room. Returns None if room not found or game already started."""
@@ -77,26 +132,45 @@ class RoomService:
         return game_round
 
     async def _create_round(self, room: Room) -> GameRound:
-        """Create a new game round with random target number."""
+        """Create the current round with a random target and reset guesses."""
         game_settings = game_registry.get_settings(room.game_type)
         min_target = game_settings.get("min_target", 1)
         max_target = game_settings.get("max_target", 100)
-        target = random.randint(min_target, max_target)
+        started_at = utc_now()
 
         game_round = GameRound(
             round_number=room.current_round_number,
-            target_number=target,
+            target_number=random.randint(min_target, max_target),
             status=RoundStatus.ACTIVE,
+            started_at=started_at,
+            ends_at=started_at + get_round_duration(room),
         )
         room.rounds.append(game_round)
         await self.session.flush()
 
-        # Reset all player guesses
-        for player in room.players:
-            player.current_guess = None
+        # Reset all player guesses with one UPDATE
+        await self.session.execute(
+            update(Player).where(Player.room_id == room.id).values(current_guess=None)
+        )
 
         return game_round
 
+    async def start_next_round(self, room: Room) -> GameRound:
+        """Advance a playing room to its next round."""
+        await self._clear_next_round_at(room)
+        room.current_round_number += 1
+        return await self._create_round(room)
+
+    async def finish_game(self, room: Room):
+        """Mark a room as FINISHED."""
+        await self._clear_next_round_at(room)
+        room.status = RoomStatus.FINISHED
+
+    async def _clear_next_round_at(self, room: Room):
+        """Drop the between-rounds deadline once it has been handled."""
+        for game_round in room.rounds:
+            game_round.next_round_at = None
+
     async def submit_guess(self, room: Room, player_id: int, guess: int) -> bool:
         """Submit a guess for the current round. Returns True if successful."""
         if room.status != RoomStatus.PLAYING:
@@ -120,45 +194,109 @@ class RoomService:
                 return r
         return None
 
-    async def finish_round(self, room: Room) -> list[dict]:
-        """Finish the current round, calculate scores, and return results."""
+    async def finish_round(self, room: Room) -> list[dict] | None:
+        """
+        Finish the current round, score it and return the results.
+
+        The round is only finished if it is still ACTIVE in the database, so
+        concurrent finishers (the timer job and the last guess) never score
+        the same round twice. Returns None if there was no active round,
+        including one finished concurrently by someone else.
+        """
         current_round = self._get_current_round(room)
         if current_round is None:
-            return []
+            return None
 
-        current_round.status = RoundStatus.FINISHED
-        current_round.finished_at = datetime.now(timezone.utc)
+        now = utc_now()
+        next_round_at = now + get_between_rounds_delay(room)
 
-        target = current_round.target_number
-        results = []
+        # Conditional transition: blocks on a concurrent finisher's row lock,
+        # then skips the round once that transaction has committed
+        result = await self.session.execute(
+            update(GameRound)
+            .where(
+                GameRound.id == current_round.id,
+                GameRound.status == RoundStatus.ACTIVE,
+            )
+            .values(
+                status=RoundStatus.FINISHED,
+                finished_at=now,
+                next_round_at=next_round_at,
+            )
+            .returning(GameRound.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
 
-        # Calculate distances and sort by closest
-        player_distances = []
-        for player in room.players:
-            if player.current_guess is not None:
-                distance = abs(player.current_guess - target)
-                player_distances.append((player, distance))
-            else:
-                player_distances.append((player, None))
-
-        # Sort by distance (None = didn't guess = worst)
-        player_distances.sort(key=lambda x: (x[1] is None, x[1] if x[1] is not None else 0))
-
-        # Award points: 1st place = 10, 2nd = 5, 3rd = 3, rest = 1 (if guessed)
-        points_table = [10, 5, 3]
-        for i, (player, distance) in enumerate(player_distances):
-            if distance is not None:
-                points = points_table[i] if i < len(points_table) else 1
-                player.score += points
-            else:
-                points = 0
+        set_committed_value(current_round, "status", RoundStatus.FINISHED)
+        set_committed_value(current_round, "finished_at", now)
+        set_committed_value(current_round, "next_round_at", next_round_at)
+
+        return await self._score_round(room, current_round.id)
+
+    async def _score_round(self, room: Room, round_id: int) -> list[dict]:
+        """
+        Rank guesses and award points for a finished round in one statement.
+
+        Players are ranked by distance to the target with a window function
+        (players without a guess last, ties broken by join order), and scores
+        are updated with a single UPDATE ... FROM (ranked) RETURNING. The
+        returned rows are the round results.
+        """
+        distance = func.abs(Player.current_guess - GameRound.target_number)
+        ranked = (
+            select(
+                Player.id.label("player_id"),
+                distance.label("distance"),
+                func.row_number()
+                .over(order_by=(distance.asc().nulls_last(), Player.id))
+                .label("rank"),
+            )
+            .join(GameRound, GameRound.room_id == Player.room_id)
+            .where(GameRound.id == round_id)
+            .subquery("ranked")
+        )
+        points = case(
+            (ranked.c.distance.is_(None), 0),
+            *(
+                (ranked.c.rank == rank, pts)
+                for rank, pts in enumerate(POINTS_TABLE, start=1)
+            ),
+            else_=DEFAULT_POINTS,
+        )
+
+        result = await self.session.execute(
+            update(Player)
+            .where(Player.id == ranked.c.player_id)
+            .values(score=Player.score + points)
+            .returning(
+                Player.id,
+                Player.name,
+                Player.current_guess,
+                Player.score,
+                ranked.c.distance,
+                ranked.c.rank,
+                points.label("points_earned"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(result.all(), key=lambda row: row.rank)
+
+        # Keep loaded players in sync without issuing another UPDATE on flush
+        players_by_id = {p.id: p for p in room.players}
+        results = []
+        for row in rows:
+            player = players_by_id.get(row.id)
+            if player is not None:
+                set_committed_value(player, "score", row.score)
 
             results.append({
-                "player_id": player.id,
-                "player_name": player.name,
-                "guess": player.current_guess,
-                "distance": distance,
-                "points_earned": points,
+                "player_id": row.id,
+                "player_name": row.name,
+                "guess": row.current_guess,
+                "distance": row.distance,
+                "points_earned": row.points_earned,
             })
 
         return results
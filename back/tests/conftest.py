@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from testcontainers.postgres import PostgresContainer
 
 from src.db.base import Base
-from src.models import Room, Player, GameRound  # noqa: F401 - Register models
+from src.models import Room, Player, GameRound, RoomEvent, IdempotencyKey  # noqa: F401 - Register models
 
 
 @pytest.fixture(scope="session")
@@ -85,6 +85,16 @@ def setup_game_registry(games_config_path):
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_room_snapshots():
+    """Start every test with an empty room snapshot cache."""
+    from src.services import games_storage
+
+    games_storage.clear()
+    yield
+    games_storage.clear()
+
+
 @pytest_asyncio.fixture
 async def client(test_engine, monkeypatch, setup_game_registry) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client with mocked database."""
@@ -0,0 +1,62 @@
+"""Tests for the in-memory DeadlineQueue."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.jobs.deadlines import DeadlineQueue
+
+
+class TestDeadlineQueue:
+    """Tests for DeadlineQueue."""
+
+    def test_pop_due_returns_only_due_keys_in_order(self):
+        """Should pop due keys earliest first and keep the rest."""
+        now = datetime.now(timezone.utc)
+        queue = DeadlineQueue()
+        queue.schedule("LATER", now + timedelta(seconds=10))
+        queue.schedule("SECOND", now - timedelta(seconds=1))
+        queue.schedule("FIRST", now - timedelta(seconds=5))
+
+        assert queue.pop_due(now) == ["FIRST", "SECOND"]
+        assert len(queue) == 1
+        assert queue.next_due() == now + timedelta(seconds=10)
+
+    def test_reschedule_replaces_previous_deadline(self):
+        """Should only keep the latest deadline for a key."""
+        now = datetime.now(timezone.utc)
+        queue = DeadlineQueue()
+        queue.schedule("ROOM", now - timedelta(seconds=1))
+        queue.schedule("ROOM", now + timedelta(seconds=30))
+
+        assert queue.pop_due(now) == []
+        assert queue.get("ROOM") == now + timedelta(seconds=30)
+
+    def test_cancel_and_clear(self):
+        """Should drop cancelled keys and empty the queue on clear."""
+        now = datetime.now(timezone.utc)
+        queue = DeadlineQueue()
+        queue.schedule("A", now)
+        queue.schedule("B", now)
+
+        queue.cancel("A")
+        assert "A" not in queue
+        assert queue.pop_due(now) == ["B"]
+
+        queue.schedule("C", now)
+        queue.clear()
+        assert queue.next_due() is None
+
+    async def test_wait_returns_immediately_when_woken(self):
+        """Should not sleep when an earlier deadline was scheduled."""
+        queue = DeadlineQueue()
+        queue.schedule("ROOM", datetime.now(timezone.utc) + timedelta(hours=1))
+
+        # Scheduling sets the wake-up flag, so this returns without waiting
+        await queue.wait(max_wait=3600)
+
+    async def test_wait_returns_when_deadline_passed(self):
+        """Should not sleep when the earliest deadline is already due."""
+        queue = DeadlineQueue()
+        queue.schedule("ROOM", datetime.now(timezone.utc) - timedelta(seconds=1))
+        await queue.wait(max_wait=0)  # consume wake-up flag
+
+        await queue.wait(max_wait=3600)
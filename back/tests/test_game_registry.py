@@ -1,5 +1,6 @@
 """Tests for game registry and configuration."""
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -227,6 +228,49 @@ class TestGameRegistry:
         assert registry.is_game_enabled("disabled_game") is False
         assert registry.is_game_enabled("nonexistent") is False
 
+    def test_info_response_is_built_once(self, tmp_path: Path, monkeypatch):
+        """Games info should be encoded once, then again only after config changes."""
+        from src.games.guess_number import GuessNumberGame
+
+        config = {
+            "games": {
+                "guess_number": {
+                    "enabled": True,
+                    "default": True,
+                    "display_name": "Guess the Number",
+                }
+            }
+        }
+        config_file = tmp_path / "games.yaml"
+        config_file.write_text(yaml.dump(config))
+        registry = GameRegistry()
+        registry.load_config(config_file)
+        registry.register(GuessNumberGame())
+        registry.validate_registration()
+        builds = 0
+        get_all_games_info = registry.get_all_games_info
+
+        def counting_get_all_games_info():
+            nonlocal builds
+            builds += 1
+            return get_all_games_info()
+
+        monkeypatch.setattr(registry, "get_all_games_info", counting_get_all_games_info)
+
+        body, etag = registry.get_info_response()
+        assert registry.get_info_response() == (body, etag)
+        assert builds == 0  # Built by validate_registration
+        assert json.loads(body)["games"][0]["display_name"] == "Guess the Number"
+
+        config["games"]["guess_number"]["display_name"] = "Number Guess"
+        config_file.write_text(yaml.dump(config))
+        registry.load_config(config_file)
+        new_body, new_etag = registry.get_info_response()
+
+        assert builds == 1
+        assert new_etag != etag
+        assert json.loads(new_body)["games"][0]["display_name"] == "Number Guess"
+
 
 class TestGuessNumberGame:
     """Tests for GuessNumberGame implementation."""
@@ -0,0 +1,626 @@
+"""Tests for GameTimerJob and the guess_number deadline hooks."""
+
+import asyncio
+import importlib
+from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.games.guess_number import GuessNumberGame
+from src.games.guess_number.game import all_players_voted
+from src.games.registry import game_registry
+from src.games.timer import GameTimerJob, get_timed_game_types
+from src.games.timing import get_next_round_at, get_round_ends_at
+from src.jobs.deadlines import DeadlineQueue
+from src.models import Room, RoomEvent, RoomStatus, GameRound, RoundStatus
+from src.services.room_actors import room_actors
+from src.services.room_service import RoomService
+
+
+async def get_room_events(session: AsyncSession, room_code: str) -> list[RoomEvent]:
+    """Outbox events queued for a room, oldest first."""
+    await session.flush()
+    result = await session.execute(
+        select(RoomEvent).where(RoomEvent.room_code == room_code).order_by(RoomEvent.id)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.fixture
+def room_sessions(session, monkeypatch):
+    """Run the timer's per-room transactions on the test connection."""
+    maker = async_sessionmaker(
+        bind=session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr("src.games.timer.async_session_maker", maker)
+    return maker
+
+
+class TestGameTimerJob:
+    """Tests for GameTimerJob with guess_number rooms."""
+
+    @pytest.mark.asyncio
+    async def test_all_players_voted_returns_true_when_all_guessed(self, session):
+        """Should return True when all players have submitted guesses."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Both players have guessed
+        player1.current_guess = 50
+        player2.current_guess = 75
+
+        assert all_players_voted(room) is True
+
+    @pytest.mark.asyncio
+    async def test_all_players_voted_returns_false_when_not_all_guessed(
+        self, session
+    ):
+        """Should return False when not all players have submitted guesses."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Only one player has guessed
+        player1.current_guess = 50
+        player2.current_guess = None
+
+        assert all_players_voted(room) is False
+
+    @pytest.mark.asyncio
+    async def test_all_players_voted_returns_false_for_empty_players(
+        self, session
+    ):
+        """Should return False when room has no players."""
+        # Create a mock room with empty players list
+        room = Room()
+        room.players = []
+
+        assert all_players_voted(room) is False
+
+    @pytest.mark.asyncio
+    async def test_finish_round_broadcasts_results(self, session):
+        """Should broadcast round results when finishing a round."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game and submit guesses
+        await service.start_game(room, player1.id)
+        player1.current_guess = 50
+        player2.current_guess = 75
+
+        # Get the current round
+        game_round = room.rounds[0]
+
+        await GuessNumberGame().on_deadline(room, session)
+
+        # Should queue ROUND_FINISHED
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_finished"]
+        assert events[0].data["round_number"] == game_round.round_number
+
+    @pytest.mark.asyncio
+    async def test_round_finishes_early_when_all_voted(self, session):
+        """Should finish round immediately when all players have voted."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game
+        await service.start_game(room, player1.id)
+
+        # Submit guesses (all players voted)
+        player1.current_guess = 50
+        player2.current_guess = 75
+        await session.flush()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        await job.process_room(session, room)
+
+        # Round should be finished despite time not expiring
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_finished"]
+
+    @pytest.mark.asyncio
+    async def test_round_does_not_finish_early_when_not_all_voted(self, session):
+        """Should NOT finish round early when not all players have voted."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game
+        await service.start_game(room, player1.id)
+
+        # Only one player has voted
+        player1.current_guess = 50
+        player2.current_guess = None
+        await session.flush()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+
+        await job.process_room(session, room)
+
+        # Round should NOT be finished yet
+        assert await get_room_events(session, room.code) == []
+
+    @pytest.mark.asyncio
+    async def test_next_round_starts_after_delay(self, session):
+        """Should start next round after between_rounds_delay_seconds."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game and finish first round
+        await service.start_game(room, player1.id)
+        player1.current_guess = 50
+        player2.current_guess = 75
+
+        # Finish the round
+        await service.finish_round(room)
+        await session.flush()
+
+        # Set finished_at to be enough time ago
+        game_round = room.rounds[0]
+        game_settings = game_registry.get_settings(room.game_type)
+        between_rounds_delay = game_settings.get("between_rounds_delay_seconds", 5)
+        game_round.finished_at = datetime.now(timezone.utc) - timedelta(
+            seconds=between_rounds_delay + 1
+        )
+        game_round.next_round_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.flush()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+
+        await job.process_room(session, room)
+
+        # Should queue ROUND_STARTED
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_started"]
+
+        # Should carry the round deadline and the server clock
+        payload = events[0].data
+        started_at = datetime.fromisoformat(payload["started_at"])
+        ends_at = datetime.fromisoformat(payload["ends_at"])
+        round_duration = game_settings.get("round_duration_seconds", 30)
+        assert ends_at - started_at == timedelta(seconds=round_duration)
+        assert "server_time" in payload
+
+    @pytest.mark.asyncio
+    async def test_finish_round_broadcasts_next_round_at(self, session):
+        """Should tell clients when the next round starts."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        await service.start_game(room, player1.id)
+        player1.current_guess = 50
+        player2.current_guess = 75
+        game_round = room.rounds[0]
+
+
+        await GuessNumberGame().on_deadline(room, session)
+
+        payload = (await get_room_events(session, room.code))[-1].data
+        game_settings = game_registry.get_settings(room.game_type)
+        between_rounds_delay = game_settings.get("between_rounds_delay_seconds", 5)
+        next_round_at = datetime.fromisoformat(payload["next_round_at"])
+        assert next_round_at - game_round.finished_at == timedelta(
+            seconds=between_rounds_delay
+        )
+        assert "server_time" in payload
+
+    @pytest.mark.asyncio
+    async def test_next_round_does_not_start_before_delay(self, session):
+        """Should NOT start next round before delay has passed."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game and finish first round
+        await service.start_game(room, player1.id)
+        player1.current_guess = 50
+        player2.current_guess = 75
+
+        # Finish the round
+        await service.finish_round(room)
+        await session.flush()
+
+        # finished_at is now, so delay hasn't passed yet
+        job = GameTimerJob(deadlines=DeadlineQueue())
+
+        await job.process_room(session, room)
+
+        # Should NOT broadcast yet
+        assert await get_room_events(session, room.code) == []
+
+    @pytest.mark.asyncio
+    async def test_game_finishes_after_3_rounds(self, session):
+        """Should finish game after 3 rounds."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+
+        # Start game
+        await service.start_game(room, player1.id)
+
+        # Simulate completing 3 rounds
+        room.current_round_number = 3
+        game_round = room.rounds[0]
+        game_round.round_number = 3
+        game_round.status = RoundStatus.FINISHED
+        game_settings = game_registry.get_settings(room.game_type)
+        between_rounds_delay = game_settings.get("between_rounds_delay_seconds", 5)
+        game_round.finished_at = datetime.now(timezone.utc) - timedelta(
+            seconds=between_rounds_delay + 1
+        )
+        await session.flush()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+
+        await job.process_room(session, room)
+
+        # Should queue GAME_FINISHED, not ROUND_STARTED
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["game_finished"]
+
+        # Room status should be FINISHED
+        assert room.status == RoomStatus.FINISHED
+
+    @pytest.mark.asyncio
+    async def test_resync_schedules_active_round_deadline(self, session):
+        """Resync should queue the round end instead of finishing early."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        await session.flush()
+
+        deadlines = DeadlineQueue()
+        job = GameTimerJob(deadlines=deadlines)
+        job.interval_seconds = 60  # Resync horizon covers the round end
+
+        await job.execute(session)
+
+        assert await get_room_events(session, room.code) == []
+        assert deadlines.get(room.code) == get_round_ends_at(room, room.rounds[0])
+
+    @pytest.mark.asyncio
+    async def test_resync_finishes_round_everyone_answered(self, session, room_sessions):
+        """A round whose last answer did not finish it should be finished on resync."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        # E.g. both guesses came through the legacy API
+        await service.submit_guess(room, player1.id, 10)
+        await service.submit_guess(room, player2.id, 20)
+        game_round = room.rounds[0]
+        await session.flush()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        job.room_concurrency = 1  # One connection in tests
+
+        await job.execute(session)
+
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_finished"]
+        await session.refresh(game_round)
+        assert game_round.status == RoundStatus.FINISHED
+
+    @pytest.mark.asyncio
+    async def test_due_room_is_processed_from_queue(self, session, room_sessions):
+        """Should finish a round when its queued deadline comes up."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        game_round = room.rounds[0]
+        await session.flush()
+
+        deadlines = DeadlineQueue()
+        job = GameTimerJob(deadlines=deadlines)
+        job.room_concurrency = 1  # One connection in tests
+        await job.execute(session)  # initial resync
+
+        # Round time is up
+        game_round.ends_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.flush()
+        deadlines.schedule(room.code, datetime.now(timezone.utc))
+
+        await job.execute(session)
+
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_finished"]
+        await session.refresh(game_round)
+        assert game_round.status == RoundStatus.FINISHED
+        # Next transition is queued
+        assert deadlines.get(room.code) == get_next_round_at(room, game_round)
+
+    @pytest.mark.asyncio
+    async def test_due_room_goes_through_its_local_actor(
+        self, session, room_sessions, monkeypatch
+    ):
+        """A room with a running actor should get its deadline queued behind its actions."""
+        monkeypatch.setattr(
+            importlib.import_module("src.services.room_actors"),
+            "async_session_maker",
+            room_sessions,
+        )
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        room.rounds[0].ends_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.commit()
+
+        async def noop(actor_room, actor_session):
+            pass
+
+        await room_actors.submit(room.code, noop)  # Starts the actor
+        deadlines = DeadlineQueue()
+        job = GameTimerJob(deadlines=deadlines)
+        job._synced = True
+        deadlines.schedule(room.code, datetime.now(timezone.utc))
+        try:
+            with patch.object(job, "_claim_room") as claim_room:
+                await job.execute(session)
+        finally:
+            await room_actors.stop()
+
+        claim_room.assert_not_called()
+        events = await get_room_events(session, room.code)
+        assert [e.event for e in events] == ["round_finished"]
+
+    @pytest.mark.asyncio
+    async def test_stale_queue_entry_is_rescheduled(self, session, room_sessions):
+        """Should re-check the room and reschedule if it is not actually due."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        await session.flush()
+
+        deadlines = DeadlineQueue()
+        job = GameTimerJob(deadlines=deadlines)
+        job.room_concurrency = 1  # One connection in tests
+        await job.execute(session)  # initial resync
+
+        deadlines.schedule(room.code, datetime.now(timezone.utc))
+
+        await job.execute(session)
+
+        assert await get_room_events(session, room.code) == []
+        assert deadlines.get(room.code) == get_round_ends_at(room, room.rounds[0])
+
+    @pytest.mark.asyncio
+    async def test_games_without_deadlines_are_not_timed(self, session):
+        """Only games that declare deadlines should be polled or processed."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        player1.current_guess = 50
+        player2.current_guess = 75
+        await session.flush()
+
+        assert get_timed_game_types() == ["guess_number"]
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        with patch.object(GuessNumberGame, "has_deadlines", False):
+            assert get_timed_game_types() == []
+            await job.process_room(session, room)
+
+        assert room.rounds[0].status == RoundStatus.ACTIVE
+        assert await get_room_events(session, room.code) == []
+
+    @pytest.mark.asyncio
+    async def test_claim_room_includes_only_current_round(self, session):
+        """Should load players and just the current round of the room."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        await service.finish_round(room)
+        await service.start_next_round(room)
+        await session.flush()
+        room_code = room.code
+        session.expunge_all()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        claimed = await job._claim_room(session, room_code)
+
+        assert len(claimed.players) == 2
+        assert [r.round_number for r in claimed.rounds] == [2]
+
+    @pytest.mark.asyncio
+    async def test_find_due_room_codes_finds_rooms_due_in_database(self, session):
+        """Work sharing should pick up due rooms missing from the local queue."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        room.rounds[0].ends_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.flush()
+        room_code = room.code
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        job.claim_batch_size = 1000
+        room_codes = await job._find_due_room_codes(
+            session, ["guess_number"], [], datetime.now(timezone.utc)
+        )
+
+        assert room_code in room_codes
+
+    @pytest.mark.asyncio
+    async def test_claim_room_skips_rooms_locked_elsewhere(self, test_engine):
+        """Two instances claiming at once should never get the same room."""
+        session_maker = async_sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with session_maker() as setup_session:
+            service = RoomService(setup_session)
+            room, player1 = await service.create_room("Player1")
+            room, player2 = await service.join_room(room.code, "Player2")
+            await service.start_game(room, player1.id)
+            await setup_session.commit()
+
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        job.work_sharing = True
+        try:
+            async with session_maker() as first, session_maker() as second:
+                assert await job._claim_room(first, room.code) is not None
+                assert await job._claim_room(second, room.code) is None
+        finally:
+            async with session_maker() as cleanup_session:
+                db_room = await cleanup_session.get(Room, room.id)
+                db_room.status = RoomStatus.ABANDONED
+                await cleanup_session.commit()
+
+    @pytest.mark.asyncio
+    async def test_failing_room_does_not_roll_back_others(
+        self, session, room_sessions
+    ):
+        """A room that fails should be retried without undoing other rooms."""
+        service = RoomService(session)
+        rooms = []
+        for _ in range(2):
+            room, host = await service.create_room("Host")
+            room, guest = await service.join_room(room.code, "Guest")
+            await service.start_game(room, host.id)
+            host.current_guess = 40
+            guest.current_guess = 60
+            rooms.append(room)
+        await session.flush()
+        good_room, bad_room = rooms
+
+        deadlines = DeadlineQueue()
+        job = GameTimerJob(deadlines=deadlines)
+        job.room_concurrency = 1  # One connection in tests
+        process_room = job.process_room
+
+        async def fail_for_bad_room(room_session, due_room):
+            await process_room(room_session, due_room)
+            if due_room.code == bad_room.code:
+                raise RuntimeError("boom")
+
+        with patch.object(job, "process_room", side_effect=fail_for_bad_room):
+            await job._process_due_rooms([good_room.code, bad_room.code])
+
+        assert [e.event for e in await get_room_events(session, good_room.code)] == [
+            "round_finished"
+        ]
+        assert await get_room_events(session, bad_room.code) == []
+        for room in rooms:
+            await session.refresh(room.rounds[0])
+        assert good_room.rounds[0].status == RoundStatus.FINISHED
+        assert bad_room.rounds[0].status == RoundStatus.ACTIVE
+        # Retried shortly
+        assert deadlines.get(bad_room.code) > datetime.now(timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_events_roll_back_with_the_transition(self, session):
+        """Round events are part of the job's transaction, not sent on their own."""
+        service = RoomService(session)
+        room, player1 = await service.create_room("Player1")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, player1.id)
+        await session.flush()
+
+        savepoint = await session.begin_nested()
+        await GuessNumberGame().on_deadline(room, session)
+        assert len(await get_room_events(session, room.code)) == 1
+
+        await savepoint.rollback()
+        assert await get_room_events(session, room.code) == []
+
+
+async def wait_until_blocked_or_done(engine, task: asyncio.Task):
+    """Yield until another connection waits on a row lock, or the task finishes."""
+    async with engine.connect() as conn:
+        while not task.done():
+            waiting = (await conn.execute(text(
+                "SELECT count(*) FROM pg_stat_activity WHERE wait_event_type = 'Lock'"
+            ))).scalar_one()
+            if waiting:
+                return
+            await asyncio.sleep(0)
+
+
+class TestLastGuessAtDeadline:
+    """The last guess and the timer finishing the same round concurrently."""
+
+    async def test_last_guess_racing_timer_scores_once(
+        self, client: AsyncClient, test_engine, monkeypatch
+    ):
+        """Both paths lock the room first, so neither deadlocks and the round is scored once."""
+        maker = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr("src.games.timer.async_session_maker", maker)
+
+        data = (await client.post(
+            "/api/games/guess_number/rooms", json={"player_name": "Host"}
+        )).json()
+        room_code, host_id = data["room"]["code"], data["player_id"]
+        player2_id = (await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )).json()["player_id"]
+        actions_url = f"/api/games/guess_number/rooms/{room_code}/actions"
+        await client.post(f"{actions_url}?player_id={host_id}", json={"action": "start_game"})
+        await client.post(
+            f"{actions_url}?player_id={host_id}",
+            json={"action": "submit_guess", "guess": 50},
+        )
+
+        # Round time is up just as the last guess comes in
+        async with maker() as session:
+            room_id = (await session.execute(
+                select(Room.id).where(Room.code == room_code)
+            )).scalar_one()
+            await session.execute(
+                update(GameRound)
+                .where(GameRound.room_id == room_id)
+                .values(ends_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+            )
+            await session.commit()
+
+        # Let the guess in while the timer holds the round row, before it
+        # scores the players (the interleaving that used to deadlock)
+        last_guess: asyncio.Task | None = None
+        score_round = RoomService._score_round
+
+        async def score_round_after_guess(service, room, round_id):
+            nonlocal last_guess
+            if last_guess is None:
+                last_guess = asyncio.create_task(client.post(
+                    f"{actions_url}?player_id={player2_id}",
+                    json={"action": "submit_guess", "guess": 60},
+                ))
+                await wait_until_blocked_or_done(test_engine, last_guess)
+            return await score_round(service, room, round_id)
+
+        monkeypatch.setattr(RoomService, "_score_round", score_round_after_guess)
+        job = GameTimerJob(deadlines=DeadlineQueue())
+        await job._process_due_rooms([room_code])
+        response = await last_guess
+
+        assert response.status_code == 200
+        assert response.json()["success"] is False  # Round was already over
+        async with maker() as session:
+            finished_events = (await session.execute(
+                select(func.count())
+                .select_from(RoomEvent)
+                .where(RoomEvent.room_code == room_code, RoomEvent.event == "round_finished")
+            )).scalar_one()
+            round_status = (await session.execute(
+                select(GameRound.status).where(GameRound.room_id == room_id)
+            )).scalar_one()
+        assert finished_events == 1
+        assert round_status == RoundStatus.FINISHED
@@ -1,9 +1,61 @@
 """Tests for the new games API."""
 
+import importlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+
+from src.games.registry import game_registry
+from src.models import IdempotencyKey, RoomEvent, RoomStatus, RoundStatus
+from src.services import idempotency_store
+
+
+@contextmanager
+def record_statements(engine) -> Iterator[list[str]]:
+    """Collect the SQL statements sent through the engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
 
-from src.models import RoomStatus
+def count_room_selects(statements: list[str]) -> int:
+    return sum(1 for s in statements if s.startswith("SELECT") and "FROM rooms" in s)
+
+
+async def create_room_with_two_players(client: AsyncClient) -> tuple[str, int, int]:
+    """Create a room and join a second player; returns (code, host id, player id)."""
+    create_response = await client.post(
+        "/api/games/guess_number/rooms",
+        json={"player_name": "Host"},
+    )
+    data = create_response.json()
+    join_response = await client.post(
+        f"/api/games/guess_number/rooms/{data['room']['code']}/join",
+        json={"player_name": "Player2"},
+    )
+    return data["room"]["code"], data["player_id"], join_response.json()["player_id"]
+
+
+async def count_room_events(engine, room_code: str, event_type: str) -> int:
+    async with async_sessionmaker(engine)() as session:
+        result = await session.execute(
+            select(RoomEvent).where(RoomEvent.room_code == room_code, RoomEvent.event == event_type)
+        )
+        return len(result.scalars().all())
 
 
 class TestGamesInfo:
@@ -29,6 +81,26 @@ class TestGamesInfo:
         assert guess_number["is_default"] is True
         assert "actions" in guess_number
 
+    async def test_list_games_is_cacheable(self, client: AsyncClient):
+        """Games info should carry an ETag and cache headers, and answer 304 when unchanged."""
+        response = await client.get("/api/games")
+        etag = response.headers["ETag"]
+
+        not_modified = await client.get("/api/games", headers={"If-None-Match": etag})
+
+        assert response.headers["Cache-Control"] == f"public, max-age={settings.games_info_max_age}"
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+
+    async def test_api_info(self, client: AsyncClient):
+        """API info should list the same games, with the API version."""
+        games = (await client.get("/api/games")).json()
+
+        response = await client.get("/api/info")
+
+        assert response.json() == {"version": "0.1.0", **games}
+        assert response.headers["ETag"] != (await client.get("/api/games")).headers["ETag"]
+
 
 class TestCreateRoom:
     """Tests for POST /api/games/{game}/rooms endpoint."""
@@ -51,6 +123,20 @@ class TestCreateRoom:
         assert data["room"]["players"][0]["name"] == "TestPlayer"
         assert data["room"]["players"][0]["is_host"] is True
 
+    async def test_create_room_is_not_reloaded(self, client: AsyncClient, test_engine):
+        """The response should come from the created objects, not a second query."""
+        with record_statements(test_engine) as statements:
+            response = await client.post(
+                "/api/games/guess_number/rooms",
+                json={"player_name": "TestPlayer"},
+            )
+
+        room = response.json()["room"]
+        assert count_room_selects(statements) == 0
+        assert room["created_at"] is not None
+        assert room["updated_at"] is not None
+        assert room["players"][0]["connected_at"] is not None
+
     async def test_create_room_invalid_game(self, client: AsyncClient):
         """Test creating a room for non-existent game."""
         response = await client.post(
@@ -95,6 +181,27 @@ class TestJoinRoom:
         assert data["room"]["players"][1]["name"] == "Player2"
         assert data["room"]["players"][1]["is_host"] is False
 
+    async def test_join_queues_player_joined_event(self, client: AsyncClient, test_engine):
+        """Joins should notify other players through the room_events outbox."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        room_code = create_response.json()["room"]["code"]
+
+        join_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+
+        async with async_sessionmaker(test_engine)() as session:
+            result = await session.execute(
+                select(RoomEvent).where(RoomEvent.room_code == room_code)
+            )
+            room_events = result.scalars().all()
+        assert [e.event for e in room_events] == ["player_joined"]
+        assert room_events[0].data["player"]["id"] == join_response.json()["player_id"]
+
     async def test_join_nonexistent_room(self, client: AsyncClient):
         """Test joining a room that doesn't exist."""
         response = await client.post(
@@ -143,6 +250,42 @@ class TestGetRoomState:
         assert data["code"] == room_code
         assert data["game_type"] == "guess_number"
 
+    async def test_get_room_etag(self, client: AsyncClient):
+        """A matching If-None-Match should get 304 until the room changes."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        room_code = create_response.json()["room"]["code"]
+        url = f"/api/games/guess_number/rooms/{room_code}"
+
+        first = await client.get(url)
+        etag = first.headers["etag"]
+        unchanged = await client.get(url, headers={"If-None-Match": etag})
+        await client.post(f"{url}/join", json={"player_name": "Player2"})
+        changed = await client.get(url, headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert unchanged.headers["etag"] == etag
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    async def test_get_room_not_modified_from_cache(self, client: AsyncClient):
+        """A cached room state should answer If-None-Match without a query."""
+        from src.services import games_storage
+        from src.services.games_storage import room_state_etag
+
+        state = {"code": "CACHED", "game_type": "guess_number", "players": []}
+        games_storage.put("CACHED", state, version=0)
+
+        response = await client.get(
+            "/api/games/guess_number/rooms/CACHED",
+            headers={"If-None-Match": room_state_etag(state)},
+        )
+
+        # The room only exists in the cache, so this never hit the database
+        assert response.status_code == 304
+
     async def test_get_nonexistent_room(self, client: AsyncClient):
         """Test getting a room that doesn't exist."""
         response = await client.get("/api/games/guess_number/rooms/XXXXXX")
@@ -183,6 +326,35 @@ class TestExecuteAction:
         assert action_data["room"]["status"] == RoomStatus.PLAYING.value
         assert action_data["room"]["current_round_number"] == 1
 
+    async def test_start_game_returns_round_deadline(self, client: AsyncClient):
+        """Test that the active round carries ends_at and the server clock."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        data = create_response.json()
+        room_code = data["room"]["code"]
+        host_id = data["player_id"]
+
+        await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+
+        action_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+            json={"action": "start_game"},
+        )
+
+        room = action_response.json()["room"]
+        assert room["server_time"] is not None
+        current_round = room["current_round"]
+        started_at = datetime.fromisoformat(current_round["started_at"])
+        ends_at = datetime.fromisoformat(current_round["ends_at"])
+        round_duration = game_registry.get_settings("guess_number")["round_duration_seconds"]
+        assert ends_at - started_at == timedelta(seconds=round_duration)
+        assert current_round["next_round_at"] is None
+
     async def test_submit_guess_action(self, client: AsyncClient):
         """Test submitting a guess via action endpoint."""
         # Create room with 2 players and start game
@@ -220,6 +392,101 @@ class TestExecuteAction:
         player = next(p for p in guess_data["room"]["players"] if p["id"] == host_id)
         assert player["current_guess"] == 50
 
+    async def test_action_loads_room_once(self, client: AsyncClient, test_engine):
+        """The action response should be built without reloading the room."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        data = create_response.json()
+        room_code = data["room"]["code"]
+        host_id = data["player_id"]
+        await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+
+        with record_statements(test_engine) as statements:
+            response = await client.post(
+                f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+                json={"action": "start_game"},
+            )
+
+        room = response.json()["room"]
+        assert count_room_selects(statements) == 2  # Lock, then load
+        assert room["status"] == RoomStatus.PLAYING.value
+        assert room["updated_at"] != data["room"]["updated_at"]
+        assert room["current_round"]["started_at"] is not None
+
+    async def test_unvalidated_response_matches_schema(self, client: AsyncClient):
+        """Responses built without validation should still validate against their models."""
+        from src.games.router import ActionResponse
+
+        room_code, host_id, _ = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+            json={"action": "start_game"},
+        )
+
+        data = response.json()
+        assert ActionResponse.model_validate(data).model_dump(mode="json") == data
+
+    async def test_openapi_documents_response_models(self, client: AsyncClient):
+        """Routes returning pre-serialized responses should keep their documented schema."""
+        schema = (await client.get("/openapi.json")).json()
+
+        paths = schema["paths"]
+        action = paths["/api/games/{game_type}/rooms/{code}/actions"]["post"]
+        room = paths["/api/games/{game_type}/rooms/{code}"]["get"]
+        assert action["responses"]["200"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/ActionResponse"
+        }
+        assert room["responses"]["200"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/GameRoomResponse"
+        }
+
+    async def test_last_guess_finishes_round(self, client: AsyncClient):
+        """Test that the round finishes as soon as every player has guessed."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        data = create_response.json()
+        room_code = data["room"]["code"]
+        host_id = data["player_id"]
+
+        join_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+        player2_id = join_response.json()["player_id"]
+
+        await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+            json={"action": "start_game"},
+        )
+
+        first_guess = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+            json={"action": "submit_guess", "guess": 50},
+        )
+        assert first_guess.json()["room"]["current_round"]["status"] == "active"
+
+        last_guess = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={player2_id}",
+            json={"action": "submit_guess", "guess": 60},
+        )
+
+        data = last_guess.json()
+        assert data["success"] is True
+        assert data["data"]["round_finished"] is True
+        current_round = data["room"]["current_round"]
+        assert current_round["status"] == "finished"
+        assert current_round["target_number"] is not None
+        assert current_round["next_round_at"] is not None
+        assert sum(p["score"] for p in data["room"]["players"]) == 15
+
     async def test_start_game_not_host(self, client: AsyncClient):
         """Test starting a game as non-host."""
         # Create room
@@ -322,3 +589,389 @@ class TestExecuteAction:
         
         assert response.status_code == 403
 
+
+
+class TestIdempotencyKeys:
+    """Tests for the Idempotency-Key header of the actions endpoint."""
+
+    async def test_retry_replays_response(self, client: AsyncClient, test_engine):
+        """A retried start_game should get the first response, without running again."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}"
+        headers = {"Idempotency-Key": "start-1"}
+
+        first = await client.post(url, json={"action": "start_game"}, headers=headers)
+        with record_statements(test_engine) as statements:
+            retry = await client.post(url, json={"action": "start_game"}, headers=headers)
+
+        assert first.json()["success"] is True
+        assert retry.status_code == 200
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert statements == []  # Answered from memory
+        assert await count_room_events(test_engine, room_code, "game_started") == 1
+
+    async def test_retry_replays_stored_response(self, client: AsyncClient, test_engine):
+        """Responses should be replayed from the database on other instances."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}"
+        headers = {"Idempotency-Key": "start-1"}
+
+        first = await client.post(url, json={"action": "start_game"}, headers=headers)
+        idempotency_store.clear()
+        with record_statements(test_engine) as statements:
+            retry = await client.post(url, json={"action": "start_game"}, headers=headers)
+
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert count_room_selects(statements) == 0
+        assert await count_room_events(test_engine, room_code, "game_started") == 1
+
+    async def test_key_reused_for_other_request(self, client: AsyncClient):
+        """A key sent again with a different body should be rejected."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}"
+        headers = {"Idempotency-Key": "key-1"}
+        await client.post(url, json={"action": "start_game"}, headers=headers)
+
+        from_memory = await client.post(
+            url, json={"action": "submit_guess", "guess": 10}, headers=headers
+        )
+        idempotency_store.clear()
+        from_database = await client.post(
+            url, json={"action": "submit_guess", "guess": 10}, headers=headers
+        )
+
+        assert from_memory.status_code == 422
+        assert from_database.status_code == 422
+
+    async def test_keys_are_per_player(self, client: AsyncClient):
+        """The same key from another player should run that player's action."""
+        room_code, host_id, player2_id = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions"
+        headers = {"Idempotency-Key": "guess-1"}
+        await client.post(f"{url}?player_id={host_id}", json={"action": "start_game"})
+
+        host_guess = await client.post(
+            f"{url}?player_id={host_id}", json={"action": "submit_guess", "guess": 10}, headers=headers
+        )
+        player2_guess = await client.post(
+            f"{url}?player_id={player2_id}", json={"action": "submit_guess", "guess": 10}, headers=headers
+        )
+
+        assert "Idempotent-Replayed" not in player2_guess.headers
+        assert host_guess.json()["data"] == {"guess": 10}
+        assert player2_guess.json()["data"] == {"guess": 10, "round_finished": True}
+
+    async def test_failed_request_leaves_key_unused(self, client: AsyncClient, test_engine):
+        """Errors should not be stored, so the request can be retried with its key."""
+        room_code, _, _ = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id=99999",
+            json={"action": "start_game"},
+            headers={"Idempotency-Key": "start-1"},
+        )
+
+        assert response.status_code == 403
+        async with async_sessionmaker(test_engine)() as session:
+            keys = await session.scalars(
+                select(IdempotencyKey).where(IdempotencyKey.room_code == room_code)
+            )
+            assert keys.all() == []
+
+
+class TestBatchActions:
+    """Tests for POST /api/games/{game}/rooms/{code}/actions/batch endpoint."""
+
+    async def test_batch_plays_a_round(self, client: AsyncClient, test_engine):
+        """Actions of several players should be applied in order, in one transaction."""
+        room_code, host_id, player2_id = await create_room_with_two_players(client)
+
+        with record_statements(test_engine) as statements:
+            response = await client.post(
+                f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+                json={
+                    "actions": [
+                        {"player_id": host_id, "action": {"action": "start_game"}},
+                        {"player_id": host_id, "action": {"action": "submit_guess", "guess": 10}},
+                        {"player_id": player2_id, "action": {"action": "submit_guess", "guess": 90}},
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["player_id"] for r in data["results"]] == [host_id, host_id, player2_id]
+        assert all(r["success"] for r in data["results"])
+        assert data["results"][2]["data"] == {"guess": 90, "round_finished": True}
+        assert data["room"]["current_round"]["status"] == RoundStatus.FINISHED.value
+        assert count_room_selects(statements) == 2  # Lock, then load
+
+        async with async_sessionmaker(test_engine)() as session:
+            result = await session.execute(
+                select(RoomEvent).where(RoomEvent.room_code == room_code, RoomEvent.event != "player_joined")
+            )
+            room_events = result.scalars().all()
+        assert [e.event for e in room_events] == ["round_finished"]
+        assert room_events[0].data["room"]["current_round"]["status"] == RoundStatus.FINISHED.value
+
+    async def test_failed_action_does_not_stop_the_batch(self, client: AsyncClient):
+        """Actions that fail should be reported while the rest are applied."""
+        room_code, host_id, player2_id = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={
+                "actions": [
+                    {"player_id": player2_id, "action": {"action": "submit_guess", "guess": 10}},
+                    {"player_id": player2_id, "action": {"action": "start_game"}},
+                    {"player_id": host_id, "action": {"action": "start_game"}},
+                ]
+            },
+        )
+
+        results = response.json()["results"]
+        assert [r["success"] for r in results] == [False, False, True]
+        assert results[0]["message"] == "Game is not in progress"
+        assert results[1]["message"] == "Only the host can start the game"
+        assert response.json()["room"]["status"] == RoomStatus.PLAYING.value
+
+    async def test_invalid_action_rejects_the_batch(self, client: AsyncClient):
+        """Every action should be validated before any is applied."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={
+                "actions": [
+                    {"player_id": host_id, "action": {"action": "start_game"}},
+                    {"player_id": host_id, "action": {"action": "invalid_action"}},
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:4] == ["body", "actions", 1, "action"]
+        room = (await client.get(f"/api/games/guess_number/rooms/{room_code}")).json()
+        assert room["status"] == RoomStatus.WAITING.value
+
+    async def test_player_not_in_room_rejects_the_batch(self, client: AsyncClient):
+        """A batch with a player from outside the room should not be applied."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={
+                "actions": [
+                    {"player_id": host_id, "action": {"action": "start_game"}},
+                    {"player_id": 99999, "action": {"action": "submit_guess", "guess": 10}},
+                ]
+            },
+        )
+
+        assert response.status_code == 403
+        room = (await client.get(f"/api/games/guess_number/rooms/{room_code}")).json()
+        assert room["status"] == RoomStatus.WAITING.value
+
+    async def test_empty_batch(self, client: AsyncClient):
+        """A batch needs at least one action."""
+        room_code, _, _ = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={"actions": []},
+        )
+
+        assert response.status_code == 422
+
+
+class TestRoomActorsEnabled:
+    """Tests for the games API with room actors (settings.room_actors_enabled)."""
+
+    @pytest.fixture(autouse=True)
+    async def actors_enabled(self, client, test_engine, monkeypatch):
+        from src.services import room_actors
+
+        monkeypatch.setattr(settings, "room_actors_enabled", True)
+        monkeypatch.setattr(
+            importlib.import_module("src.services.room_actors"),
+            "async_session_maker",
+            async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+        )
+        yield
+        await room_actors.stop()
+
+    async def test_join_and_play_through_actor(self, client: AsyncClient):
+        """Joins and actions should be applied and committed by the room's actor."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        data = create_response.json()
+        room_code = data["room"]["code"]
+        host_id = data["player_id"]
+
+        join_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+        assert join_response.status_code == 200
+        player2_id = join_response.json()["player_id"]
+
+        await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}",
+            json={"action": "start_game"},
+        )
+        guess_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id={player2_id}",
+            json={"action": "submit_guess", "guess": 42},
+        )
+        assert guess_response.status_code == 200
+        assert guess_response.json()["success"] is True
+
+        # Committed before the response, so a plain read sees it
+        room = (await client.get(f"/api/games/guess_number/rooms/{room_code}")).json()
+        assert room["status"] == RoomStatus.PLAYING.value
+        player2 = next(p for p in room["players"] if p["id"] == player2_id)
+        assert player2["current_guess"] == 42
+
+    async def test_errors_are_returned_by_actor(self, client: AsyncClient):
+        """Expected errors from the actor should map to the usual status codes."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        room_code = create_response.json()["room"]["code"]
+
+        not_in_room = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions?player_id=99999",
+            json={"action": "start_game"},
+        )
+        missing_room = await client.post(
+            "/api/games/guess_number/rooms/NOROOM/join",
+            json={"player_name": "Player2"},
+        )
+
+        assert not_in_room.status_code == 403
+        assert missing_room.status_code == 404
+
+    async def test_batch_through_actor(self, client: AsyncClient):
+        """Batches should be applied by the room's actor as one message."""
+        room_code, host_id, player2_id = await create_room_with_two_players(client)
+
+        response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={
+                "actions": [
+                    {"player_id": host_id, "action": {"action": "start_game"}},
+                    {"player_id": player2_id, "action": {"action": "submit_guess", "guess": 42}},
+                ]
+            },
+        )
+        not_in_room = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/actions/batch",
+            json={"actions": [{"player_id": 99999, "action": {"action": "start_game"}}]},
+        )
+
+        assert [r["success"] for r in response.json()["results"]] == [True, True]
+        room = (await client.get(f"/api/games/guess_number/rooms/{room_code}")).json()
+        player2 = next(p for p in room["players"] if p["id"] == player2_id)
+        assert player2["current_guess"] == 42
+        assert not_in_room.status_code == 403
+
+    async def test_retry_replays_response(self, client: AsyncClient, test_engine):
+        """Retries should be replayed by the actor from the stored response."""
+        room_code, host_id, _ = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions?player_id={host_id}"
+        headers = {"Idempotency-Key": "start-1"}
+
+        first = await client.post(url, json={"action": "start_game"}, headers=headers)
+        idempotency_store.clear()
+        retry = await client.post(url, json={"action": "start_game"}, headers=headers)
+
+        assert first.json()["success"] is True
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert await count_room_events(test_engine, room_code, "game_started") == 1
+
+
+class TestGuessBatchingEnabled:
+    """Tests for the games API with guess batching (settings.guess_batching_enabled)."""
+
+    @pytest.fixture(autouse=True)
+    async def batching_enabled(self, client, test_engine, monkeypatch):
+        from src.games.guess_batcher import guess_batcher
+
+        monkeypatch.setattr(settings, "guess_batching_enabled", True)
+        monkeypatch.setattr(settings, "guess_batch_window_ms", 0)
+        monkeypatch.setattr(
+            importlib.import_module("src.games.guess_batcher"),
+            "async_session_maker",
+            async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+        )
+        yield
+        await guess_batcher.stop()
+
+    async def test_guesses_go_through_batcher(self, client: AsyncClient):
+        """Guesses should be committed by the batcher, the last one finishing the round."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        data = create_response.json()
+        room_code = data["room"]["code"]
+        host_id = data["player_id"]
+        join_response = await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+        player2_id = join_response.json()["player_id"]
+        actions_url = f"/api/games/guess_number/rooms/{room_code}/actions"
+
+        early = await client.post(
+            f"{actions_url}?player_id={player2_id}",
+            json={"action": "submit_guess", "guess": 42},
+        )
+        await client.post(f"{actions_url}?player_id={host_id}", json={"action": "start_game"})
+        first = await client.post(
+            f"{actions_url}?player_id={player2_id}",
+            json={"action": "submit_guess", "guess": 42},
+        )
+        last = await client.post(
+            f"{actions_url}?player_id={host_id}",
+            json={"action": "submit_guess", "guess": 40},
+        )
+        not_in_room = await client.post(
+            f"{actions_url}?player_id=99999",
+            json={"action": "submit_guess", "guess": 40},
+        )
+
+        assert early.json()["success"] is False
+        assert early.json()["message"] == "Game is not in progress"
+        assert first.json()["success"] is True
+        assert first.json()["data"] == {"guess": 42}
+        assert last.json()["data"] == {"guess": 40, "round_finished": True}
+        assert last.json()["room"]["current_round"]["status"] == RoundStatus.FINISHED.value
+        assert not_in_room.status_code == 403
+
+    async def test_retried_guess_is_replayed(self, client: AsyncClient, test_engine):
+        """Retried guesses should be replayed instead of going through the batcher again."""
+        room_code, host_id, player2_id = await create_room_with_two_players(client)
+        url = f"/api/games/guess_number/rooms/{room_code}/actions"
+        await client.post(f"{url}?player_id={host_id}", json={"action": "start_game"})
+        headers = {"Idempotency-Key": "guess-1"}
+
+        first = await client.post(
+            f"{url}?player_id={player2_id}", json={"action": "submit_guess", "guess": 42}, headers=headers
+        )
+        idempotency_store.clear()
+        retry = await client.post(
+            f"{url}?player_id={player2_id}", json={"action": "submit_guess", "guess": 42}, headers=headers
+        )
+
+        assert first.json()["success"] is True
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert await count_room_events(test_engine, room_code, "guess_submitted") == 1
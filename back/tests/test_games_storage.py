@@ -0,0 +1,137 @@
+"""Tests for the versioned room snapshot cache (GamesStorage)."""
+
+import importlib
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.games.timing import utc_now
+from src.services import games_storage
+from src.services.games_storage import GamesStorage
+from src.services.room_events import RoomEventDispatcher, add_room_event
+
+
+def room_state(code: str, **changes) -> dict:
+    return {"code": code, "game_type": "guess_number", "players": [], **changes}
+
+
+@pytest.fixture
+def storage() -> GamesStorage:
+    return GamesStorage()
+
+
+@pytest.fixture
+def loads(monkeypatch) -> list[str]:
+    """Serve room_loader loads from memory, recording the rooms loaded."""
+    loaded = []
+
+    async def load(room_code):
+        loaded.append(room_code)
+        return room_state(room_code)
+
+    room_loader = importlib.import_module("src.services.room_loader").room_loader
+    monkeypatch.setattr(room_loader, "load", load)
+    return loaded
+
+
+class TestGamesStorage:
+    """Tests for GamesStorage versioning, eviction and metrics."""
+
+    async def test_miss_loads_then_hits(self, storage, loads):
+        """Only the first read of a room should load it."""
+        first = await storage.load_game("ROOM01")
+        second = await storage.load_game("ROOM01")
+
+        assert loads == ["ROOM01"]
+        assert second is first
+        stats = storage.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    async def test_newer_event_invalidates(self, storage, loads):
+        """An event newer than the snapshot should drop it; older ones should not."""
+        storage.put("ROOM01", room_state("ROOM01"), version=10)
+
+        storage.invalidate("ROOM01", 9)
+        assert storage.get_game("ROOM01") is not None
+
+        storage.invalidate("ROOM01", 11, created_at=utc_now() - timedelta(seconds=2))
+        assert storage.get_game("ROOM01") is None
+        stats = storage.get_stats()
+        assert stats["invalidations"] == 1
+        assert stats["max_staleness_seconds"] >= 2
+
+    async def test_older_write_through_is_ignored(self, storage):
+        """A write-through must not replace a newer snapshot."""
+        storage.put("ROOM01", room_state("ROOM01", status="playing"), version=10)
+        storage.put("ROOM01", room_state("ROOM01", status="waiting"), version=8)
+
+        assert storage.get_game("ROOM01")["status"] == "playing"
+
+    async def test_load_racing_an_event_is_not_kept(self, storage, monkeypatch):
+        """A snapshot loaded while the room changed may miss the change."""
+        room_loader = importlib.import_module("src.services.room_loader").room_loader
+
+        async def load_during_change(room_code):
+            storage.invalidate(room_code, 5)
+            return room_state(room_code)
+
+        monkeypatch.setattr(room_loader, "load", load_during_change)
+
+        assert await storage.load_game("ROOM01") is not None
+        assert storage.get_game("ROOM01") is None
+
+    async def test_least_recently_used_is_evicted(self, storage, loads, monkeypatch):
+        """The cache should stay within its size, dropping the coldest rooms."""
+        monkeypatch.setattr(storage, "_max_size", 2)
+
+        await storage.load_game("ROOM01")
+        await storage.load_game("ROOM02")
+        await storage.load_game("ROOM01")
+        await storage.load_game("ROOM03")
+
+        assert storage.get_game("ROOM01") is not None
+        assert storage.get_game("ROOM02") is None
+        assert storage.get_game("ROOM03") is not None
+
+
+class TestSnapshotWriteThrough:
+    """Tests for write-through from writers and invalidation by the dispatcher."""
+
+    async def test_action_writes_through_to_reads(self, client: AsyncClient):
+        """Reads after an action should be served from the written snapshot."""
+        create_response = await client.post(
+            "/api/games/guess_number/rooms",
+            json={"player_name": "Host"},
+        )
+        room_code = create_response.json()["room"]["code"]
+        await client.post(
+            f"/api/games/guess_number/rooms/{room_code}/join",
+            json={"player_name": "Player2"},
+        )
+
+        response = await client.get(f"/api/games/guess_number/rooms/{room_code}")
+
+        assert [p["name"] for p in response.json()["players"]] == ["Host", "Player2"]
+        stats = games_storage.get_stats()
+        assert (stats["write_throughs"], stats["hits"], stats["misses"]) == (1, 1, 0)
+
+    async def test_dispatched_event_invalidates_snapshot(self, session, monkeypatch):
+        """Events from any instance should drop older snapshots of their room."""
+        maker = async_sessionmaker(
+            bind=session.bind,
+            class_=AsyncSession,
+            join_transaction_mode="create_savepoint",
+        )
+        monkeypatch.setattr("src.services.room_events.async_session_maker", maker)
+        dispatcher = RoomEventDispatcher()
+        await dispatcher.dispatch_batch()
+        games_storage.put("ROOM01", room_state("ROOM01"), version=0)
+
+        add_room_event(session, "ROOM01", "player_joined", {})
+        await session.flush()
+        await dispatcher.dispatch_batch()
+
+        assert games_storage.get_game("ROOM01") is None
+        assert games_storage.get_stats()["invalidations"] == 1
@@ -0,0 +1,149 @@
+"""Tests for the guess batcher."""
+
+import asyncio
+import importlib
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.games.guess_batcher import GuessBatcher
+from src.models import GameRound, Player, Room, RoomEvent, RoundStatus
+from src.services.room_service import RoomService
+
+
+@pytest.fixture
+def batch_sessions(session, monkeypatch):
+    """Run the batcher's transactions on the test connection, without a window."""
+    maker = async_sessionmaker(
+        bind=session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(
+        importlib.import_module("src.games.guess_batcher"), "async_session_maker", maker
+    )
+    monkeypatch.setattr(settings, "guess_batch_window_ms", 0)
+    return maker
+
+
+@pytest.fixture
+async def batcher(batch_sessions):
+    batcher = GuessBatcher()
+    yield batcher
+    await batcher.stop()
+
+
+async def create_playing_room(session: AsyncSession, players: int = 2) -> tuple[Room, list[Player]]:
+    service = RoomService(session)
+    room, host = await service.create_room("Host")
+    joined = [host]
+    for i in range(1, players):
+        room, player = await service.join_room(room.code, f"Player{i}")
+        joined.append(player)
+    await service.start_game(room, host.id)
+    await session.commit()
+    return room, joined
+
+
+async def load_guesses(session: AsyncSession, room_id: int) -> list[int | None]:
+    result = await session.execute(
+        select(Player.current_guess).where(Player.room_id == room_id).order_by(Player.id)
+    )
+    return list(result.scalars().all())
+
+
+async def load_event_names(session: AsyncSession, room_code: str) -> list[str]:
+    result = await session.execute(
+        select(RoomEvent.event).where(RoomEvent.room_code == room_code).order_by(RoomEvent.id)
+    )
+    return list(result.scalars().all())
+
+
+class TestGuessBatcher:
+    """Tests for GuessBatcher."""
+
+    async def test_guesses_of_several_rooms_share_a_batch(self, session, batcher, monkeypatch):
+        """Guesses of different rooms should be written in one transaction."""
+        room1, players1 = await create_playing_room(session, players=3)
+        room2, players2 = await create_playing_room(session, players=3)
+        commits = 0
+        original_flush = batcher._flush
+
+        async def counting_flush(batch):
+            nonlocal commits
+            commits += 1
+            await original_flush(batch)
+
+        monkeypatch.setattr(batcher, "_flush", counting_flush)
+
+        results = await asyncio.gather(
+            batcher.submit(room1.code, "guess_number", players1[0].id, 10),
+            batcher.submit(room2.code, "guess_number", players2[0].id, 20),
+            batcher.submit(room2.code, "guess_number", players2[1].id, 30),
+        )
+
+        assert commits == 1
+        assert [r.accepted for r in results] == [True, True, True]
+        assert await load_guesses(session, room1.id) == [10, None, None]
+        assert await load_guesses(session, room2.id) == [20, 30, None]
+        assert await load_event_names(session, room2.code) == ["guess_submitted"] * 2
+
+    async def test_rejected_guess_does_not_stop_the_batch(self, session, batcher):
+        """A guess that doesn't apply should be answered without being written."""
+        room, players = await create_playing_room(session, players=3)
+        waiting, _ = await RoomService(session).create_room("Waiting")
+        await session.commit()
+
+        results = await asyncio.gather(
+            batcher.submit(room.code, "guess_number", players[0].id, 10),
+            batcher.submit(waiting.code, "guess_number", waiting.host_id, 20),
+            batcher.submit(room.code, "guess_number", 99999, 30),
+            batcher.submit("NOROOM", "guess_number", players[0].id, 40),
+        )
+
+        assert results[0].accepted is True
+        assert (results[1].accepted, results[1].message) == (False, "Game is not in progress")
+        assert (results[2].accepted, results[2].message) == (False, None)
+        assert results[3].room is None
+        assert await load_guesses(session, room.id) == [10, None, None]
+        assert await load_guesses(session, waiting.id) == [None]
+
+    async def test_last_guess_finishes_round(self, session, batcher):
+        """Once everyone has guessed, the round should finish in the same batch."""
+        room, players = await create_playing_room(session)
+
+        results = await asyncio.gather(
+            *(batcher.submit(room.code, "guess_number", p.id, 50) for p in players)
+        )
+
+        assert all(r.accepted and r.round_finished for r in results)
+        status = await session.scalar(
+            select(GameRound.status).where(GameRound.room_id == room.id)
+        )
+        assert status == RoundStatus.FINISHED
+        assert await load_event_names(session, room.code) == [
+            "guess_submitted",
+            "guess_submitted",
+            "round_finished",
+        ]
+
+    async def test_failed_commit_fails_the_whole_batch(self, session, batcher, monkeypatch):
+        """Callers should never be told about guesses that were not committed."""
+        room, players = await create_playing_room(session, players=3)
+
+        async def fail(self):
+            raise RuntimeError("commit failed")
+
+        monkeypatch.setattr(AsyncSession, "commit", fail)
+        results = await asyncio.gather(
+            batcher.submit(room.code, "guess_number", players[0].id, 10),
+            batcher.submit(room.code, "guess_number", players[1].id, 20),
+            return_exceptions=True,
+        )
+        monkeypatch.undo()
+
+        assert [str(result) for result in results] == ["commit failed"] * 2
+        assert await load_guesses(session, room.id) == [None, None, None]
@@ -0,0 +1,111 @@
+"""Tests for Idempotency-Key storage."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.jobs.idempotency_key_prune import IdempotencyKeyPruneJob
+from src.models import IdempotencyKey
+from src.services.idempotency import (
+    IdempotencyKeyReused,
+    IdempotencyStore,
+    IdempotentRequest,
+)
+
+
+def idempotent_request(key: str = "key-1", **request) -> IdempotentRequest:
+    return IdempotentRequest.from_request("ROOM01", 1, key, request or {"action": "start_game"})
+
+
+class TestIdempotencyStore:
+    """Tests for IdempotencyStore."""
+
+    async def test_claim_then_replay(self, session: AsyncSession):
+        """A key should be claimed once, then replay the recorded response."""
+        store = IdempotencyStore()
+        request = idempotent_request()
+
+        assert await store.claim(session, request) is None
+        await store.record(session, request, {"success": True})
+        await session.commit()
+
+        assert store.get(request) == {"success": True}
+        store.clear()
+        assert store.get(request) is None
+        assert await store.claim(session, request) == {"success": True}
+        assert store.get(request) == {"success": True}
+
+    async def test_rolled_back_claim_is_released(self, session: AsyncSession):
+        """A request that failed should not hold on to its key."""
+        store = IdempotencyStore()
+        request = idempotent_request()
+
+        async with session.begin_nested() as savepoint:
+            assert await store.claim(session, request) is None
+            await store.record(session, request, {"success": True})
+            await savepoint.rollback()
+
+        assert store.get(request) is None
+        assert await store.claim(session, request) is None
+
+    async def test_reused_key_is_rejected(self, session: AsyncSession):
+        """The same key with another body should raise, from memory and database."""
+        store = IdempotencyStore()
+        await store.claim(session, idempotent_request())
+        await store.record(session, idempotent_request(), {"success": True})
+        await session.commit()
+        other = idempotent_request(action="submit_guess", guess=10)
+
+        with pytest.raises(IdempotencyKeyReused):
+            store.get(other)
+        store.clear()
+        with pytest.raises(IdempotencyKeyReused):
+            await store.claim(session, other)
+
+    async def test_memory_is_bounded(self, session: AsyncSession, monkeypatch):
+        """Only the most recently used responses should be kept in memory."""
+        store = IdempotencyStore()
+        monkeypatch.setattr(store, "_max_size", 2)
+        requests = [idempotent_request(f"key-{i}") for i in range(3)]
+        for request in requests:
+            await store.claim(session, request)
+            await store.record(session, request, {"success": True})
+        await session.commit()
+
+        assert store.get(requests[0]) is None
+        assert store.get(requests[1]) is not None
+        assert store.get(requests[2]) is not None
+
+
+class TestIdempotencyKeyPruneJob:
+    """Tests for IdempotencyKeyPruneJob."""
+
+    async def test_deletes_only_expired_keys(self, session: AsyncSession):
+        """Keys older than the retention period should be deleted in chunks."""
+        store = IdempotencyStore()
+        for i in range(4):
+            await store.claim(session, idempotent_request(f"key-{i}"))
+        await session.flush()
+        expired = await session.scalars(
+            select(IdempotencyKey).where(IdempotencyKey.key != "key-3")
+        )
+        for key in expired:
+            key.created_at = datetime.now(timezone.utc) - timedelta(days=1)
+        await session.commit()
+
+        job = IdempotencyKeyPruneJob()
+        job.chunk_size = 2
+        await job.execute(session)
+
+        result = await session.execute(
+            select(IdempotencyKey.key).where(IdempotencyKey.room_code == "ROOM01")
+        )
+        assert result.scalars().all() == ["key-3"]
+
+    async def test_job_has_correct_configuration(self):
+        """Test that the job has the correct lock_id and name."""
+        job = IdempotencyKeyPruneJob()
+        assert job.lock_id == 1004
+        assert job.job_name == "IdempotencyKeyPruneJob"
@@ -0,0 +1,206 @@
+"""Tests for JobScheduler."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from src.games.timer import GameTimerJob
+from src.games.timing import utc_now
+from src.jobs.base import BaseJob
+from src.jobs.deadlines import DeadlineQueue
+from src.jobs.scheduler import Histogram, JobScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock; sleeping just moves it forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeJob(BaseJob):
+    """Job that advances the fake clock instead of touching the database."""
+
+    lock_id = 9002
+    interval_seconds = 10.0
+    job_name = "FakeJob"
+    backoff_base_seconds = 1.0
+    backoff_max_seconds = 4.0
+
+    def __init__(self, clock: FakeClock, run_seconds: list[float], fail: bool = False):
+        self.clock = clock
+        self.run_seconds = list(run_seconds)
+        self.fail = fail
+        self.started_at: list[float] = []
+        self.scheduled: list[bool] = []
+        self.early_wake_ups = 0
+
+    async def run_once(self):
+        if not self.run_seconds:
+            raise asyncio.CancelledError  # Ends the scheduler loop
+        self.started_at.append(self.clock.now)
+        self.scheduled.append(self.scheduled_run)
+        self.clock.now += self.run_seconds.pop(0)
+        if self.fail:
+            raise RuntimeError("boom")
+
+    async def wait_for_next_run(self, timeout: float):
+        if self.early_wake_ups and timeout > 1:
+            self.early_wake_ups -= 1
+            await self.clock.sleep(1)
+            return
+        await self.clock.sleep(timeout)
+
+    async def execute(self, session):
+        pass
+
+
+async def run_job(scheduler: JobScheduler, job: FakeJob):
+    scheduler.add(job)
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.run_job(job)
+    return scheduler.stats[job.job_name]
+
+
+class TestJobScheduler:
+    """Tests for JobScheduler."""
+
+    async def test_runs_on_fixed_rate_ticks(self):
+        """Run time should not stretch the period."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[2, 3, 1])
+
+        stats = await run_job(JobScheduler(clock=clock), job)
+
+        assert job.started_at == [0, 10, 20]
+        assert stats.runs == 3
+        assert stats.skipped_ticks == 0
+        assert stats.overrun.count == 0
+        assert stats.duration.sum == 6
+
+    async def test_overrun_skips_missed_ticks(self):
+        """A run longer than the interval should skip ticks, not burst."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[25, 1])
+
+        stats = await run_job(JobScheduler(clock=clock), job)
+
+        # Ticks at 10 and 20 are skipped; next run is on the grid at 30
+        assert job.started_at == [0, 30]
+        assert stats.skipped_ticks == 2
+        assert stats.overrun.count == 1
+        assert stats.overrun.sum == 15
+
+    async def test_failures_back_off_with_jitter(self):
+        """Failed runs should be retried after growing, capped backoff."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[0, 0, 0, 0], fail=True)
+
+        stats = await run_job(JobScheduler(clock=clock, sleep=clock.sleep), job)
+
+        assert stats.runs == stats.failures == stats.consecutive_failures == 4
+        assert stats.last_error == "RuntimeError('boom')"
+        for backoff, delay in zip(clock.sleeps, [1, 2, 4, 4]):
+            assert delay / 2 <= backoff <= delay
+
+    async def test_success_resets_consecutive_failures(self):
+        """A successful run should clear the failure streak."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[0, 0], fail=True)
+        scheduler = JobScheduler(clock=clock, sleep=clock.sleep)
+        scheduler.add(job)
+
+        async def fail_once():
+            job.fail = len(job.started_at) == 0
+            await FakeJob.run_once(job)
+
+        job.run_once = fail_once
+        with pytest.raises(asyncio.CancelledError):
+            await scheduler.run_job(job)
+
+        stats = scheduler.stats[job.job_name]
+        assert stats.failures == 1
+        assert stats.consecutive_failures == 0
+
+    async def test_run_times_out(self):
+        """A run longer than timeout_seconds should be cancelled and retried."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[])
+        job.timeout_seconds = 0.001
+        hang = asyncio.Event()
+        calls = []
+
+        async def run_once():
+            calls.append(clock.now)
+            if len(calls) > 1:
+                raise asyncio.CancelledError
+            await hang.wait()
+
+        job.run_once = run_once
+        stats = await run_job(JobScheduler(clock=clock, sleep=clock.sleep), job)
+
+        assert stats.timeouts == 1
+        assert stats.last_error == "timed out after 0.001s"
+        assert len(calls) == 2
+
+    def test_backoff_is_capped_after_many_failures(self):
+        """Backoff should stay at the max however long a job keeps failing."""
+        job = FakeJob(FakeClock(), run_seconds=[])
+
+        backoff = JobScheduler.get_backoff(job, 5000)
+
+        assert job.backoff_max_seconds / 2 <= backoff <= job.backoff_max_seconds
+
+    async def test_early_wake_up_is_not_a_scheduled_run(self):
+        """Runs between ticks should be flagged and keep the grid."""
+        clock = FakeClock()
+        job = FakeJob(clock, run_seconds=[0, 0, 0])
+        job.early_wake_ups = 1
+
+        await run_job(JobScheduler(clock=clock), job)
+
+        assert job.started_at == [0, 1, 10]
+        assert job.scheduled == [True, False, True]
+
+    async def test_follower_waits_for_ticks_despite_past_due_deadline(self, monkeypatch):
+        """A follower holding an overdue deadline should not run in a busy loop."""
+        clock = FakeClock()
+        monkeypatch.setattr(BaseJob, "wait_for_next_run", lambda job, timeout: clock.sleep(timeout))
+        deadlines = DeadlineQueue()
+        deadlines.schedule("ROOM01", utc_now() - timedelta(seconds=1))
+        job = GameTimerJob(deadlines=deadlines)
+        started_at = []
+
+        async def run_once():
+            if len(started_at) == 3:
+                raise asyncio.CancelledError
+            started_at.append(clock.now)
+            job.is_leader = False  # Another instance holds the lock
+
+        job.run_once = run_once
+        await run_job(JobScheduler(clock=clock), job)
+
+        interval = job.interval_seconds
+        assert started_at == [0, interval, 2 * interval]
+        assert "ROOM01" not in deadlines
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram snapshot should count values per upper bound."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(5.65)
+        assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
@@ -0,0 +1,95 @@
+"""Tests for LeaderElection."""
+
+import time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.jobs.leader import LeaderElection
+
+LOCK_ID = 9001  # Not used by any real job
+
+
+@pytest_asyncio.fixture
+async def election_engine(database_url):
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    yield engine
+    await engine.dispose()
+
+
+def make_election(engine, name: str) -> LeaderElection:
+    return LeaderElection(
+        LOCK_ID, name, check_interval=1.0, lease_timeout=5.0, engine=engine
+    )
+
+
+class TestLeaderElection:
+    """Tests for LeaderElection."""
+
+    @pytest.mark.asyncio
+    async def test_only_one_instance_becomes_leader(self, election_engine):
+        """Should grant the lock to the first instance and keep others following."""
+        first = make_election(election_engine, "first")
+        second = make_election(election_engine, "second")
+        try:
+            assert await first.check() is True
+            assert await second.check() is False
+            # Leader re-confirms without losing the lock
+            assert await first.check() is True
+
+            assert first.is_leader
+            assert not second.is_leader
+            assert first.held_for >= 0
+            assert second.held_for is None
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_follower_takes_over_after_leader_stops(self, election_engine):
+        """Should hand the lock over once the leader's connection is closed."""
+        first = make_election(election_engine, "first")
+        second = make_election(election_engine, "second")
+        try:
+            await first.check()
+            await second.check()
+
+            await first.stop()
+
+            assert await second.check() is True
+            assert not first.is_leader
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_status_reports_current_leader(self, election_engine):
+        """Should expose which instance holds the lock and since when."""
+        first = make_election(election_engine, "first")
+        second = make_election(election_engine, "second")
+        try:
+            await first.check()
+            await second.check()
+
+            status = await second.get_status()
+
+            assert status["is_leader"] is False
+            assert status["leader_since"] is None
+            assert status["leader"]["instance"] == f"{first.instance_id}:first"
+        finally:
+            await first.stop()
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_leader_steps_down_when_lease_is_not_confirmed(self, election_engine):
+        """Should stop reporting leadership once the last confirmation is too old."""
+        election = make_election(election_engine, "first")
+        try:
+            await election.check()
+            election._confirmed_at = time.monotonic() - election.lease_timeout
+
+            assert not election.is_leader
+        finally:
+            await election.stop()
@@ -0,0 +1,175 @@
+"""Tests for per-room actors."""
+
+import asyncio
+import importlib
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models import Player, Room, RoomStatus
+from src.services.room_actors import RoomActorRegistry
+from src.services.room_service import RoomService
+
+
+@pytest.fixture
+def actor_sessions(session, monkeypatch):
+    """Run the actors' sessions on the test connection."""
+    maker = async_sessionmaker(
+        bind=session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    # src.services.room_actors the attribute is the registry, not the module
+    module = importlib.import_module("src.services.room_actors")
+    monkeypatch.setattr(module, "async_session_maker", maker)
+    return maker
+
+
+@pytest.fixture
+async def registry(actor_sessions):
+    registry = RoomActorRegistry()
+    yield registry
+    await registry.stop()
+
+
+async def create_room(session: AsyncSession) -> Room:
+    room, _ = await RoomService(session).create_room("Host")
+    await session.commit()
+    return room
+
+
+async def load_player_names(session: AsyncSession, room_id: int) -> list[str]:
+    result = await session.execute(
+        select(Player.name).where(Player.room_id == room_id).order_by(Player.id)
+    )
+    return list(result.scalars().all())
+
+
+async def current_task(room: Room | None, session: AsyncSession) -> asyncio.Task:
+    """Handler returning the actor's task, to wait for the actor to exit."""
+    return asyncio.current_task()
+
+
+def add_player(name: str):
+    async def handler(room: Room, session: AsyncSession):
+        room.players.append(Player(name=name, is_host=False))
+        return len(room.players)
+
+    return handler
+
+
+class TestRoomActors:
+    """Tests for RoomActor and RoomActorRegistry."""
+
+    async def test_handlers_run_in_order_on_one_copy(self, session, registry):
+        """Concurrent messages should be applied one after another, in arrival order."""
+        room = await create_room(session)
+
+        counts = await asyncio.gather(
+            *(registry.submit(room.code, add_player(f"P{i}")) for i in range(5))
+        )
+
+        assert counts == [2, 3, 4, 5, 6]
+        assert registry.get(room.code) is not None
+
+    async def test_changes_are_committed_behind_the_handlers(self, session, registry):
+        """Acknowledged changes should be in the database once the actor stops."""
+        room = await create_room(session)
+
+        await registry.submit(room.code, add_player("Guest"))
+        await registry.stop()
+
+        assert await load_player_names(session, room.id) == ["Host", "Guest"]
+        assert registry.get(room.code) is None
+
+    async def test_failed_handler_only_rolls_back_itself(self, session, registry):
+        """A raising handler should not undo the other handlers of its batch."""
+        room = await create_room(session)
+
+        async def fail(room: Room, session: AsyncSession):
+            room.players.append(Player(name="Lost", is_host=False))
+            raise RuntimeError("boom")
+
+        async def count_players(room: Room, session: AsyncSession):
+            return len(room.players)
+
+        # Queued together, so all three run in one batch
+        results = await asyncio.gather(
+            registry.submit(room.code, add_player("Kept")),
+            registry.submit(room.code, fail),
+            registry.submit(room.code, count_players),
+            return_exceptions=True,
+        )
+
+        assert results[0] == 2
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 2
+        assert await load_player_names(session, room.id) == ["Host", "Kept"]
+
+    async def test_failed_commit_fails_the_whole_batch(self, session, registry):
+        """Callers should never be told about changes that were not committed."""
+        room = await create_room(session)
+
+        async def break_commit(room: Room, session: AsyncSession):
+            async def fail():
+                del session.commit  # Only this batch fails
+                raise RuntimeError("commit failed")
+
+            session.commit = fail
+
+        results = await asyncio.gather(
+            registry.submit(room.code, add_player("Lost")),
+            registry.submit(room.code, break_commit),
+            return_exceptions=True,
+        )
+        count = await registry.submit(room.code, add_player("Kept"))
+
+        assert [str(result) for result in results] == ["commit failed"] * 2
+        assert count == 2
+        assert await load_player_names(session, room.id) == ["Host", "Kept"]
+
+    async def test_batch_sees_changes_from_other_writers(self, session, registry):
+        """Each batch should reload the room instead of trusting its old copy."""
+        room = await create_room(session)
+        await registry.submit(room.code, add_player("Guest"))
+
+        session.add(Player(name="Outside", is_host=False, room_id=room.id))
+        await session.commit()
+        count = await registry.submit(room.code, add_player("Late"))
+
+        assert count == 4
+
+    async def test_actor_exits_when_room_is_over(self, session, registry):
+        """The actor should stop once the room is no longer active."""
+        room = await create_room(session)
+
+        async def finish(room: Room, session: AsyncSession):
+            room.status = RoomStatus.FINISHED
+
+        actor_task = await registry.submit(room.code, current_task)
+        await registry.submit(room.code, finish)
+        await actor_task
+
+        assert registry.get(room.code) is None
+
+    async def test_actor_exits_when_idle(self, session, registry, monkeypatch):
+        """An actor without messages for the idle timeout should exit."""
+        monkeypatch.setattr(settings, "room_actor_idle_timeout", 0)
+        room = await create_room(session)
+
+        await registry.submit(room.code, add_player("Guest"))
+        actor_task = await registry.submit(room.code, current_task)
+        await actor_task
+
+        assert registry.get(room.code) is None
+        assert await load_player_names(session, room.id) == ["Host", "Guest"]
+
+    async def test_unknown_room_gets_none(self, session, registry):
+        """Handlers for a missing room should get None."""
+        async def get_room(room: Room | None, session: AsyncSession):
+            return room
+
+        assert await registry.submit("NOROOM", get_room) is None
@@ -1,12 +1,23 @@
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.jobs.room_cleanup import RoomCleanupJob
-from src.models import Room, RoomStatus
+from src.models import Room, RoomEvent, RoomStatus
+
+
+async def get_closed_events(session: AsyncSession, *rooms: Room) -> list[RoomEvent]:
+    """ROOM_CLOSED outbox events for the given rooms."""
+    result = await session.execute(
+        select(RoomEvent).where(
+            RoomEvent.event == "room_closed",
+            RoomEvent.room_code.in_([room.code for room in rooms]),
+        )
+    )
+    return list(result.scalars().all())
 
 
 class TestRoomCleanupJob:
@@ -27,9 +38,7 @@ class TestRoomCleanupJob:
         # Run the cleanup job
         job = RoomCleanupJob()
         with patch.object(job, "interval_seconds", 0):  # Skip interval for testing
-            with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-                mock_cm.broadcast_to_room = AsyncMock()
-                await job.execute(session)
+            await job.execute(session)
 
         await session.commit()
 
@@ -38,8 +47,9 @@ class TestRoomCleanupJob:
         updated_room = result.scalar_one()
         assert updated_room.status == RoomStatus.ABANDONED
 
-        # Verify broadcast was sent
-        mock_cm.broadcast_to_room.assert_called_once()
+        # Verify the ROOM_CLOSED event was queued
+        events = await get_closed_events(session, room)
+        assert [e.data for e in events] == [{"reason": "inactivity"}]
 
     async def test_closes_inactive_playing_room(self, session: AsyncSession):
         """Test that inactive PLAYING rooms are closed with ABANDONED status."""
@@ -52,9 +62,7 @@ class TestRoomCleanupJob:
         await session.commit()
 
         job = RoomCleanupJob()
-        with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-            mock_cm.broadcast_to_room = AsyncMock()
-            await job.execute(session)
+        await job.execute(session)
 
         await session.commit()
 
@@ -70,9 +78,7 @@ class TestRoomCleanupJob:
         await session.commit()
 
         job = RoomCleanupJob()
-        with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-            mock_cm.broadcast_to_room = AsyncMock()
-            await job.execute(session)
+        await job.execute(session)
 
         await session.commit()
 
@@ -80,8 +86,8 @@ class TestRoomCleanupJob:
         updated_room = result.scalar_one()
         assert updated_room.status == RoomStatus.WAITING  # Not changed
 
-        # Verify no broadcast was sent
-        mock_cm.broadcast_to_room.assert_not_called()
+        # Verify no event was queued
+        assert await get_closed_events(session, room) == []
 
     async def test_does_not_close_finished_room(self, session: AsyncSession):
         """Test that FINISHED rooms are not affected even if old."""
@@ -94,9 +100,7 @@ class TestRoomCleanupJob:
         await session.commit()
 
         job = RoomCleanupJob()
-        with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-            mock_cm.broadcast_to_room = AsyncMock()
-            await job.execute(session)
+        await job.execute(session)
 
         await session.commit()
 
@@ -115,9 +119,7 @@ class TestRoomCleanupJob:
         await session.commit()
 
         job = RoomCleanupJob()
-        with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-            mock_cm.broadcast_to_room = AsyncMock()
-            await job.execute(session)
+        await job.execute(session)
 
         await session.commit()
 
@@ -125,8 +127,8 @@ class TestRoomCleanupJob:
         updated_room = result.scalar_one()
         assert updated_room.status == RoomStatus.ABANDONED
 
-        # Verify no broadcast was sent
-        mock_cm.broadcast_to_room.assert_not_called()
+        # Verify no event was queued
+        assert await get_closed_events(session, room) == []
 
     async def test_closes_multiple_inactive_rooms(self, session: AsyncSession):
         """Test that multiple inactive rooms are closed in one execution."""
@@ -145,9 +147,7 @@ class TestRoomCleanupJob:
         await session.commit()
 
         job = RoomCleanupJob()
-        with patch("src.jobs.room_cleanup.connection_manager") as mock_cm:
-            mock_cm.broadcast_to_room = AsyncMock()
-            await job.execute(session)
+        await job.execute(session)
 
         await session.commit()
 
@@ -162,8 +162,40 @@ class TestRoomCleanupJob:
         result = await session.execute(select(Room).where(Room.id == room3.id))
         assert result.scalar_one().status == RoomStatus.WAITING
 
-        # Verify two broadcasts were sent
-        assert mock_cm.broadcast_to_room.call_count == 2
+        # Verify two events were queued
+        assert len(await get_closed_events(session, room1, room2, room3)) == 2
+
+    async def test_closes_rooms_in_chunks_with_their_events(
+        self, session: AsyncSession
+    ):
+        """Test that each chunk is committed together with its rooms' events."""
+        old_time = datetime.now(timezone.utc) - timedelta(hours=25)
+        rooms = [Room(status=RoomStatus.WAITING) for _ in range(3)]
+        session.add_all(rooms)
+        await session.flush()
+        for room in rooms:
+            room.updated_at = old_time
+        await session.commit()
+
+        pending_at_commit = []
+        original_commit = session.commit
+
+        async def commit():
+            pending_at_commit.append(
+                sum(isinstance(obj, RoomEvent) for obj in session.new)
+            )
+            await original_commit()
+
+        job = RoomCleanupJob()
+        job.chunk_size = 2
+        with patch.object(session, "commit", side_effect=commit):
+            await job.execute(session)
+
+        # Two chunks: 2 rooms, then 1 room, each committed with its events
+        assert pending_at_commit == [2, 1]
+        assert len(await get_closed_events(session, *rooms)) == 3
+        for room in rooms:
+            assert room.status == RoomStatus.ABANDONED
 
     async def test_job_has_correct_configuration(self):
         """Test that the job has the correct lock_id and name."""
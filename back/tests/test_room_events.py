@@ -0,0 +1,160 @@
+"""Tests for the room_events outbox and its dispatcher."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.jobs.room_event_prune import RoomEventPruneJob
+from src.models import RoomEvent
+from src.services.room_events import RoomEventDispatcher, add_room_event
+
+
+class FakeConnectionManager:
+    """Records broadcasts for rooms that have connected clients."""
+
+    def __init__(self, room_codes: list[str]):
+        self.connections = {room_code: {} for room_code in room_codes}
+        self.sent: list[tuple] = []
+
+    async def broadcast_to_room(self, room_code, event, data, exclude_player_id=None):
+        self.sent.append((room_code, event, data, exclude_player_id))
+
+
+class TestRoomEventDispatcher:
+    """Tests for RoomEventDispatcher."""
+
+    @pytest.fixture
+    def dispatcher(self, session, monkeypatch):
+        # Dispatcher sessions see the test's uncommitted rows
+        maker = async_sessionmaker(
+            bind=session.bind,
+            class_=AsyncSession,
+            join_transaction_mode="create_savepoint",
+        )
+        monkeypatch.setattr("src.services.room_events.async_session_maker", maker)
+        return RoomEventDispatcher()
+
+    async def test_starts_after_existing_events(self, session, dispatcher):
+        """Events from before startup should not be replayed."""
+        manager = FakeConnectionManager(["ROOM01"])
+        dispatcher.set_connection_manager(manager)
+        add_room_event(session, "ROOM01", "old", {})
+        await session.flush()
+
+        assert await dispatcher.dispatch_batch() == 0
+        assert await dispatcher.dispatch_batch() == 0
+        assert manager.sent == []
+
+    async def test_sends_events_in_order_per_room(self, session, dispatcher):
+        """Each connected room should get its events in commit order."""
+        manager = FakeConnectionManager(["ROOM01", "ROOM02"])
+        dispatcher.set_connection_manager(manager)
+        await dispatcher.dispatch_batch()
+
+        add_room_event(session, "ROOM01", "first", {"n": 1})
+        add_room_event(session, "ROOM02", "other", {})
+        add_room_event(session, "ROOM01", "second", {"n": 2}, exclude_player_id=7)
+        add_room_event(session, "NOBODY", "unheard", {})
+        await session.flush()
+
+        assert await dispatcher.dispatch_batch() == 4
+
+        room_events = [sent for sent in manager.sent if sent[0] == "ROOM01"]
+        assert room_events == [
+            ("ROOM01", "first", {"n": 1}, None),
+            ("ROOM01", "second", {"n": 2}, 7),
+        ]
+        assert [sent[1] for sent in manager.sent if sent[0] != "ROOM01"] == ["other"]
+
+    async def test_late_event_in_gap_is_delivered_first(self, session, dispatcher):
+        """An id that commits after a larger one should still be sent, and first."""
+        manager = FakeConnectionManager(["ROOM01"])
+        dispatcher.set_connection_manager(manager)
+        await dispatcher.dispatch_batch()
+
+        slow = add_room_event(session, "ROOM01", "slow", {})
+        add_room_event(session, "ROOM01", "fast", {})
+        await session.flush()
+        slow_id = slow.id
+        # The slow transaction has not committed yet
+        await session.execute(delete(RoomEvent).where(RoomEvent.id == slow_id))
+
+        await dispatcher.dispatch_batch()
+        assert manager.sent == []  # Held back behind the missing id
+
+        session.add(RoomEvent(id=slow_id, room_code="ROOM01", event="slow", data={}))
+        await session.flush()
+
+        await dispatcher.dispatch_batch()
+        assert [sent[1] for sent in manager.sent] == ["slow", "fast"]
+        assert slow_id not in dispatcher._gaps
+
+    async def test_gap_is_given_up_after_timeout(self, session, dispatcher):
+        """Ids of rolled back transactions should not hold events back forever."""
+        manager = FakeConnectionManager(["ROOM01"])
+        dispatcher.set_connection_manager(manager)
+        dispatcher._gap_timeout = 0
+        await dispatcher.dispatch_batch()
+
+        rolled_back = add_room_event(session, "ROOM01", "rolled_back", {})
+        add_room_event(session, "ROOM01", "kept", {})
+        await session.flush()
+        await session.execute(delete(RoomEvent).where(RoomEvent.id == rolled_back.id))
+
+        await dispatcher.dispatch_batch()  # Gap found and given up
+        await dispatcher.dispatch_batch()
+
+        assert dispatcher._gaps == {}
+        assert [sent[1] for sent in manager.sent] == ["kept"]
+
+    async def test_server_time_is_stamped_when_sent(self, session, dispatcher):
+        """server_time should be the send time, not the time the event was written."""
+        manager = FakeConnectionManager(["ROOM01"])
+        dispatcher.set_connection_manager(manager)
+        await dispatcher.dispatch_batch()
+
+        written_at = "2000-01-01T00:00:00+00:00"
+        add_room_event(
+            session,
+            "ROOM01",
+            "round_finished",
+            {"server_time": written_at, "room": {"code": "ROOM01", "server_time": written_at}},
+        )
+        await session.flush()
+
+        await dispatcher.dispatch_batch()
+
+        (_, _, data, _), = manager.sent
+        assert data["server_time"] != written_at
+        assert data["room"]["server_time"] == data["server_time"]
+
+
+class TestRoomEventPruneJob:
+    """Tests for RoomEventPruneJob."""
+
+    async def test_deletes_only_expired_events(self, session: AsyncSession):
+        """Events older than the retention period should be deleted in chunks."""
+        old_time = datetime.now(timezone.utc) - timedelta(days=1)
+        expired = [add_room_event(session, "ROOM01", "old", {}) for _ in range(3)]
+        recent = add_room_event(session, "ROOM01", "new", {})
+        await session.flush()
+        for room_event in expired:
+            room_event.created_at = old_time
+        await session.commit()
+
+        job = RoomEventPruneJob()
+        job.chunk_size = 2
+        await job.execute(session)
+
+        result = await session.execute(
+            select(RoomEvent.id).where(RoomEvent.room_code == "ROOM01")
+        )
+        assert result.scalars().all() == [recent.id]
+
+    async def test_job_has_correct_configuration(self):
+        """Test that the job has the correct lock_id and name."""
+        job = RoomEventPruneJob()
+        assert job.lock_id == 1003
+        assert job.job_name == "RoomEventPruneJob"
@@ -0,0 +1,84 @@
+"""Tests for the single-flight room loader."""
+
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.services.room_loader import RoomLoader
+from src.services.room_service import RoomService
+
+
+@pytest.fixture
+def sessions_opened(session, monkeypatch) -> list[AsyncSession]:
+    """Run the loader's queries on the test connection and record each session."""
+    maker = async_sessionmaker(
+        bind=session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    opened = []
+
+    @asynccontextmanager
+    async def session_context():
+        async with maker() as loader_session:
+            opened.append(loader_session)
+            yield loader_session
+
+    monkeypatch.setattr(
+        importlib.import_module("src.services.room_loader"), "get_session_context", session_context
+    )
+    return opened
+
+
+class TestRoomLoader:
+    """Tests for RoomLoader."""
+
+    async def test_concurrent_loads_share_one_query(self, session, sessions_opened):
+        """Callers asking for the same room at once should share one fetch."""
+        room, _ = await RoomService(session).create_room("Host")
+        await session.commit()
+        loader = RoomLoader()
+
+        states = await asyncio.gather(*(loader.load(room.code) for _ in range(5)))
+
+        assert len(sessions_opened) == 1
+        assert all(state is states[0] for state in states)
+        assert states[0]["code"] == room.code
+        assert states[0]["players"][0]["name"] == "Host"
+
+    async def test_later_load_fetches_again(self, session, sessions_opened):
+        """Results should not be kept once the fetch is done."""
+        room, _ = await RoomService(session).create_room("Host")
+        await session.commit()
+        loader = RoomLoader()
+
+        await loader.load(room.code)
+        await RoomService(session).join_room(room.code, "Player2")
+        await session.commit()
+        state = await loader.load(room.code)
+
+        assert len(sessions_opened) == 2
+        assert [p["name"] for p in state["players"]] == ["Host", "Player2"]
+
+    async def test_cancelled_caller_does_not_cancel_the_fetch(self, session, sessions_opened):
+        """Other callers should still get the room if the first one goes away."""
+        room, _ = await RoomService(session).create_room("Host")
+        await session.commit()
+        loader = RoomLoader()
+
+        first = asyncio.create_task(loader.load(room.code))
+        second = asyncio.create_task(loader.load(room.code))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        state = await second
+        assert state["code"] == room.code
+        assert len(sessions_opened) == 1
+
+    async def test_unknown_room_is_none(self, session, sessions_opened):
+        """Missing rooms should load as None."""
+        assert await RoomLoader().load("NOROOM") is None
@@ -1,7 +1,8 @@
 import pytest
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import RoomStatus, RoundStatus
+from src.models import GameRound, RoomStatus, RoundStatus
 from src.services.room_service import RoomService
 
 
@@ -110,3 +111,67 @@ class TestRoomService:
         assert host_result["points_earned"] == 10
         assert host_result["distance"] == 0
 
+
+    async def test_finish_round_ranks_players(self, session: AsyncSession):
+        """Test points by rank: 10/5/3, then 1 per guess, 0 without a guess."""
+        service = RoomService(session)
+        room, host = await service.create_room("Host")
+        players = [host]
+        for i in range(4):
+            room, player = await service.join_room(room.code, f"Player{i}")
+            players.append(player)
+        await service.start_game(room, host.id)
+
+        target = room.rounds[0].target_number
+        for distance, player in enumerate(players[:4]):
+            await service.submit_guess(room, player.id, target + distance)
+
+        results = await service.finish_round(room)
+
+        assert [r["player_id"] for r in results] == [p.id for p in players]
+        assert [r["points_earned"] for r in results] == [10, 5, 3, 1, 0]
+        assert [r["distance"] for r in results] == [0, 1, 2, 3, None]
+        assert [p.score for p in players] == [10, 5, 3, 1, 0]
+
+    async def test_finish_round_twice_scores_once(self, session: AsyncSession):
+        """Test that a round already finished elsewhere is not scored again."""
+        service = RoomService(session)
+        room, host = await service.create_room("Host")
+        room, player2 = await service.join_room(room.code, "Player2")
+        await service.start_game(room, host.id)
+        await service.submit_guess(room, host.id, 50)
+        await service.submit_guess(room, player2.id, 60)
+
+        first = await service.finish_round(room)
+        scores = sorted(p.score for p in room.players)
+
+        # Simulate a concurrent finisher that still sees the round as active
+        current_round = room.rounds[0]
+        current_round.status = RoundStatus.ACTIVE
+        await session.execute(
+            update(GameRound)
+            .where(GameRound.id == current_round.id)
+            .values(status=RoundStatus.FINISHED)
+            .execution_options(synchronize_session=False)
+        )
+        second = await service.finish_round(room)
+
+        assert len(first) == 2
+        assert second is None
+        assert sorted(p.score for p in room.players) == scores
+
+    async def test_get_room_loads_only_current_round(self, session: AsyncSession):
+        """Rooms should be loaded with their players and just the current round."""
+        service = RoomService(session)
+        room, host = await service.create_room("Host")
+        await service.join_room(room.code, "Player2")
+        await service.start_game(room, host.id)
+        await service.finish_round(room)
+        await service.start_next_round(room)
+        await session.commit()
+        session.expunge_all()
+
+        room = await service.get_room_by_code(room.code)
+
+        assert [r.round_number for r in room.rounds] == [2]
+        assert [p.name for p in room.players] == ["Host", "Player2"]
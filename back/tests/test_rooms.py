@@ -81,6 +81,19 @@ class TestGetRoom:
         assert get_response.status_code == 200
         assert get_response.json()["code"] == room_code
 
+    async def test_get_room_etag(self, client: AsyncClient):
+        """A matching If-None-Match should get 304."""
+        create_response = await client.post("/api/rooms", json={"player_name": "Host"})
+        room_code = create_response.json()["room"]["code"]
+
+        first = await client.get(f"/api/rooms/{room_code}")
+        second = await client.get(
+            f"/api/rooms/{room_code}", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+
     async def test_get_nonexistent_room(self, client: AsyncClient):
         """Test getting a room that doesn't exist."""
         response = await client.get("/api/rooms/XXXXXX")
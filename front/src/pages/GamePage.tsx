@@ -6,23 +6,34 @@ export const GamePage = observer(() => {
   const { room, currentPlayer, lastRoundResult } = gameStore
   const [guess, setGuess] = useState('')
   const [timeLeft, setTimeLeft] = useState(30)
+  const [nextRoundIn, setNextRoundIn] = useState(0)
   const [isSubmitting, setIsSubmitting] = useState(false)
 
   // Timer countdown
   useEffect(() => {
-    if (!room?.current_round?.started_at) return
+    if (!room?.current_round?.ends_at) return
 
     const updateTimer = () => {
-      const startedAt = new Date(room.current_round!.started_at).getTime()
-      const elapsed = (Date.now() - startedAt) / 1000
-      const remaining = Math.max(0, 30 - elapsed)
-      setTimeLeft(Math.ceil(remaining))
+      setTimeLeft(gameStore.timeRemaining)
     }
 
     updateTimer()
     const interval = setInterval(updateTimer, 100)
     return () => clearInterval(interval)
-  }, [room?.current_round?.started_at])
+  }, [room?.current_round?.ends_at])
+
+  // Countdown to the next round
+  useEffect(() => {
+    if (!room?.current_round?.next_round_at) return
+
+    const updateTimer = () => {
+      setNextRoundIn(gameStore.timeUntilNextRound)
+    }
+
+    updateTimer()
+    const interval = setInterval(updateTimer, 100)
+    return () => clearInterval(interval)
+  }, [room?.current_round?.next_round_at])
 
   // Reset guess when new round starts
   useEffect(() => {
@@ -79,7 +90,11 @@ export const GamePage = observer(() => {
               <div className="text-4xl font-bold text-electric text-center">
                 Round Complete!
               </div>
-              <p className="text-center text-ash mt-2">Next round starting soon...</p>
+              <p className="text-center text-ash mt-2">
+                {room.current_round?.next_round_at && nextRoundIn > 0
+                  ? `Next round in ${nextRoundIn}s`
+                  : 'Next round starting soon...'}
+              </p>
             </>
           ) : (
             <>
@@ -1,6 +1,6 @@
 import { makeAutoObservable, runInAction } from 'mobx'
 import { api } from '@/api/client'
-import type { Room, Player, RoundResult, FinalStanding, GameType } from '@/types'
+import type { Room, Player, RoundResult, RoundStarted, FinalStanding, GameType } from '@/types'
 import { wsClient } from '@/api/websocket'
 
 export type GameStatus = 'idle' | 'loading' | 'connected' | 'error'
@@ -17,6 +17,9 @@ class GameStore {
   // Final standings (shown after game ends)
   finalStandings: FinalStanding[] = []
 
+  // Server clock minus local clock (ms), used to render countdowns locally
+  clockOffset = 0
+
   constructor() {
     makeAutoObservable(this)
   }
@@ -39,10 +42,16 @@ class GameStore {
   }
 
   get timeRemaining(): number {
-    if (!this.room?.current_round?.started_at) return 0
-    const startedAt = new Date(this.room.current_round.started_at).getTime()
-    const elapsed = (Date.now() - startedAt) / 1000
-    const remaining = Math.max(0, 30 - elapsed) // 30 seconds per round
+    if (!this.room?.current_round?.ends_at) return 0
+    const endsAt = new Date(this.room.current_round.ends_at).getTime()
+    const remaining = Math.max(0, (endsAt - (Date.now() + this.clockOffset)) / 1000)
+    return Math.ceil(remaining)
+  }
+
+  get timeUntilNextRound(): number {
+    if (!this.room?.current_round?.next_round_at) return 0
+    const nextRoundAt = new Date(this.room.current_round.next_round_at).getTime()
+    const remaining = Math.max(0, (nextRoundAt - (Date.now() + this.clockOffset)) / 1000)
     return Math.ceil(remaining)
   }
 
@@ -58,6 +67,7 @@ class GameStore {
       const response = await api.createRoom(playerName, gameType)
       runInAction(() => {
         this.room = response.room
+        this.syncClock(response.room.server_time)
         this.playerId = response.player_id
         this.setStatus('connected')
       })
@@ -78,6 +88,7 @@ class GameStore {
       const response = await api.joinRoom(code, playerName, gameType)
       runInAction(() => {
         this.room = response.room
+        this.syncClock(response.room.server_time)
         this.playerId = response.player_id
         this.setStatus('connected')
       })
@@ -98,6 +109,7 @@ class GameStore {
       if (result.room) {
         runInAction(() => {
           this.room = result.room
+          this.syncClock(result.room.server_time)
           this.lastRoundResult = null
         })
       }
@@ -118,6 +130,7 @@ class GameStore {
       if (result.room) {
         runInAction(() => {
           this.room = result.room
+          this.syncClock(result.room.server_time)
         })
       }
       // Request updated state via WebSocket
@@ -140,6 +153,7 @@ class GameStore {
       if (result.room) {
         runInAction(() => {
           this.room = result.room
+          this.syncClock(result.room.server_time)
         })
       }
       this.requestState()
@@ -174,10 +188,11 @@ class GameStore {
       case 'room_state':
         // Main state update handler - used by GamesStorage broadcasts
         runInAction(() => {
-          const d = data as { room: Room }
+          const d = data as { room: Room; server_time?: string }
           if (d.room) {
             this.room = d.room
           }
+          this.syncClock(d.server_time)
         })
         break
 
@@ -194,23 +209,57 @@ class GameStore {
           const d = data as { room: Room }
           if (d.room) {
             this.room = d.room
+            this.syncClock(d.room.server_time)
           }
           this.lastRoundResult = null
         })
         break
 
       case 'round_started':
+        // The event carries the new deadline, no need to ask for the state
         runInAction(() => {
+          const d = data as RoundStarted
           this.lastRoundResult = null
+          this.syncClock(d.server_time)
+          if (!this.room) return
+          this.room.current_round_number = d.round_number
+          this.room.current_round = {
+            id: this.room.current_round?.id ?? 0,
+            round_number: d.round_number,
+            target_number: null,
+            status: 'active',
+            started_at: d.started_at,
+            finished_at: null,
+            ends_at: d.ends_at,
+            next_round_at: null,
+          }
+          this.room.players.forEach(p => {
+            p.current_guess = null
+          })
         })
-        this.requestState()
         break
 
       case 'round_finished':
         runInAction(() => {
-          this.lastRoundResult = data as RoundResult
+          const d = data as RoundResult
+          this.lastRoundResult = d
+          this.syncClock(d.server_time)
+          if (d.room) {
+            // Sent by the last guess, with the full room
+            this.room = d.room
+            return
+          }
+          if (!this.room) return
+          if (this.room.current_round) {
+            this.room.current_round.status = 'finished'
+            this.room.current_round.target_number = d.target_number
+            this.room.current_round.next_round_at = d.next_round_at ?? null
+          }
+          d.results.forEach(result => {
+            const player = this.room?.players.find(p => p.id === result.player_id)
+            if (player) player.score += result.points_earned
+          })
         })
-        this.requestState()
         break
 
       case 'game_finished':
@@ -229,6 +278,11 @@ class GameStore {
     }
   }
 
+  private syncClock(serverTime?: string | null): void {
+    if (!serverTime) return
+    this.clockOffset = new Date(serverTime).getTime() - Date.now()
+  }
+
   private setStatus(status: GameStatus): void {
     this.gameStatus = status
   }
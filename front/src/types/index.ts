@@ -20,6 +20,8 @@ export interface GameRound {
   status: RoundStatus
   started_at: string
   finished_at: string | null
+  ends_at: string | null
+  next_round_at: string | null
 }
 
 export interface Room {
@@ -33,6 +35,7 @@ export interface Room {
   updated_at: string
   players: Player[]
   current_round: GameRound | null
+  server_time?: string | null
 }
 
 export interface CreateRoomResponse {
@@ -64,6 +67,16 @@ export interface RoundResult {
   round_number: number
   target_number: number
   results: RoundResultPlayer[]
+  next_round_at?: string | null
+  server_time?: string
+  room?: Room
+}
+
+export interface RoundStarted {
+  round_number: number
+  started_at: string
+  ends_at: string
+  server_time?: string
 }
 
 export interface FinalStanding {